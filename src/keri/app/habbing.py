@@ -393,12 +393,12 @@ class Habitat:
             raise ValueError("Attempt by {} to witness event with missing key "
                              "state.".format(self.pre))
         kever = self.kevers[serder.pre]
-        if self.pre not in kever.wits:
+        index = kever.witIndex(self.pre)
+        if index is None:
             raise ValueError("Attempt by {} to witness event of {} when not a "
                              "witness in wits={}.".format(self.pre,
                                                           serder.pre,
                                                           kever.wits))
-        index = kever.wits.index(self.pre)
 
         reserder = eventing.receipt(pre=ked["i"],
                                     sn=int(ked["s"], 16),
@@ -7,7 +7,7 @@ import re
 import json
 import copy
 
-from dataclasses import dataclass, astuple
+from dataclasses import dataclass
 from collections import namedtuple, deque
 from base64 import urlsafe_b64encode as encodeB64
 from base64 import urlsafe_b64decode as decodeB64
@@ -265,7 +265,8 @@ class CryNonTransCodex:
     Ed448N:        str = "1AAC"  # Ed448 non-transferable prefix public signing verification key. Basic derivation.
 
     def __iter__(self):
-        return iter(astuple(self))
+        # field values in order, astuple would deepcopy them on every "in" test
+        return iter(self.__dict__.values())
 
 CryNonTransDex = CryNonTransCodex()  #  Make instance
 
@@ -286,7 +287,7 @@ class CryDigCodex:
     SHA2_256:             str = 'I'  #  SHA2 256 bit digest self-addressing derivation.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 CryDigDex = CryDigCodex()  #  Make instance
 
@@ -336,7 +337,7 @@ class MatterCodex:
 
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 MtrDex = MatterCodex()
 
@@ -352,7 +353,7 @@ class NonTransCodex:
     Ed448N:        str = "1AAC"  # Ed448 non-transferable prefix public signing verification key. Basic derivation.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 NonTransDex = NonTransCodex()  #  Make instance
 
@@ -377,7 +378,7 @@ class DigCodex:
     SHA2_512:             str = '0G'  # SHA2 512 bit digest self-addressing derivation.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 DigDex =DigCodex()  #  Make instance
 
@@ -411,11 +412,13 @@ class Matter:
     Hidden:
         ._code is str value for .code property
         ._raw is bytes value for .raw property
+        ._qb64b is memoized .qb64b or None
         ._infil is method to compute fully qualified Base64 from .raw and .code
         ._exfil is method to extract .code and .raw from fully qualified Base64
 
     """
     Codex = MtrDex
+    _qb64b = None  # memoized .qb64b computed on first access
     # Sizes table maps from bytes Base64 first code char to int of hard size, hs,
     # (stable) of code. The soft size, ss, (unstable) is always 0 for Matter
     # unless fs is None which allows for variable size multiple of 4, i.e.
@@ -462,6 +465,10 @@ class Matter:
     # Bizes table maps to hard size, hs, of code from bytes holding sextets
     # converted from first code char. Used for ._bexfil.
     Bizes = ({b64ToB2(c): hs for c, hs in Sizes.items()})
+    # Hards table maps first byte of Base64 code to hard size, hs, of code or
+    # None when unsupported. Indexed by int byte so ._exfil of bytes need not
+    # slice and decode first char. Used for ._exfil.
+    Hards = tuple(map(Sizes.get, map(chr, range(256))))
 
 
     def __init__(self, raw=None, code=MtrDex.Ed25519N, size=None,
@@ -601,6 +608,15 @@ class Matter:
         return self._size
 
 
+    @property
+    def fullSize(self):
+        """
+        Returns full size in chars of .qb64b computed from .code and .size
+        Cheaper than len(.qb64b) since no Base64 encode
+        """
+        return self._fullSize()
+
+
     @property
     def raw(self):
         """
@@ -616,8 +632,11 @@ class Matter:
         Property qb64b:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
+        Memoized since .raw and .code are read only
         """
-        return self._infil()
+        if self._qb64b is None:
+            self._qb64b = self._infil()
+        return self._qb64b
 
 
     @property
@@ -700,9 +719,13 @@ class Matter:
             raise ShortageError("Empty material, Need more characters.")
 
         first = qb64b[:1]  # extract first char code selector
-        if hasattr(first, "decode"):
-            first = first.decode("utf-8")
-        if first not in self.Sizes:
+        if hasattr(first, "decode"):  # bytes so index first byte no decode
+            cs = self.Hards[first[0]]
+        else:
+            cs = self.Sizes.get(first)
+        if cs is None:  # unsupported first char
+            if hasattr(first, "decode"):
+                first = first.decode("utf-8")
             if first[0] == '-':
                 raise UnexpectedCountCodeError("Unexpected count code start"
                                                "while extracing Matter.")
@@ -712,7 +735,7 @@ class Matter:
             else:
                 raise UnexpectedCodeError("Unsupported code start char={}.".format(first))
 
-        cs = self.Sizes[first]  # get hard code size
+        # cs is hard code size
         if len(qb64b) < cs:  # need more bytes
             raise ShortageError("Need {} more characters.".format(cs-len(qb64b)))
 
@@ -903,12 +926,16 @@ class Seqner(Matter):
         ._index is int value for .index property
         ._infil is method to compute fully qualified Base64 from .raw and .code
         ._exfil is method to extract .code and .raw from fully qualified Base64
+        ._sn is memoized .sn or None
 
 
     Methods:
 
 
     """
+    _sn = None  # memoized .sn computed on first access
+    RawSize = Matter._rawSize(MtrDex.Salt_128)  # raw size of default code
+
     def __init__(self, raw=None, qb64b=None, qb64=None, qb2=None,
                  code=MtrDex.Salt_128, sn=None, snh=None, **kwa):
         """
@@ -933,7 +960,8 @@ class Seqner(Matter):
                 sn = int(snh, 16)
 
         if raw is None and qb64b is None and qb64 is None and qb2 is None:
-            raw = sn.to_bytes(Matter._rawSize(MtrDex.Salt_128), 'big')
+            raw = sn.to_bytes(self.RawSize, 'big')
+            self._sn = sn  # raw made from sn so no need to convert back
 
         super(Seqner, self).__init__(raw=raw, qb64b=qb64b, qb64=qb64, qb2=qb2,
                                          code=code, **kwa)
@@ -947,8 +975,11 @@ class Seqner(Matter):
         """
         Property sn:
         Returns .raw converted to int
+        Memoized since .raw does not change after init
         """
-        return int.from_bytes(self.raw, 'big')
+        if self._sn is None:
+            self._sn = int.from_bytes(self._raw, 'big')
+        return self._sn
 
     @property
     def snh(self):
@@ -2047,7 +2078,7 @@ class IndexerCodex:
     Label:              str = '0B'  # Variable len label L=N*4 <= 4095 char quadlets
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 IdrDex = IndexerCodex()
 
@@ -2064,7 +2095,7 @@ class IndexedSigCodex:
     Ed448_Sig:          str = '0A'  # Ed448 signature.
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 IdxSigDex = IndexedSigCodex()  #  Make instance
 
@@ -2094,11 +2125,13 @@ class Indexer:
         ._raw is bytes value for .raw property
         ._pad is method to compute  .pad property
         ._index is int value for .index property
+        ._qb64b is memoized .qb64b or None
         ._infil is method to compute fully qualified Base64 from .raw and .code
         ._exfil is method to extract .code and .raw from fully qualified Base64
 
     """
     Codex = IdrDex
+    _qb64b = None  # memoized .qb64b computed on first access
     # Sizes table maps from bytes Base64 first code char to int of hard size, hs,
     # (stable) of code. The soft size, ss, (unstable) is always > 0 for Indexer.
     Sizes = ({chr(c): 1 for c in range(65, 65+26)})
@@ -2116,6 +2149,10 @@ class Indexer:
     # Bizes table maps to hard size, hs, of code from bytes holding sextets
     # converted from first code char. Used for ._bexfil.
     Bizes = ({b64ToB2(c): hs for c, hs in Sizes.items()})
+    # Hards table maps first byte of Base64 code to hard size, hs, of code or
+    # None when unsupported. Indexed by int byte so ._exfil of bytes need not
+    # slice and decode first char. Used for ._exfil.
+    Hards = tuple(map(Sizes.get, map(chr, range(256))))
 
     def __init__(self, raw=None, code=IdrDex.Ed25519_Sig, index=0,
                  qb64b=None, qb64=None, qb2=None, strip=False):
@@ -2232,8 +2269,11 @@ class Indexer:
         Property qb64b:
         Returns Fully Qualified Base64 Version encoded as bytes
         Assumes self.raw and self.code are correctly populated
+        Memoized since .raw and .code are read only
         """
-        return self._infil()
+        if self._qb64b is None:
+            self._qb64b = self._infil()
+        return self._qb64b
 
 
     @property
@@ -2290,9 +2330,13 @@ class Indexer:
             raise ShortageError("Empty material, Need more characters.")
 
         first = qb64b[:1]  # extract first char code selector
-        if hasattr(first, "decode"):
-            first = first.decode("utf-8")
-        if first not in self.Sizes:
+        if hasattr(first, "decode"):  # bytes so index first byte no decode
+            cs = self.Hards[first[0]]
+        else:
+            cs = self.Sizes.get(first)
+        if cs is None:  # unsupported first char
+            if hasattr(first, "decode"):
+                first = first.decode("utf-8")
             if first[0] == '-':
                 raise UnexpectedCountCodeError("Unexpected count code start"
                                                "while extracing Indexer.")
@@ -2302,7 +2346,7 @@ class Indexer:
             else:
                 raise UnexpectedCodeError("Unsupported code start char={}.".format(first))
 
-        cs = self.Sizes[first]  # get hard code size
+        # cs is hard code size
         if len(qb64b) < cs:  # need more bytes
             raise ShortageError("Need {} more characters.".format(cs-len(qb64b)))
 
@@ -2539,7 +2583,7 @@ class CounterCodex:
 
 
     def __iter__(self):
-        return iter(astuple(self))  # enables inclusion test with "in"
+        return iter(self.__dict__.values())  # enables inclusion test with "in"
 
 CtrDex = CounterCodex()
 
@@ -2890,7 +2934,12 @@ class Serder:
           ._version is Versionage instance of event version
           ._size is int of number of bytes in serialed event only
           ._code is default code for .diger
-          ._diger is Diger instance of digest of .raw
+          ._diger is memoized Diger instance of digest of .raw or None
+          ._dig is memoized .dig or None
+          ._digb is memoized .digb or None
+          ._preb is memoized .preb or None
+          ._sn is memoized .sn or None
+          ._verfers is memoized .verfers or None
 
     Note:
         loads and jumps of json use str whereas cbor and msgpack use bytes
@@ -3072,10 +3121,29 @@ class Serder:
           as digest of ser
         Else If both have same code but do not match then as optimization returns False
            and does not verify if either is digest of ser
-        Else recalcs both digests using each one's code to verify they
-            they are both digests of ser regardless of matching codes.
+        Else recalcs other digest using its code to verify it is also digest
+            of self.raw. Own .diger is digest of self.raw by construction so
+            is not recalculated.
         """
-        return (self.diger.compare(ser=self.raw, dig=dig, diger=diger))
+        if dig is not None:  # match memoized own dig without building a Diger
+            if dig == (self.dig if hasattr(dig, "encode") else self.digb):
+                return True
+            if hasattr(dig, "encode"):
+                dig = dig.encode('utf-8')  #  makes bytes
+            diger = Diger(qb64b=dig)  # extract code
+
+        elif diger is not None:
+            if diger.qb64b == self.digb:
+                return True
+
+        else:
+            raise ValueError("Both dig and diger may not be None.")
+
+        if diger.code == self.diger.code:  # digest not match but same code
+            return False
+
+        # own .diger is digest of .raw by construction so only verify other
+        return (diger.verify(ser=self.raw))
 
 
     @property
@@ -3087,13 +3155,16 @@ class Serder:
     @raw.setter
     def raw(self, raw):
         """ raw property setter """
+        if isinstance(raw, memoryview):  # db buffer must not escape its txn
+            raw = bytes(raw)
         ked, kind, version, size = self._inhale(raw=raw)
         self._raw = bytes(raw[:size])  # crypto ops require bytes not bytearray
         self._ked = ked
         self._kind = kind
         self._version = version
         self._size = size
-        self._diger = Diger(ser=self._raw, code=self._code)
+        self._diger = self._dig = self._digb = self._preb = self._sn = None  # reset memoized
+        self._verfers = None  # reset memoized
 
 
     @property
@@ -3112,7 +3183,8 @@ class Serder:
         self._kind = kind
         self._size = size
         self._version = version
-        self._diger = Diger(ser=self._raw, code=self._code)
+        self._diger = self._dig = self._digb = self._preb = self._sn = None  # reset memoized
+        self._verfers = None  # reset memoized
 
 
     @property
@@ -3131,7 +3203,8 @@ class Serder:
         self._kind = kind
         self._size = size
         self._version = version
-        self._diger = Diger(ser=self._raw, code=self._code)
+        self._diger = self._dig = self._digb = self._preb = self._sn = None  # reset memoized
+        self._verfers = None  # reset memoized
 
 
     @property
@@ -3151,7 +3224,11 @@ class Serder:
         """
         Returns Diger of digest of self.raw
         diger (digest material) property getter
+        Computed on first access so events whose digest is never needed, such
+        as reparsed escrowed events whose digest is their db key, skip hashing
         """
+        if self._diger is None:
+            self._diger = Diger(ser=self._raw, code=self._code)
         return self._diger
 
 
@@ -3160,8 +3237,11 @@ class Serder:
         """
         Returns qualified Base64 digest of self.raw
         dig (digest) property getter
+        Memoized since .diger only changes when raw, ked, or kind is set
         """
-        return self.diger.qb64
+        if self._dig is None:
+            self._dig = self.digb.decode("utf-8")
+        return self._dig
 
 
     @property
@@ -3169,8 +3249,11 @@ class Serder:
         """
         Returns qualified Base64 digest of self.raw
         dig (digest) property getter
+        Memoized since .diger only changes when raw, ked, or kind is set
         """
-        return self.diger.qb64b
+        if self._digb is None:
+            self._digb = self.diger.qb64b
+        return self._digb
 
 
     @property
@@ -3179,13 +3262,17 @@ class Serder:
         Returns list of Verfer instances as converted from .ked['k'].
         One for each key.
         verfers property getter
+        Memoized since escrowed and receipted events are verified against
+        their keys on every escrow pass. Callers must not modify the list.
         """
-        if "k" in self.ked:  # establishment event
-            keys = self.ked["k"]
-        else:  # non-establishment event
-            keys =  []
+        if self._verfers is None:
+            if "k" in self.ked:  # establishment event
+                keys = self.ked["k"]
+            else:  # non-establishment event
+                keys =  []
+            self._verfers = [Verfer(qb64=key) for key in keys]
 
-        return [Verfer(qb64=key) for key in keys]
+        return self._verfers
 
 
     @property
@@ -3208,8 +3295,11 @@ class Serder:
         """
         Returns int of .ked["s"] (sequence number)
         sn (sequence number) property getter
+        Memoized since .ked only changes when raw, ked, or kind is set
         """
-        return int(self.ked["s"], 16)
+        if self._sn is None:
+            self._sn = int(self.ked["s"], 16)
+        return self._sn
 
 
     @property
@@ -3226,8 +3316,11 @@ class Serder:
         """
         Returns bytes qb64b  of .ked["i"] (identifier prefix)
         preb (identifier prefix) property getter
+        Memoized since .ked only changes when raw, ked, or kind is set
         """
-        return self.pre.encode("utf-8")
+        if self._preb is None:
+            self._preb = self.pre.encode("utf-8")
+        return self._preb
 
     def pretty(self):
         """
@@ -4,10 +4,10 @@ keri.core.eventing module
 
 """
 import datetime
-import json
+import functools
 import logging
-from collections import namedtuple, deque
-from dataclasses import dataclass, astuple
+from collections import namedtuple, deque, OrderedDict
+from dataclasses import dataclass
 from math import ceil
 
 from orderedset import OrderedSet as oset
@@ -59,7 +59,7 @@ class TraitCodex:
     NoBackers:       str = 'NB'  # Do not allow any backers for registry
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 TraitDex = TraitCodex()  # Make instance
 
@@ -146,13 +146,23 @@ class ColdCodex:
     CtOpB2:    int = 0o7  # CountCode or OpCode Base2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 ColdDex = ColdCodex()  # Make instance
 
 Coldage = namedtuple("Coldage", 'msg txt bny')  # stream cold start status
 Colds = Coldage(msg='msg', txt='txt', bny='bny')
 
+# Escrow table specific callbacks for Kevery._drainEscrow where:
+#    items is db method (limit) that returns iterator of batches of escrow items (ekey, edig)
+#    delItems is db method that removes list of escrow items in one transaction
+#    timeout is int seconds after which escrowed items are stale
+#    keepExc is tuple of re-escrow exception classes that keep item in escrow
+#    process is method (eserder, bundle, dgkey) that processes escrowed event
+#    wigs is Boolean True means process uses escrowed witness sigs
+#    pde is Boolean True means process uses escrowed delegating event couple
+EscrowSpec = namedtuple("EscrowSpec", 'items delItems timeout keepExc process wigs pde')
+
 # Future make Cues dataclasses  instead of dicts. Dataclasses so may be converted
 # to/from dicts easily  example: dict(kin="receipt", serder=serder)
 
@@ -274,7 +284,7 @@ def deWitnessCouple(data, strip=False):
 
     diger = Diger(qb64b=data, strip=strip)
     if not strip:
-        data = data[len(diger.qb64b):]
+        data = data[diger.fullSize:]
     wiger = Siger(qb64b=data, strip=strip)
     return (diger, wiger)
 
@@ -300,7 +310,7 @@ def deReceiptCouple(data, strip=False):
 
     prefixer = Prefixer(qb64b=data, strip=strip)
     if not strip:
-        data = data[len(prefixer.qb64b):]
+        data = data[prefixer.fullSize:]
     cigar = Cigar(qb64b=data, strip=strip)
     return (prefixer, cigar)
 
@@ -326,7 +336,7 @@ def deSourceCouple(data, strip=False):
 
     seqner = Seqner(qb64b=data, strip=strip)
     if not strip:
-        data = data[len(seqner.qb64b):]
+        data = data[seqner.fullSize:]
     diger = Diger(qb64b=data, strip=strip)
     return (seqner, diger)
 
@@ -355,10 +365,10 @@ def deReceiptTriple(data, strip=False):
 
     diger = Diger(qb64b=data, strip=strip)
     if not strip:
-        data = data[len(diger.qb64b):]
+        data = data[diger.fullSize:]
     prefixer = Prefixer(qb64b=data, strip=strip)
     if not strip:
-        data = data[len(prefixer.qb64b):]
+        data = data[prefixer.fullSize:]
     cigar = Cigar(qb64b=data, strip=strip)
     return (diger, prefixer, cigar)
 
@@ -382,13 +392,13 @@ def deTransReceiptQuadruple(data, strip=False):
 
     prefixer = Prefixer(qb64b=data, strip=strip)
     if not strip:
-        data = data[len(prefixer.qb64b):]
+        data = data[prefixer.fullSize:]
     seqner = Seqner(qb64b=data, strip=strip)
     if not strip:
-        data = data[len(seqner.qb64b):]
+        data = data[seqner.fullSize:]
     diger = Diger(qb64b=data, strip=strip)
     if not strip:
-        data = data[len(diger.qb64b):]
+        data = data[diger.fullSize:]
     siger = Siger(qb64b=data, strip=strip)
     return (prefixer, seqner, diger, siger)
 
@@ -414,20 +424,40 @@ def deTransReceiptQuintuple(data, strip=False):
 
     ediger = Diger(qb64b=data, strip=strip)  #  diger of receipted event
     if not strip:
-        data = data[len(ediger.qb64b):]
+        data = data[ediger.fullSize:]
     sprefixer = Prefixer(qb64b=data, strip=strip)  # prefixer of recipter
     if not strip:
-        data = data[len(sprefixer.qb64b):]
+        data = data[sprefixer.fullSize:]
     sseqner = Seqner(qb64b=data, strip=strip)  # seqnumber of receipting event
     if not strip:
-        data = data[len(sseqner.qb64b):]
+        data = data[sseqner.fullSize:]
     sdiger = Diger(qb64b=data, strip=strip)  # diger of receipting event
     if not strip:
-        data = data[len(sdiger.qb64b):]
+        data = data[sdiger.fullSize:]
     siger = Siger(qb64b=data, strip=strip)  #  indexed siger of event
     return (ediger, sprefixer, sseqner, sdiger, siger)
 
 
+def staleIso8601(dtb, dtsb):
+    """
+    Returns True if escrow datetime dtb is older than stale boundary dtsb.
+    False otherwise.
+
+    Compares the bytes directly when dtb has the same fixed width UTC format
+    as dtsb since such ISO-8601 datetimes sort lexicographically in time order.
+    Otherwise falls back to parsing dtb.
+
+    Parameters:
+        dtb is bytes or memoryview of ISO-8601 datetime of escrow
+        dtsb is bytes of ISO-8601 UTC datetime with microseconds of stale
+            boundary as produced by helping.toIso8601
+    """
+    dtb = bytes(dtb)
+    if len(dtb) == len(dtsb) and dtb[-6:] == dtsb[-6:] == b"+00:00":
+        return dtb < dtsb
+    return helping.fromIso8601(dtb) < helping.fromIso8601(dtsb)
+
+
 def verifySigs(serder, sigers, verfers):
     """
     Returns tuple of (vsigers, vindices) where:
@@ -514,7 +544,7 @@ def incept(keys,
         raise ValueError("Invalid sith = {} for keys = {}".format(sith, keys))
 
     wits = wits if wits is not None else []
-    if len(oset(wits)) != len(wits):
+    if len(set(wits)) != len(wits):
         raise ValueError("Invalid wits = {}, has duplicates.".format(wits))
 
     if isinstance(toad, str):
@@ -607,7 +637,7 @@ def delcept(keys,
         raise ValueError("invalid sith = {}.".format(sith))
 
     wits = wits if wits is not None else []
-    if len(oset(wits)) != len(wits):
+    if len(set(wits)) != len(wits):
         raise ValueError("Invalid wits = {}, has duplicates.".format(wits))
 
     if isinstance(toad, str):
@@ -1083,11 +1113,11 @@ def state(pre,
 
     validateSN(eevt.s, inceptive=None)  # both incept and rotate
 
-    if len(oset(eevt.br)) != len(eevt.br):  # duplicates in cuts
+    if len(set(eevt.br)) != len(eevt.br):  # duplicates in cuts
         raise ValueError("Invalid cuts = {} in latest est event, has duplicates"
                          ".".format(eevt.br))
 
-    if len(oset(eevt.ba)) != len(eevt.ba):  # duplicates in adds
+    if len(set(eevt.ba)) != len(eevt.ba):  # duplicates in adds
         raise ValueError("Invalid adds = {} in latest est event, has duplicates"
                          ".".format(eevt.ba))
 
@@ -1260,7 +1290,6 @@ class Kever:
         .verfers is list of Verfer instances for current event state set of signing keys
         .nexter is qualified qb64 of next sith and next signing keys
         .toad is int threshold of accountable duplicity
-        .wits is list of qualified qb64 aids for witnesses
         .cuts is list of qualified qb64 aids for witnesses cut from prev wits list
         .adds is list of qualified qb64 aids for witnesses added to prev wits list
         .estOnly is boolean trait True means only allow establishment events
@@ -1272,6 +1301,13 @@ class Kever:
 
     Properties:
         .transferable Boolean True if nexter is not none and pre is transferable
+        .wits is list of qualified qb64 aids for witnesses
+        .werfers is list of Verfer instances one for each of .wits
+
+    Hidden:
+        ._wits is list of .wits
+        ._witIndexes is dict of index in .wits keyed by witness aid
+        ._werfers is memoized .werfers or None
 
     """
     EstOnly = False
@@ -1389,6 +1425,48 @@ class Kever:
         return(self.nexter is not None and self.prefixer.transferable)
 
 
+    @property
+    def wits(self):
+        """
+        Property wits:
+        Returns list of qualified qb64 aids for witnesses
+        """
+        return self._wits
+
+
+    @wits.setter
+    def wits(self, wits):
+        """
+        Property wits setter also indexes wits for .witIndex
+        """
+        self._wits = wits
+        self._witIndexes = {wit: index for index, wit in enumerate(wits)}
+        self._werfers = None  # reset memoized
+
+
+    @property
+    def werfers(self):
+        """
+        Property werfers:
+        Returns list of Verfer instances one for each witness in .wits
+        Memoized so witness keys are decoded once per witness list not per receipt
+        """
+        if self._werfers is None:
+            self._werfers = [Verfer(qb64=wit) for wit in self._wits]
+        return self._werfers
+
+
+    def witIndex(self, wit):
+        """
+        Returns int index of witness aid wit in .wits or None if not a witness
+        Dict lookup instead of membership test and list scan of .wits
+
+        Parameters:
+            wit is qualified qb64 aid of purported witness
+        """
+        return self._witIndexes.get(wit)
+
+
     def incept(self, serder, baser=None, estOnly=None):
         """
         Verify incept key event message from serder
@@ -1429,7 +1507,7 @@ class Kever:
         self.cuts = []  # always empty at inception since no prev event
         self.adds = []  # always empty at inception since no prev event
         wits = ked["b"]
-        if len(oset(wits)) != len(wits):
+        if len(set(wits)) != len(wits):
             raise ValidationError("Invalid backers = {}, has duplicates for evt = {}."
                              "".format(wits, ked))
         self.wits = wits
@@ -1671,7 +1749,7 @@ class Kever:
                 if praw is None:
                     raise ValidationError("Invalid recovery attempt: "
                                           " Bad dig = {}.".format(pdig))
-                pserder = Serder(raw=bytes(praw))  # deserialize prior event raw
+                pserder = Serder(raw=praw)  # deserialize prior event raw
                 if not pserder.compare(dig=dig): #  bad recovery event
                     raise ValidationError("Invalid recovery attempt:"
                                           "Mismatch recovery event prior dig"
@@ -1712,32 +1790,33 @@ class Kever:
         # use ordered set math ops to verify and ensure strict ordering of wits
         # cuts and add to ensure that indexed signatures on indexed witness
         # receipts work
-        witset = oset(self.wits)
+        # builtin sets suffice for membership checks since order comes from
+        # .wits and adds which are themselves checked for duplicates
         cuts = ked["br"]
-        cutset = oset(cuts)
+        cutset = set(cuts)
         if len(cutset) != len(cuts):
             raise ValidationError("Invalid cuts = {}, has duplicates for evt = "
                              "{}.".format(cuts, ked))
 
-        if (witset & cutset) != cutset:  #  some cuts not in wits
+        if not cutset.issubset(self.wits):  #  some cuts not in wits
             raise ValidationError("Invalid cuts = {}, not all members in wits"
                              " for evt = {}.".format(cuts, ked))
 
         adds = ked["ba"]
-        addset = oset(adds)
+        addset = set(adds)
         if len(addset) != len(adds):
             raise ValidationError("Invalid adds = {}, has duplicates for evt = "
                              "{}.".format(adds, ked))
 
-        if cutset & addset:  # non empty intersection
+        if not cutset.isdisjoint(addset):  # non empty intersection
             raise ValidationError("Intersecting cuts = {} and  adds = {} for "
                              "evt = {}.".format(cuts, adds, ked))
 
-        if witset & addset:  # non empty intersection
+        if not addset.isdisjoint(self.wits):  # non empty intersection
             raise ValidationError("Intersecting wits = {} and  adds = {} for "
                              "evt = {}.".format(self.wits, adds, ked))
 
-        wits = list((witset - cutset) | addset)
+        wits = [wit for wit in self.wits if wit not in cutset] + list(adds)
 
         if len(wits) != (len(self.wits) - len(cuts) + len(adds)):  # redundant?
             raise ValidationError("Invalid member combination among wits = {}, cuts ={}, "
@@ -1814,7 +1893,10 @@ class Kever:
         sigers, indices = verifySigs(serder=serder, sigers=sigers, verfers=verfers)
         # sigers  now have .verfer assigned
 
-        werfers = [Verfer(qb64=wit) for wit in wits]
+        if wits is self.wits:  # current witnesses so reuse memoized werfers
+            werfers = self.werfers
+        else:
+            werfers = [Verfer(qb64=wit) for wit in wits]
         #for wit in wits:  # create list of werfers one for each witness
             #werfers.append(Verfer(qb64=wit))
 
@@ -1843,7 +1925,7 @@ class Kever:
         # not local and event pre is own pre
         if ((wits and not self.prefixes) or  # in promiscuous mode so assume must verify toad
             (wits and self.prefixes and not self.local and  # not promiscuous nonlocal
-                not (oset(self.prefixes) & oset(wits)))):  # own prefix is not a witness
+                set(wits).isdisjoint(self.prefixes))):  # own prefix is not a witness
             # validate that event is fully witnessed
             if isinstance(toad, str):
                 toad = int(toad, 16)
@@ -1913,7 +1995,7 @@ class Kever:
             raise ValidationError("Missing delegation from {} at event dig = {} for evt = {}."
                                   "".format(delegator, ddig, serder.ked))
 
-        dserder = Serder(raw=bytes(raw))  # delegating event
+        dserder = Serder(raw=raw)  # delegating event
         # compare digests to make sure they match here
         if not dserder.compare(diger=diger):
             raise ValidationError("Invalide delegation from {} at event dig = {} for evt = {}."
@@ -1996,16 +2078,16 @@ class Kever:
                                 fn=fn, firner=firner, dater=dater))
                 logger.info("Kever Mismatch Cloned Replay FN: %s First seen "
                             "ordinal fn %s and clone fn %s \nEvent=\n%s\n",
-                             serder.preb, fn, firner.sn, serder.pretty)
+                             serder.preb, fn, firner.sn, helping.Lazy(serder.pretty))
             if dater:  # cloned replay use original's dts from dater
                 dtsb = dater.dtsb
             self.baser.setDts(dgkey, dtsb)  # first seen so set dts to now
             self.baser.fons.pin(keys=dgkey, val=Seqner(sn=fn))
             logger.info("Kever state: %s First seen ordinal %s at %s\nEvent=\n%s\n",
-                         serder.preb, fn, dtsb.decode("utf-8"), serder.pretty)
+                         serder.preb, fn, dtsb.decode("utf-8"), helping.Lazy(serder.pretty))
         self.baser.addKe(snKey(serder.preb, serder.sn), serder.digb)
         logger.info("Kever state: %s Added to KEL valid event=\n%s\n",
-                                               serder.preb, serder.pretty)
+                                               serder.preb, helping.Lazy(serder.pretty))
         return (fn, dtsb.decode("utf-8"))  #  (fn int, dts str) if first else (None, dts str)
 
 
@@ -2155,6 +2237,9 @@ class Kevery:
     TimeoutUWE = 3600  # seconds to timeout unverified receipt escrows
     TimeoutURE = 3600  # seconds to timeout unverified receipt escrows
     TimeoutVRE = 3600  # seconds to timeout unverified transferable receipt escrows
+    SerderCacheSize = 1024  # max number of deserialized db events memoized
+    SigerCacheSize = 1024  # max number of deserialized escrowed sig lists memoized
+    UnescrowBatchSize = 256  # max pending escrow deletes per write transaction
 
 
     def __init__(self, *, evts=None, cues=None, db=None,
@@ -2192,6 +2277,8 @@ class Kevery:
         self.cloned = True if cloned else False  # process as cloned
         self.direct = True if direct else False  # process as direct mode
         self.check = True if check else False  # process as check mode
+        self._serders = OrderedDict()  # LRU of db event Serders keyed by dgKey
+        self._sigers = OrderedDict()  # LRU of escrowed Siger lists keyed by sigs
 
 
     @property
@@ -2248,13 +2335,12 @@ class Kevery:
         """
         # fetch ked ilk  pre, sn, dig to see how to process
         ked = serder.ked
+        pre = serder.pre
         try:  # see if code of pre is supported and matches size of pre
-            Prefixer(qb64b=serder.preb)
+            Prefixer(qb64=pre)
         except Exception as ex:  # if unsupported code or bad size raises error
             raise ValidationError("Invalid pre = {} for evt = {}."
-                                  "".format(serder.pre, ked))
-        pre = serder.pre
-        ked = serder.ked
+                                  "".format(pre, ked))
         sn = self.validateSN(ked)
         ilk = ked["t"]
         dig = serder.dig
@@ -2305,7 +2391,7 @@ class Kevery:
             if ilk in (Ilks.icp, Ilks.dip):  # another inception event so maybe duplicitous
                 if sn != 0:
                     raise ValueError("Invalid sn={} for inception event={}."
-                                     "".format(sn, serder.ked))
+                                     "".format(sn, ked))
                 # check if duplicate of existing inception event since est is icp
                 eserder = self.fetchEstEvent(pre, sn)  # latest est evt wrt sn
                 if eserder.dig == dig:  # event is a duplicate but not duplicitous
@@ -2372,7 +2458,7 @@ class Kevery:
                         # matches est event of processed event
                         if (eserder.sn == kever.lastEst.s and
                                 eserder.dig == kever.lastEst.d):
-                            werfers = [Verfer(qb64=wit) for wit in kever.wits]
+                            werfers = kever.werfers
                             wigers, windices = verifySigs(serder=serder,
                                                           sigers=wigers,
                                                           verfers=werfers)
@@ -2410,6 +2496,7 @@ class Kevery:
         ked = serder.ked
         pre = serder.pre
         sn = self.validateSN(ked)
+        dig = ked["d"]  # dig of receipted event from receipt
 
         # Only accept receipt if for last seen version of event at sn
         snkey = snKey(pre=pre, sn=sn)
@@ -2422,18 +2509,20 @@ class Kevery:
             raw = bytes(self.db.getEvt(key=dgkey))  # retrieve receipted event at dig
             # assumes db ensures that raw must not be none
             lserder = Serder(raw=raw)  # deserialize event raw
+            lraw = lserder.raw  # serialized receipted event to verify against
 
-            if not lserder.compare(dig=ked["d"]):  # stale receipt at sn discard
+            if not lserder.compare(dig=dig):  # stale receipt at sn discard
                 raise ValidationError("Stale receipt at sn = {} for rct = {}."
                                       "".format(ked["s"], ked))
 
             # process each couple verify sig and write to db
+            wigs = []  # verified wigs to write in one transaction
             for wiger in wigers:
                 # assign verfers from witness list
                 kever = self.kevers[pre]  # get key state
                 if wiger.index >= len(kever.wits):
                     continue  # skip invalid witness index
-                wiger.verfer = Verfer(qb64=kever.wits[wiger.index])  # assign verfer
+                wiger.verfer = kever.werfers[wiger.index]  # assign verfer
                 if wiger.verfer.transferable:  # skip transferable verfers
                     continue  # skip invalid witness prefix
 
@@ -2441,20 +2530,22 @@ class Kevery:
                     if pre in self.prefixes:  # skip own receiptor of own event
                         # sign own events not receipt them
                         logger.info("Kevery process: skipped own receipt attachment"
-                                    " on own event receipt=\n%s\n",serder.pretty)
+                                    " on own event receipt=\n%s\n", helping.Lazy(serder.pretty))
                         continue  # skip own receipt attachment on own event
                     if not self.local:  # own receipt on other event when not local
                         logger.info("Kevery process: skipped own receipt attachment"
-                                " on nonlocal event receipt=\n%s\n", serder.pretty)
+                                " on nonlocal event receipt=\n%s\n", helping.Lazy(serder.pretty))
                         continue  # skip own receipt attachment on non-local event
 
-                if wiger.verfer.verify(wiger.raw, lserder.raw):
-                    # write receipt indexed sig to database
-                    self.db.addWig(key=dgkey, val=wiger.qb64b)
+                if wiger.verfer.verify(wiger.raw, lraw):
+                    wigs.append(wiger.qb64b)  # receipt indexed sig
+
+            if wigs:  # write receipt indexed sigs to database
+                self.db.putWigs(key=dgkey, vals=wigs)
 
         else:  # no events to be receipted yet at that sn so escrow
             # get digest from receipt message not receipted event
-            self.escrowUWReceipt(serder=serder, wigers=wigers, dig=ked["d"])
+            self.escrowUWReceipt(serder=serder, wigers=wigers, dig=dig)
             raise UnverifiedWitnessReceiptError("Unverified witness receipt={}."
                                                 "".format(ked))
 
@@ -2479,6 +2570,7 @@ class Kevery:
         ked = serder.ked
         pre = serder.pre
         sn = self.validateSN(ked)
+        dig = ked["d"]  # dig of receipted event from receipt
 
         # Only accept receipt if for last seen version of event at sn
         snkey = snKey(pre=pre, sn=sn)
@@ -2491,12 +2583,15 @@ class Kevery:
             raw = bytes(self.db.getEvt(key=dgkey))  # retrieve receipted event at dig
             # assumes db ensures that raw must not be none
             lserder = Serder(raw=raw)  # deserialize event raw
+            lraw = lserder.raw  # serialized receipted event to verify against
 
-            if not lserder.compare(dig=ked["d"]):  # stale receipt at sn discard
+            if not lserder.compare(dig=dig):  # stale receipt at sn discard
                 raise ValidationError("Stale receipt at sn = {} for rct = {}."
                                       "".format(ked["s"], ked))
 
             # process each couple verify sig and write to db
+            wigs = []  # verified witness sigs to write in one transaction
+            rcts = []  # verified receipt couples to write in one transaction
             for cigar in cigars:
                 if cigar.verfer.transferable:  # skip transferable verfers
                     continue  # skip invalid couplets
@@ -2505,27 +2600,31 @@ class Kevery:
                     if pre in self.prefixes:  # skip own receipter of own event
                         # sign own events not receipt them
                         logger.info("Kevery process: skipped own receipt attachment"
-                                    " on own event receipt=\n%s\n", serder.pretty)
+                                    " on own event receipt=\n%s\n", helping.Lazy(serder.pretty))
                         continue  # skip own receipt attachment on own event
                     if not self.local:  # own receipt on other event when not local
                         logger.info("Kevery process: skipped own receipt attachment"
-                                " on nonlocal event receipt=\n%s\n", serder.pretty)
+                                " on nonlocal event receipt=\n%s\n", helping.Lazy(serder.pretty))
                         continue  # skip own receipt attachment on non-local event
 
-                if cigar.verfer.verify(cigar.raw, lserder.raw):
+                if cigar.verfer.verify(cigar.raw, lraw):
                     kever = self.kevers[pre]  # get key state to check if witness
                     rpre = cigar.verfer.qb64  # prefix of receiptor
-                    if rpre in kever.wits:  # its a witness receipt
-                        index = kever.wits.index(rpre)
+                    index = kever.witIndex(rpre)
+                    if index is not None:  # its a witness receipt
                         # create witness indexed signature
                         wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
-                        self.db.addWig(key=dgkey, val=wiger.qb64b)  # write to db
-                    else:  # write receipt couple to database
-                        couple = cigar.verfer.qb64b + cigar.qb64b
-                        self.db.addRct(key=dgkey, val=couple)
+                        wigs.append(wiger.qb64b)
+                    else:  # receipt couple
+                        rcts.append(cigar.verfer.qb64b + cigar.qb64b)
+
+            if wigs:  # write witness indexed sigs to database
+                self.db.putWigs(key=dgkey, vals=wigs)
+            if rcts:  # write receipt couples to database
+                self.db.putRcts(key=dgkey, vals=rcts)
 
         else:  # no events to be receipted yet at that sn so escrow
-            self.escrowUReceipt(serder, cigars, dig=ked["d"])  # digest in receipt
+            self.escrowUReceipt(serder, cigars, dig=dig)  # digest in receipt
             raise UnverifiedReceiptError("Unverified receipt={}.".format(ked))
 
 
@@ -2566,7 +2665,10 @@ class Kevery:
             raise ValidationError("Mismatch replay event at sn = {} with db."
                                   "".format(ked["s"]))
 
+        raw = serder.raw  # serialized receipted event to verify against
         # process each couple to verify sig and write to db
+        wigs = []  # verified witness sigs to write in one transaction
+        rcts = []  # verified receipt couples to write in one transaction
         for cigar in cigars:
             if cigar.verfer.transferable:  # skip transferable verfers
                 continue  # skip invalid couplets
@@ -2574,24 +2676,28 @@ class Kevery:
                 if pre in self.prefixes:  # skip own receipter on own event
                     # sign own events not receipt them
                     logger.info("Kevery process: skipped own receipt attachment"
-                                " on own event receipt=\n%s\n", serder.pretty)
+                                " on own event receipt=\n%s\n", helping.Lazy(serder.pretty))
                     continue  # skip own receipt attachment on own event
                 if not self.local:  # own receipt on other event when not local
                     logger.info("Kevery process: skipped own receipt attachment"
-                            " on nonlocal event receipt=\n%s\n", serder.pretty)
+                            " on nonlocal event receipt=\n%s\n", helping.Lazy(serder.pretty))
                     continue  # skip own receipt attachment on non-local event
 
-            if cigar.verfer.verify(cigar.raw, serder.raw):
+            if cigar.verfer.verify(cigar.raw, raw):
                 kever = self.kevers[pre]  # get key state to check if witness
                 rpre = cigar.verfer.qb64  # prefix of receiptor
-                if rpre in kever.wits:  # its a witness receipt
-                    index = kever.wits.index(rpre)
-                    # create witness indexed signature and write to db
+                index = kever.witIndex(rpre)
+                if index is not None:  # its a witness receipt
+                    # create witness indexed signature
                     wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
-                    self.db.addWig(key=dgKey(pre, ldig), val=wiger.qb64b)
-                else:  # write receipt couple to database
-                    couple = cigar.verfer.qb64b + cigar.qb64b
-                    self.db.addRct(key=dgKey(pre, ldig), val=couple)
+                    wigs.append(wiger.qb64b)
+                else:  # receipt couple
+                    rcts.append(cigar.verfer.qb64b + cigar.qb64b)
+
+        if wigs:  # write witness indexed sigs to database
+            self.db.putWigs(key=dgKey(pre, ldig), vals=wigs)
+        if rcts:  # write receipt couples to database
+            self.db.putRcts(key=dgKey(pre, ldig), vals=rcts)
 
 
     def processReceiptTrans(self, serder, tsgs):
@@ -2626,64 +2732,75 @@ class Kevery:
 
         # retrieve event by dig assumes if ldig is not None that event exists at ldig
         ldig = bytes(ldig).decode("utf-8")
-        lraw = self.db.getEvt(key=dgKey(pre=pre, dig=ldig))
-        lserder = Serder(raw=bytes(lraw))
-         # verify digs match
-        if not lserder.compare(dig=ldig):  # mismatch events problem with replay
-            raise ValidationError("Mismatch receipt of event at sn = {} with db."
-                                  "".format(sn))
-
-        for sprefixer, sseqner, sdiger, sigers in tsgs:  # iterate over each tsg
-            if not self.lax and sprefixer.qb64 in self.prefixes:  # own is receipter
-                if pre in self.prefixes:  # skip own receipter of own event
-                    # sign own events not receipt them
-                    raise ValidationError("Own pre={} receipter of own event"
-                                          " {}.".format(self.prefixes, serder.pretty))
-                if not self.local:  # skip own receipts of nonlocal events
-                    raise ValidationError("Own pre={} receipter of nonlocal event "
-                                          "{}.".format(self.prefixes, serder.pretty))
-
-            if sprefixer.qb64 in self.kevers:
-                # receipted event and receipter in database so get receipter est evt
-                # retrieve dig of last event at sn of est evt of receipter.
-                sdig = self.db.getKeLast(key=snKey(pre=sprefixer.qb64b,
-                                                      sn=sseqner.sn))
-                if sdig is None:
-                    # receipter's est event not yet in receipters's KEL
-                    self.escrowTReceipts(serder, sprefixer, sseqner, sdiger, sigers)
-                    raise UnverifiedTransferableReceiptError("Unverified receipt: "
-                                        "missing establishment event of transferable "
-                                        "receipter for event={}."
-                                        "".format(ked))
+        raw = self.db.getEvt(key=dgKey(pre=pre, dig=ldig))
+        lserder = Serder(raw=raw)
+        lraw = lserder.raw  # serialized receipted event to verify against
+        # lserder retrieved by ldig so its dig matches by construction
 
+        vrcs = []  # verified receipt quadruples to write in one transaction
+        sserders = {}  # receipter est event serders keyed by (pre, sn) so fetch once
+        try:
+            for sprefixer, sseqner, sdiger, sigers in tsgs:  # iterate over each tsg
+                spreb = sprefixer.qb64b  # encode receipter prefix once
+                spre = spreb.decode("utf-8")
+                if not self.lax and spre in self.prefixes:  # own is receipter
+                    if pre in self.prefixes:  # skip own receipter of own event
+                        # sign own events not receipt them
+                        raise ValidationError("Own pre={} receipter of own event"
+                                              " {}.".format(self.prefixes, serder.pretty))
+                    if not self.local:  # skip own receipts of nonlocal events
+                        raise ValidationError("Own pre={} receipter of nonlocal event "
+                                              "{}.".format(self.prefixes, serder.pretty))
+
+                if spre in self.kevers:
+                    # receipted event and receipter in database so get receipter est evt
+                    skey = (spreb, sseqner.sn)
+                    sserder = sserders.get(skey)
+                    if sserder is None:  # not yet fetched by earlier group
+                        # retrieve dig of last event at sn of est evt of receipter.
+                        sdig = self.db.getKeLast(key=snKey(pre=spreb, sn=sseqner.sn))
+                        if sdig is None:
+                            # receipter's est event not yet in receipters's KEL
+                            self.escrowTReceipts(serder, sprefixer, sseqner, sdiger, sigers)
+                            raise UnverifiedTransferableReceiptError("Unverified receipt: "
+                                                "missing establishment event of transferable "
+                                                "receipter for event={}."
+                                                "".format(ked))
 
-                # retrieve last event itself of receipter est evt from sdig
-                sraw = self.db.getEvt(key=dgKey(pre=sprefixer.qb64b, dig=bytes(sdig)))
-                # assumes db ensures that sraw must not be none because sdig was in KE
-                sserder = Serder(raw=bytes(sraw))
-                if not sserder.compare(diger=sdiger):  # endorser's dig not match event
-                    raise ValidationError("Bad trans indexed sig group at sn = {}"
-                                          " for ksn = {}."
-                                          "".format(sseqner.sn, sserder.ked))
+                        # retrieve last event itself of receipter est evt from sdig
+                        # assumes db ensures that event must exist because sdig was in KE
+                        sserder = sserders[skey] = self.fetchSerder(pre=spreb, dig=sdig)
 
-                #verify sigs and if so write receipt to database
-                sverfers = sserder.verfers
-                if not sverfers:
-                    raise ValidationError("Invalid key state endorser's est. event"
-                                          " dig = {} for ksn from pre ={}, "
-                                          "no keys."
-                                          "".format(sdiger.qb64, sprefixer.qb64))
+                    if not sserder.compare(diger=sdiger):  # endorser's dig not match event
+                        raise ValidationError("Bad trans indexed sig group at sn = {}"
+                                              " for ksn = {}."
+                                              "".format(sseqner.sn, sserder.ked))
 
-                for siger in sigers:
-                    if siger.index >= len(sverfers):
-                        raise ValidationError("Index = {} to large for keys."
-                                                  "".format(siger.index))
-                    siger.verfer = sverfers[siger.index]  # assign verfer
-                    if siger.verfer.verify(siger.raw, lserder.raw):  # verify sig
-                        # good sig so write receipt quadruple to database
-                        quadruple = sprefixer.qb64b + sseqner.qb64b + sdiger.qb64b + siger.qb64b
-                        self.db.addVrc(key=dgKey(pre=pre, dig=ldig),
-                                       val=quadruple)  # dups kept
+                    #verify sigs and if so write receipt to database
+                    sverfers = sserder.verfers
+                    if not sverfers:
+                        raise ValidationError("Invalid key state endorser's est. event"
+                                              " dig = {} for ksn from pre ={}, "
+                                              "no keys."
+                                              "".format(sdiger.qb64, spre))
+
+                    for siger in sigers:
+                        if siger.index >= len(sverfers):
+                            raise ValidationError("Index = {} to large for keys."
+                                                      "".format(siger.index))
+                        siger.verfer = sverfers[siger.index]  # assign verfer
+                        if siger.verfer.verify(siger.raw, lraw):  # verify sig
+                            # good sig so write receipt quadruple to database
+                            vrcs.append(spreb + sseqner.qb64b +
+                                        sdiger.qb64b + siger.qb64b)
+
+        except Exception:  # write receipts verified before later group escrows or fails
+            if vrcs:
+                self.db.putVrcs(key=dgKey(pre=pre, dig=ldig), vals=vrcs)  # dups kept
+            raise
+
+        if vrcs:  # write all verified receipts in one transaction
+            self.db.putVrcs(key=dgKey(pre=pre, dig=ldig), vals=vrcs)  # dups kept
 
 
     def processReceiptQuadruples(self, serder, trqs, firner=None):
@@ -2714,81 +2831,94 @@ class Kevery:
             # Only accept receipt if for last seen version of receipted event at sn
             ldig = self.db.getKeLast(key=snKey(pre=pre, sn=sn))  # retrieve dig of last event at sn.
 
-        for sprefixer, sseqner, sdiger, siger in trqs:  # iterate over each trq
-            if not self.lax and sprefixer.qb64 in self.prefixes:  # own trans receipt quadruple (chit)
-                if pre in self.prefixes:  # skip own trans receipts of own events
-                    raise ValidationError("Own pre={} replay attached transferable "
-                                          "receipt quadruple of own event {}."
-                                      "".format(self.prefixes, serder.pretty))
-                if not self.local:  # skip own trans receipt quadruples of nonlocal events
-                    raise ValidationError("Own pre={} seal in replay attached "
-                                          "transferable receipt quadruples of nonlocal"
-                                          " event {}.".format(self.prefixes, serder.pretty))
+        if ldig is not None:  # receipted event in database so verify digs match
+            ldig = bytes(ldig).decode("utf-8")
+            matched = serder.compare(dig=ldig)
 
-            if ldig is not None and sprefixer.qb64 in self.kevers:
-                # both receipted event and receipter in database so retreive
-                if isinstance(ldig, memoryview):
-                    ldig = bytes(ldig).decode("utf-8")
+        raw = serder.raw  # serialized receipted event to verify against
+        vrcs = []  # verified receipt quadruples to write in one transaction
+        sserders = {}  # receipter est event serders keyed by (pre, sn) so fetch once
+        try:
+            for sprefixer, sseqner, sdiger, siger in trqs:  # iterate over each trq
+                spreb = sprefixer.qb64b  # encode receipter prefix once
+                spre = spreb.decode("utf-8")
+                if not self.lax and spre in self.prefixes:  # own trans receipt quadruple (chit)
+                    if pre in self.prefixes:  # skip own trans receipts of own events
+                        raise ValidationError("Own pre={} replay attached transferable "
+                                              "receipt quadruple of own event {}."
+                                          "".format(self.prefixes, serder.pretty))
+                    if not self.local:  # skip own trans receipt quadruples of nonlocal events
+                        raise ValidationError("Own pre={} seal in replay attached "
+                                              "transferable receipt quadruples of nonlocal"
+                                              " event {}.".format(self.prefixes, serder.pretty))
+
+                if ldig is not None and spre in self.kevers:
+                    # both receipted event and receipter in database so retreive
+                    if not matched:  # mismatch events problem with replay
+                        raise ValidationError("Mismatch replay event at sn = {} with db."
+                                              "".format(ked["s"]))
+
+                    skey = (spreb, sseqner.sn)
+                    sserder = sserders.get(skey)
+                    if sserder is None:  # not yet fetched by earlier quadruple
+                        # retrieve dig of last event at sn of receipter.
+                        sdig = self.db.getKeLast(key=snKey(pre=spreb, sn=sseqner.sn))
+                        if sdig is None:
+                            # receipter's est event not yet in receipter's KEL
+                            # receipter's seal event not in receipter's KEL
+                            self.escrowTRQuadruple(serder, sprefixer, sseqner, sdiger, siger)
+                            raise UnverifiedTransferableReceiptError("Unverified receipt: "
+                                                "missing establishment event of transferable "
+                                                "validator receipt quadruple for event={}."
+                                                "".format(ked))
 
-                if not serder.compare(dig=ldig):  # mismatch events problem with replay
-                    raise ValidationError("Mismatch replay event at sn = {} with db."
-                                          "".format(ked["s"]))
+                        # retrieve last event itself of receipter
+                        # assumes db ensures that event must exist because sdig was in KE
+                        sserder = sserders[skey] = self.fetchSerder(pre=spreb, dig=sdig)
 
-                # retrieve dig of last event at sn of receipter.
-                sdig = self.db.getKeLast(key=snKey(pre=sprefixer.qb64b,
-                                                      sn=sseqner.sn))
-                if sdig is None:
-                    # receipter's est event not yet in receipter's KEL
-                    # receipter's seal event not in receipter's KEL
-                    self.escrowTRQuadruple(serder, sprefixer, sseqner, sdiger, siger)
-                    raise UnverifiedTransferableReceiptError("Unverified receipt: "
-                                        "missing establishment event of transferable "
-                                        "validator receipt quadruple for event={}."
-                                        "".format(ked))
-
-                # retrieve last event itself of receipter
-                sraw = self.db.getEvt(key=dgKey(pre=sprefixer.qb64b, dig=bytes(sdig)))
-                # assumes db ensures that sraw must not be none because sdig was in KE
-                sserder = Serder(raw=bytes(sraw))
-                if not sserder.compare(diger=sdiger):  # seal dig not match event
-                    raise ValidationError("Bad trans receipt quadruple at sn = {}"
-                                          " for rct = {}."
-                                          "".format(sseqner.sn, sserder.ked))
+                    if not sserder.compare(diger=sdiger):  # seal dig not match event
+                        raise ValidationError("Bad trans receipt quadruple at sn = {}"
+                                              " for rct = {}."
+                                              "".format(sseqner.sn, sserder.ked))
 
-                #verify sigs and if so write quadruple to database
-                sverfers = sserder.verfers
-                if not sverfers:
-                    raise ValidationError("Invalid trans receipt quad est. event"
-                                          " dig = {} for receipt from pre ={}, "
-                                          "no keys."
-                                          "".format(sdiger.qb64, sprefixer.qb64))
+                    #verify sigs and if so write quadruple to database
+                    sverfers = sserder.verfers
+                    if not sverfers:
+                        raise ValidationError("Invalid trans receipt quad est. event"
+                                              " dig = {} for receipt from pre ={}, "
+                                              "no keys."
+                                              "".format(sdiger.qb64, spre))
 
-                if siger.index >= len(sverfers):
-                    raise ValidationError("Index = {} to large for keys."
-                                              "".format(siger.index))
+                    if siger.index >= len(sverfers):
+                        raise ValidationError("Index = {} to large for keys."
+                                                  "".format(siger.index))
 
-                siger.verfer = sverfers[siger.index]  # assign verfer
-                if not siger.verfer.verify(siger.raw, serder.raw):  # verify sig
-                    logger.info("Kevery unescrow error: Bad trans receipt sig."
-                             "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
+                    siger.verfer = sverfers[siger.index]  # assign verfer
+                    if not siger.verfer.verify(siger.raw, raw):  # verify sig
+                        logger.info("Kevery unescrow error: Bad trans receipt sig."
+                                 "pre=%s sn=%x receipter=%s\n", pre, sn, spre)
 
-                    raise ValidationError("Bad escrowed trans receipt sig at "
-                                          "pre={} sn={:x} receipter={}."
-                                          "".format(pre, sn, sprefixer.qb64))
+                        raise ValidationError("Bad escrowed trans receipt sig at "
+                                              "pre={} sn={:x} receipter={}."
+                                              "".format(pre, sn, spre))
 
-                # good sig so write receipt quadruple to database
+                    # good sig so receipt quadruple to write to database
+                    vrcs.append(spreb + sseqner.qb64b + sdiger.qb64b + siger.qb64b)
 
-                # Set up quadruple
-                quadruple = sprefixer.qb64b + sseqner.qb64b + sdiger.qb64b + siger.qb64b
-                self.db.addVrc(key=dgKey(pre, serder.dig), val=quadruple)
+                else:  # escrow  either receiptor or receipted event not yet in database
+                    self.escrowTRQuadruple(serder, sprefixer, sseqner, sdiger, siger)
+                    raise UnverifiedTransferableReceiptError("Unverified receipt: "
+                                          "missing associated event for transferable "
+                                          "validator receipt quadruple for event={}."
+                                          "".format(ked))
 
+        except Exception:  # write receipts verified before later quadruple escrows or fails
+            if vrcs:
+                self.db.putVrcs(key=dgKey(pre, serder.dig), vals=vrcs)
+            raise
 
-            else:  # escrow  either receiptor or receipted event not yet in database
-                self.escrowTRQuadruple(serder, sprefixer, sseqner, sdiger, siger)
-                raise UnverifiedTransferableReceiptError("Unverified receipt: "
-                                      "missing associated event for transferable "
-                                      "validator receipt quadruple for event={}."
-                                      "".format(ked))
+        if vrcs:  # write all verified receipts in one transaction
+            self.db.putVrcs(key=dgKey(pre, serder.dig), vals=vrcs)
 
 
     def processKeyStateNotice(self, serder, cigars=None, tsgs=None):
@@ -2808,6 +2938,10 @@ class Kevery:
                 [sigers] is list of indexed sigs from trans endorser's keys from est evt
 
         """
+        # parser passes either cigars or tsgs so other shape loops over nothing
+        cigars = cigars if cigars is not None else []
+        tsgs = tsgs if tsgs is not None else []
+
         # fetch from serder to process
         ked = serder.ked
         pre = serder.pre
@@ -2833,34 +2967,41 @@ class Kevery:
             #self.escrowUREvent(serder, cigars, dig=serder.dig)  # digest in receipt
             #raise UnverifiedReceiptError("Unverified receipt={}.".format(ked))
 
-        ldig = bytes(ldig).decode("utf-8")  # verify digs match
+        ldig = bytes(ldig).decode("utf-8")  # decode once then verify digs match
         # retrieve event by dig assumes if ldig is not None that event exists at ldig
 
         if not serder.compare(dig=ldig):  # mismatch events problem with replay
             raise ValidationError("Mismatch keystate at sn = {} with db."
                                   "".format(ked["s"]))
 
+        raw = serder.raw  # serialized key state event to verify against
+        # only encode verfer or prefixer to qb64 for own check when there are
+        # own prefixes. Mode decided once per notice not once per attachment
+        prefixes = self.prefixes if not self.lax else None
+        rcts = []  # verified receipt couples to write in one transaction
         # process each couple to verify sig and write to db
         for cigar in cigars:
             if cigar.verfer.transferable:  # skip transferable verfers
                 continue  # skip invalid couplets
-            if not self.lax and cigar.verfer.qb64 in self.prefixes:  # own receipt when own nontrans
+            if prefixes and cigar.verfer.qb64 in prefixes:  # own receipt when own nontrans
                 if pre in self.prefixes:  # own receipt attachment on own event
                     logger.info("Kevery process: skipped own receipt attachment"
-                                " on own event receipt=\n%s\n", serder.pretty)
+                                " on own event receipt=\n%s\n", helping.Lazy(serder.pretty))
                     continue  # skip own receipt attachment on own event
                 if not self.local:  # own receipt on other event when not local
                     logger.info("Kevery process: skipped own receipt attachment"
-                            " on nonlocal event receipt=\n%s\n", serder.pretty)
+                            " on nonlocal event receipt=\n%s\n", helping.Lazy(serder.pretty))
                     continue  # skip own receipt attachment on non-local event
 
-            if cigar.verfer.verify(cigar.raw, serder.raw):
-                # write receipt couple to database
-                couple = cigar.verfer.qb64b + cigar.qb64b
-                self.db.addRct(key=dgKey(pre=pre, dig=ldig), val=couple)
+            if cigar.verfer.verify(cigar.raw, raw):
+                # receipt couple to write to database
+                rcts.append(cigar.verfer.qb64b + cigar.qb64b)
+
+        if rcts:  # write all verified receipt couples in one transaction
+            self.db.putRcts(key=dgKey(pre=pre, dig=ldig), vals=rcts)
 
         for sprefixer, sseqner, sdiger, sigers in tsgs:  # iterate over each tsg
-            if not self.lax and sprefixer.qb64 in self.prefixes:  # own endorsed ksn
+            if prefixes and sprefixer.qb64 in prefixes:  # own endorsed ksn
                 if pre in self.prefixes:  # skip own endorsed ksn
                     raise ValidationError("Own endorsement pre={} of own key"
                         " state notifiction {}.".format(self.prefixes, serder.pretty))
@@ -2871,13 +3012,7 @@ class Kevery:
 
             if ldig is not None and sprefixer.qb64 in self.kevers:
                 # both key state event and endorser in database so retreive
-                if isinstance(ldig, memoryview):
-                    ldig = bytes(ldig).decode("utf-8")
-
-                if not serder.compare(dig=ldig):  # mismatch events problem with replay
-                    raise ValidationError("Mismatch replay event at sn = {} with db."
-                                          "".format(ked["s"]))
-
+                # ldig already decoded and matched to serder before the loops
                 # retrieve dig of last event at sn of endorser.
                 sdig = self.db.getKeLast(key=snKey(pre=sprefixer.qb64b,
                                                       sn=sseqner.sn))
@@ -2892,9 +3027,8 @@ class Kevery:
                                         #"".format(ked))
 
                 # retrieve last event itself of endorser
-                sraw = self.db.getEvt(key=dgKey(pre=sprefixer.qb64b, dig=bytes(sdig)))
-                # assumes db ensures that sraw must not be none because sdig was in KE
-                sserder = Serder(raw=bytes(sraw))
+                # assumes db ensures that event must exist because sdig was in KE
+                sserder = self.fetchSerder(pre=sprefixer.qb64b, dig=sdig)
                 if not sserder.compare(diger=sdiger):  # endorser's dig not match event
                     raise ValidationError("Bad trans indexed sig group at sn = {}"
                                           " for ksn = {}."
@@ -2908,14 +3042,16 @@ class Kevery:
                                           "no keys."
                                           "".format(sdiger.qb64, sprefixer.qb64))
 
-
-
+                # check indices and assign verfers of whole group before
+                # spending any signature verifications on it
                 for siger in sigers:
                     if siger.index >= len(sverfers):
                         raise ValidationError("Index = {} to large for keys."
                                                   "".format(siger.index))
                     siger.verfer = sverfers[siger.index]  # assign verfer
-                    if not siger.verfer.verify(siger.raw, serder.raw):  # verify sig
+
+                for siger in sigers:
+                    if not siger.verfer.verify(siger.raw, raw):  # verify sig
                         logger.info("Kevery unescrow error: Bad trans receipt sig."
                                  "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
 
@@ -2955,9 +3091,9 @@ class Kevery:
         if res == "logs":
             pre = qry["i"]
             cloner = self.db.clonePreIter(pre=pre, fn=0)  # create iterator at 0
-            msgs = bytearray()  # outgoing messages
-            for msg in cloner:
-                msgs.extend(msg)
+            # join sizes outgoing messages once instead of growing per extend
+            # bytearray not bytes since cue consumers may parse it in place
+            msgs = bytearray().join(cloner)
 
             self.cues.push(dict(kin="replay", msgs=msgs))
         else:
@@ -2977,14 +3113,86 @@ class Kevery:
         if len(sn) > 32:
             raise ValidationError("Invalid sn = {} too large for evt = {}."
                                   "".format(sn, ked))
-        try:
+        try:  # int parse of hex is faster than bytes.fromhex and int.from_bytes
             sn = int(sn, 16)
         except Exception as ex:
             raise ValidationError("Invalid sn = {} for evt = {}.".format(sn, ked))
 
+        if sn < 0:  # int accepts signed hex
+            raise ValidationError("Negative sn = {} for evt = {}.".format(sn, ked))
+
         return sn
 
 
+    def fetchSerder(self, pre, dig):
+        """
+        Returns Serder instance of event in db for pre at dig.
+        Returns None if no event at dig in db for pre
+
+        Memoizes up to .SerderCacheSize deserialized events. Events are content
+        addressed by dig so a memoized Serder never goes stale.
+
+        Parameters:
+            pre is qb64 or qb64b of identifier prefix for KEL
+            dig is qb64 or qb64b of event digest
+        """
+        key = dgKey(pre=pre, dig=dig)
+        serder = self._serders.get(key)
+        if serder is not None:  # cache hit so mark as most recently used
+            self._serders.move_to_end(key)
+            return serder
+
+        raw = self.db.getEvt(key=key)
+        if raw is None:
+            return None
+
+        return self.memoSerder(key, raw)
+
+
+    def memoSerder(self, key, raw):
+        """
+        Returns Serder instance of event raw memoized at key.
+        Deserializes raw only when not already memoized so escrowed events
+        retried on every escrow pass are not reparsed each pass.
+
+        Parameters:
+            key is bytes dgKey of event in db
+            raw is bytes or memoryview of serialized event at key
+        """
+        serder = self._serders.get(key)
+        if serder is not None:  # cache hit so mark as most recently used
+            self._serders.move_to_end(key)
+            return serder
+
+        serder = self._serders[key] = Serder(raw=raw)  # deserialize event raw
+        while len(self._serders) > self.SerderCacheSize:  # evict least recently used
+            self._serders.popitem(last=False)
+        return serder
+
+
+    def memoSigers(self, sigs):
+        """
+        Returns list of Siger instances from escrowed qb64b signatures sigs.
+        Memoizes up to .SigerCacheSize lists keyed by the sigs themselves so
+        escrowed signatures retried on every escrow pass are not decoded each
+        pass. Escrowing more signatures changes the key so never goes stale.
+        Callers must not modify the returned list or its Sigers.
+
+        Parameters:
+            sigs is list of bytes qb64b signatures such as EscrowBundle.sigs
+        """
+        key = tuple(sigs)
+        sigers = self._sigers.get(key)
+        if sigers is not None:  # cache hit so mark as most recently used
+            self._sigers.move_to_end(key)
+            return sigers
+
+        sigers = self._sigers[key] = [Siger(qb64b=sig) for sig in key]
+        while len(self._sigers) > self.SigerCacheSize:  # evict least recently used
+            self._sigers.popitem(last=False)
+        return sigers
+
+
     def fetchEstEvent(self, pre, sn):
         """
         Returns Serder instance of establishment event that is authoritative for
@@ -3002,12 +3210,10 @@ class Kevery:
             if not dig:
                 return None
 
-            # retrieve event by dig
-            raw = bytes(self.db.getEvt(key=dgKey(pre=pre, dig=dig)))
-            if not raw:
+            serder = self.fetchSerder(pre=pre, dig=dig)  # retrieve event by dig
+            if serder is None:
                 return None
 
-            serder = Serder(raw=raw)  # deserialize event raw
             if serder.ked["t"] in (Ilks.icp, Ilks.dip, Ilks.rot, Ilks.drt):
                 return serder  # establishment event so return
 
@@ -3026,17 +3232,19 @@ class Kevery:
             seqner is Seqner instance of sn of event delegatint/issuing event if any
             diger is Diger instance of dig of event delegatint/issuing event if any
         """
-        dgkey = dgKey(serder.preb, serder.digb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.db.putEvt(dgkey, serder.raw)
-        self.db.addOoe(snKey(serder.preb, serder.sn), serder.digb)
-        if seqner and diger:
-            couple = seqner.qb64b + diger.qb64b
-            self.db.putPde(dgkey, couple)   # idempotent
+        couple = seqner.qb64b + diger.qb64b if seqner and diger else None
+        # all escrow writes in one transaction, each idempotent
+        self.db.putEscrowedEvt(db=self.db.ooes,
+                               dgkey=dgKey(serder.preb, serder.digb),
+                               snkey=snKey(serder.preb, serder.sn),
+                               dig=serder.digb,
+                               dts=helping.nowIso8601().encode("utf-8"),
+                               sigs=[siger.qb64b for siger in sigers],
+                               raw=serder.raw,
+                               pde=couple)
         # log escrowed
         logger.info("Kevery process: escrowed out of order event=\n%s\n",
-                                      json.dumps(serder.ked, indent=1))
+                                      helping.Lazy(serder.pretty))
 
 
     def escrowLDEvent(self, serder, sigers):
@@ -3047,14 +3255,17 @@ class Kevery:
             serder is Serder instance of  event
             sigers is list of Siger instance for  event
         """
-        dgkey = dgKey(serder.preb, serder.digb)
-        self.db.putDts(dgkey, helping.nowIso8601().encode("utf-8"))
-        self.db.putSigs(dgkey, [siger.qb64b for siger in sigers])
-        self.db.putEvt(dgkey, serder.raw)
-        self.db.addLde(snKey(serder.preb, serder.sn), serder.digb)
+        # all escrow writes in one transaction, each idempotent
+        self.db.putEscrowedEvt(db=self.db.ldes,
+                               dgkey=dgKey(serder.preb, serder.digb),
+                               snkey=snKey(serder.preb, serder.sn),
+                               dig=serder.digb,
+                               dts=helping.nowIso8601().encode("utf-8"),
+                               sigs=[siger.qb64b for siger in sigers],
+                               raw=serder.raw)
         # log duplicitous
         logger.info("Kevery process: escrowed likely duplicitous event=\n%s\n",
-                                            json.dumps(serder.ked, indent=1))
+                                            helping.Lazy(serder.pretty))
 
 
     def escrowUWReceipt(self, serder, wigers, dig):
@@ -3083,12 +3294,15 @@ class Kevery:
         # with different algos.  Can't lookup event by dig for same reason. Must
         # lookup last event by sn not by dig.
         self.db.putDts(dgKey(serder.preb, dig), helping.nowIso8601().encode("utf-8"))
+        edig = dig.encode("utf-8")
+        couples = []
         for wiger in wigers:  # escrow each couple
             # don't know witness pre yet without witness list so no verfer in wiger
             #if wiger.verfer.transferable:  # skip transferable verfers
                 #continue  # skip invalid triplets
-            couple = dig.encode("utf-8") + wiger.qb64b
-            self.db.addUwe(key=snKey(serder.preb, serder.sn), val=couple)
+            couples.append(edig + wiger.qb64b)
+        if couples:  # escrow all couples in one transaction
+            self.db.putUwes(key=snKey(serder.preb, serder.sn), vals=couples)
         # log escrowed
         logger.info("Kevery process: escrowed unverified witness indexed receipt"
                     " of pre= %s sn=%x dig=%s\n", serder.pre, serder.sn, dig)
@@ -3117,11 +3331,14 @@ class Kevery:
         # with different algos.  Can't lookup event by dig for same reason. Must
         # lookup last event by sn not by dig.
         self.db.putDts(dgKey(serder.preb, dig), helping.nowIso8601().encode("utf-8"))
+        edig = dig.encode("utf-8")
+        triples = []
         for cigar in cigars:  # escrow each triple
             if cigar.verfer.transferable:  # skip transferable verfers
                 continue  # skip invalid triplets
-            triple = dig.encode("utf-8") + cigar.verfer.qb64b + cigar.qb64b
-            self.db.addUre(key=snKey(serder.preb, serder.sn), val=triple)  # should be snKey
+            triples.append(edig + cigar.verfer.qb64b + cigar.qb64b)
+        if triples:  # escrow all triples in one transaction
+            self.db.putUres(key=snKey(serder.preb, serder.sn), vals=triples)
         # log escrowed
         logger.info("Kevery process: escrowed unverified receipt of pre= %s "
                      " sn=%x dig=%s\n", serder.pre, serder.sn, dig)
@@ -3157,20 +3374,22 @@ class Kevery:
         # and sig stored at kel pre, sn so can compare digs
         # with different algos.  Can't lookup by dig for the same reason. Must
         # lookup last event by sn not by dig.
+        self.db.putDts(dgKey(serder.preb, serder.digb), helping.nowIso8601().encode("utf-8"))
+        # since serder of of receipt not receipted event must use dig in
+        # serder.ked["d"] not serder.dig
+        edig = serder.ked["d"].encode("utf-8")
+        quintuples = []
         for tsg in tsgs:
             prefixer, seqner, diger, sigers = tsg
-            self.db.putDts(dgKey(serder.preb, serder.digb), helping.nowIso8601().encode("utf-8"))
-            # since serder of of receipt not receipted event must use dig in
-            # serder.ked["d"] not serder.dig
-            prelet = (serder.ked["d"].encode("utf-8") + prefixer.qb64b +
-                      seqner.qb64b + diger.qb64b)
+            prelet = b''.join((edig, prefixer.qb64b, seqner.qb64b, diger.qb64b))
             for siger in sigers:  # escrow each quintlet
-                quintuple = prelet + siger.qb64b  # quintuple
-                self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+                quintuples.append(prelet + siger.qb64b)  # quintuple
             # log escrowed
             logger.info("Kevery process: escrowed unverified transferable receipt "
                          "of pre=%s sn=%x dig=%s by pre=%s\n", serder.pre,
                              serder.sn, serder.ked["d"], prefixer.qb64)
+        if quintuples:  # escrow all quintuples in one transaction
+            self.db.putVres(key=snKey(serder.preb, serder.sn), vals=quintuples)
 
 
     def escrowTReceipts(self, serder, prefixer, seqner, diger, sigers):
@@ -3205,11 +3424,11 @@ class Kevery:
         self.db.putDts(dgKey(serder.preb, serder.digb), helping.nowIso8601().encode("utf-8"))
         # since serder of of receipt not receipted event must use dig in
         # serder.ked["d"] not serder.dig
-        prelet = (serder.ked["d"].encode("utf-8") + prefixer.qb64b +
-                  seqner.qb64b + diger.qb64b)
-        for siger in sigers:  # escrow each quintlet
-            quintuple = prelet + siger.qb64b  # quintuple
-            self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
+        prelet = b''.join((serder.ked["d"].encode("utf-8"), prefixer.qb64b,
+                           seqner.qb64b, diger.qb64b))
+        quintuples = [prelet + siger.qb64b for siger in sigers]  # each quintlet
+        if quintuples:  # escrow all quintuples in one transaction
+            self.db.putVres(key=snKey(serder.preb, serder.sn), vals=quintuples)
         # log escrowed
         logger.info("Kevery process: escrowed unverified transferable receipt "
                      "of pre=%s sn=%x dig=%s by pre=%s\n", serder.pre,
@@ -3241,8 +3460,8 @@ class Kevery:
         # with different algos.  Can't lookup by dig for the same reason. Must
         # lookup last event by sn not by dig.
         self.db.putDts(dgKey(serder.preb, serder.dig), helping.nowIso8601().encode("utf-8"))
-        quintuple = (serder.digb + sprefixer.qb64b + sseqner.qb64b +
-                     sdiger.qb64b + siger.qb64b)
+        quintuple = b''.join((serder.digb, sprefixer.qb64b, sseqner.qb64b,
+                              sdiger.qb64b, siger.qb64b))
         self.db.addVre(key=snKey(serder.preb, serder.sn), val=quintuple)
         # log escrowed
         logger.info("Kevery process: escrowed unverified transferabe validator "
@@ -3273,6 +3492,23 @@ class Kevery:
                 logger.error("Kevery escrow process error: %s\n", ex.args[0])
 
 
+    @staticmethod
+    def _staler(timeout):
+        """
+        Returns predicate of escrow datetime bytes, dtb, that is True when dtb
+        is stale, that is older than timeout seconds before now. Now is read
+        once so one predicate serves a whole escrow pass. All escrow passes
+        decide staleness with it either directly or via
+        Baser.getEscrowBundle(stale=...).
+
+        Parameters:
+            timeout is int or float seconds an escrow may wait before stale
+        """
+        dtsb = helping.toIso8601(helping.nowUTC() -
+                        datetime.timedelta(seconds=timeout)).encode("utf-8")
+        return functools.partial(staleIso8601, dtsb=dtsb)
+
+
     def processEscrowOutOfOrders(self):
         """
         Process events escrowed by Kever that are recieved out-of-order.
@@ -3311,99 +3547,105 @@ class Kevery:
                         If successful then remove from escrow table
         """
 
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, edig in self.db.getOoeItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(edig)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                 " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutOOE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                 " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
-                    if eraw is None:
-                        # no event so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event at."
-                                 "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt at dig = {}."
-                                              "".format(bytes(edig)))
-
-                    eserder = Serder(raw=bytes(eraw))  # escrowed event
-
-                    #  get sigs and attach
-                    sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
-                    if not sigs:  #  otherwise its a list of sigs
-                        # no sigs so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event sigs at."
-                                 "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt sigs at "
-                                              "dig = {}.".format(bytes(edig)))
-
-                    # process event
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in  sigs]
-                    self.processEvent(serder=eserder, sigers=sigers)
-
-                    # If process does NOT validate event with sigs, becasue it is
-                    # still out of order then process will attempt to re-escrow
-                    # and then raise OutOfOrderError (subclass of ValidationError)
-                    # so we can distinquish between ValidationErrors that are
-                    # re-escrow vs non re-escrow. We want process to be idempotent
-                    # with respect to processing events that result in escrow items.
-                    # On re-escrow attempt by process, Ooe escrow is called by
-                    # Kevery.self.escrowOOEvent Which calls
-                    # self.db.addOoe(snKey(pre, sn), serder.digb)
-                    # which in turn will not enter dig as dup if one already exists.
-                    # So re-escrow attempt will not change the escrowed ooe db.
-                    # Non re-escrow ValidationError means some other issue so unescrow.
-                    # No error at all means processed successfully so also unescrow.
-
-                except OutOfOrderError as ex:
-                    # still waiting on missing prior event to validate
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
-
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than out of order so remove from OO escrow
-                    self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
-
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delOoe(snKey(pre, sn), edig)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded in valid event: "
-                             "event=\n%s\n", json.dumps(eserder.ked, indent=1))
-
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey #  setup next while iteration, with key after ekey
+        stale = self._staler(self.TimeoutOOE)  # skips reads of stale escrows
+        # cursor walk reads bounded batches of escrow items and resumes after
+        # each batch so deleting escrow items between batches is safe
+        for items in self.db.getOoeItemsBatchIter(limit=self.UnescrowBatchSize):
+            unescrows = []  # escrow items to remove in one write transaction
+            try:
+                for item in items:  # item is (ekey, edig) tuple
+                    ekey, edig = item  # item itself is queued for removal so no new tuple
+
+                    # missing or stale escrow data unescrows and continues without
+                    # raising, only errors from parsing or processing the event raise
+                    try:
+                        pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                        # read all escrowed data for item in one transaction
+                        dgkey = dgKey(pre, edig)
+                        bundle = self.db.getEscrowBundle(dgkey, stale=stale,
+                                                         wigs=False, pde=False)
+                        # check date if expired then remove escrow.
+                        dtb = bundle.dts
+                        if dtb is None:  # othewise is a datetime as bytes
+                            # no date time so unescrow without raising
+                            logger.info("Kevery unescrow error: Missing event datetime"
+                                     " at dig = %s\n", edig)
+                            unescrows.append(item)  # remove escrow in batch below
+                            continue
+
+                        # stale per date math done by bundle read so discard
+                        if bundle.stale:
+                            # escrow stale so unescrow without raising
+                            logger.info("Kevery unescrow error: Stale event escrow "
+                                     " at dig = %s\n", edig)
+                            unescrows.append(item)  # remove escrow in batch below
+                            continue
+
+                        # get the escrowed event using edig
+                        eraw = bundle.evt
+                        if eraw is None:
+                            # no event so unescrow without raising
+                            logger.info("Kevery unescrow error: Missing event at."
+                                     "dig = %s\n", edig)
+                            unescrows.append(item)  # remove escrow in batch below
+                            continue
+
+                        eserder = self.memoSerder(dgkey, eraw)  # escrowed event parsed once
+
+                        #  get sigs and attach
+                        sigs = bundle.sigs
+                        if not sigs:  #  otherwise its a list of sigs
+                            # no sigs so unescrow without raising
+                            logger.info("Kevery unescrow error: Missing event sigs at."
+                                     "dig = %s\n", edig)
+                            unescrows.append(item)  # remove escrow in batch below
+                            continue
+
+                        # process event, sigers memoized so retries do not rebuild them
+                        sigers = self.memoSigers(sigs)
+                        self.processEvent(serder=eserder, sigers=sigers)
+
+                        # If process does NOT validate event with sigs, becasue it is
+                        # still out of order then process will attempt to re-escrow
+                        # and then raise OutOfOrderError (subclass of ValidationError)
+                        # so we can distinquish between ValidationErrors that are
+                        # re-escrow vs non re-escrow. We want process to be idempotent
+                        # with respect to processing events that result in escrow items.
+                        # On re-escrow attempt by process, Ooe escrow is called by
+                        # Kevery.self.escrowOOEvent Which calls
+                        # self.db.addOoe(snKey(pre, sn), serder.digb)
+                        # which in turn will not enter dig as dup if one already exists.
+                        # So re-escrow attempt will not change the escrowed ooe db.
+                        # Non re-escrow ValidationError means some other issue so unescrow.
+                        # No error at all means processed successfully so also unescrow.
+
+                    except OutOfOrderError as ex:
+                        # still waiting on missing prior event to validate
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                        else:
+                            logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+
+                    except Exception as ex:  # log diagnostics errors etc
+                        # error other than out of order so remove from OO escrow
+                        unescrows.append(item)  # remove escrow in batch below
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                        else:
+                            logger.error("Kevery unescrowed: %s\n", ex.args[0])
+
+                    else:  # unescrow succeeded, remove from escrow
+                        # We don't remove all escrows at pre,sn because some might be
+                        # duplicitous so we process remaining escrows in spite of found
+                        # valid event escrow.
+                        unescrows.append(item)  # remove escrow in batch below
+                        if logger.isEnabledFor(logging.INFO):  # skip log record when not emitted
+                            logger.info("Kevery unescrow succeeded in valid event: "
+                                     "event=\n%s\n", helping.Lazy(eserder.pretty))
 
+            finally:  # remove batch even if an exception escapes
+                if unescrows:
+                    self.db.delOoeItems(unescrows)
 
 
     def processEscrowPartialSigs(self):
@@ -3441,107 +3683,52 @@ class Kevery:
                         If successful then remove from escrow table
         """
 
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, edig in self.db.getPseItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    dgkey = dgKey(pre, bytes(edig))
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgkey)
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                 " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPSE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                 " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgkey)
-                    if eraw is None:
-                        # no event so so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event at."
-                                 "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt at dig = {}."
-                                              "".format(bytes(edig)))
-
-                    eserder = Serder(raw=bytes(eraw))  # escrowed event
-                    #  get sigs and attach
-                    sigs = self.db.getSigs(dgkey)
-                    if not sigs:  #  otherwise its a list of sigs
-                        # no sigs so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event sigs at."
-                                 "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt sigs at "
-                                              "dig = {}.".format(bytes(edig)))
-
-                    # seal source (delegator issuer if any)
-                    seqner = diger = None
-                    couple = self.db.getPde(dgkey)
-                    if couple is not None:
-                        seqner, diger = deSourceCouple(couple)
-
-                    # process event
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in  sigs]
-                    self.processEvent(serder=eserder, sigers=sigers,
-                                      seqner=seqner, diger=diger)
-
-                    # If process does NOT validate sigs or delegation seal (when delegated),
-                    # but there is still one valid signature then process will
-                    # attempt to re-escrow and then raise MissingSignatureError
-                    # or MissingDelegationSealError (subclass of ValidationError)
-                    # so we can distinquish between ValidationErrors that are
-                    # re-escrow vs non re-escrow. We want process to be idempotent
-                    # with respect to processing events that result in escrow items.
-                    # On re-escrow attempt by process, Pse escrow is called by
-                    # Kever.self.escrowPSEvent Which calls
-                    # self.db.addPse(snKey(pre, sn), serder.digb)
-                    # which in turn will not enter dig as dup if one already exists.
-                    # So re-escrow attempt will not change the escrowed pse db.
-                    # Non re-escrow ValidationError means some other issue so unescrow.
-                    # No error at all means processed successfully so also unescrow.
-
-                except (MissingSignatureError, MissingDelegationError) as ex:
-                    # still waiting on missing sigs or missing seal to validate
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
-
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than waiting on sigs or seal so remove from escrow
-                    self.db.delPse(snKey(pre, sn), edig)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
-
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delPse(snKey(pre, sn), edig)  # removes one escrow at key val
-                    self.db.delPde(dgkey)  # remove escrow if any
-                    logger.info("Kevery unescrow succeeded in valid event: "
-                             "event=\n%s\n", json.dumps(eserder.ked, indent=1))
-
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey #  setup next while iteration, with key after ekey
+        self._drainEscrow(EscrowSpec(items=self.db.getPseItemsBatchIter,
+                                     delItems=self.db.delPseItems,
+                                     timeout=self.TimeoutPSE,
+                                     keepExc=(MissingSignatureError,
+                                              MissingDelegationError),
+                                     process=self._processPseItem,
+                                     wigs=False,
+                                     pde=True))
+
+
+    def _processPseItem(self, eserder, bundle, dgkey):
+        """
+        Process escrowed partially signed or delegated event eserder with
+        escrowed data bundle. Raises re-escrow exception when still waiting.
+
+        Parameters:
+            eserder is Serder instance of escrowed event
+            bundle is EscrowBundle of escrowed event data
+            dgkey is bytes database key of escrowed event
+        """
+        # seal source (delegator issuer if any)
+        seqner = diger = None
+        couple = bundle.pde
+        if couple is not None:
+            seqner, diger = deSourceCouple(couple)
+
+        # process event
+        sigers = self.memoSigers(bundle.sigs)
+        self.processEvent(serder=eserder, sigers=sigers,
+                          seqner=seqner, diger=diger)
+
+        # If process does NOT validate sigs or delegation seal (when delegated),
+        # but there is still one valid signature then process will
+        # attempt to re-escrow and then raise MissingSignatureError
+        # or MissingDelegationSealError (subclass of ValidationError)
+        # so we can distinquish between ValidationErrors that are
+        # re-escrow vs non re-escrow. We want process to be idempotent
+        # with respect to processing events that result in escrow items.
+        # On re-escrow attempt by process, Pse escrow is called by
+        # Kever.self.escrowPSEvent Which calls
+        # self.db.addPse(snKey(pre, sn), serder.digb)
+        # which in turn will not enter dig as dup if one already exists.
+        # So re-escrow attempt will not change the escrowed pse db.
+        # Non re-escrow ValidationError means some other issue so unescrow.
+        # No error at all means processed successfully so also unescrow.
+        self.db.delPde(dgkey)  # remove escrow if any
 
 
     def processEscrowPartialWigs(self):
@@ -3581,116 +3768,60 @@ class Kevery:
                         If successful then remove from escrow table
         """
 
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, edig in self.db.getPweItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(edig)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                 " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPWE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                 " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
-                    if eraw is None:
-                        # no event so so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event at."
-                                 "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt at dig = {}."
-                                              "".format(bytes(edig)))
-
-                    eserder = Serder(raw=bytes(eraw))  # escrowed event
-
-                    #  get sigs
-                    sigs = self.db.getSigs(dgKey(pre, bytes(edig)))  # list of sigs
-                    if not sigs:  # empty list
-                        # no sigs so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event sigs at."
-                                 "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt sigs at "
-                                              "dig = {}.".format(bytes(edig)))
-
-                    #  get wigs
-                    wigs = self.db.getWigs(dgKey(pre, bytes(edig)))  # list of wigs
-
-                    if not wigs:  # empty list
-                        # wigs maybe empty while waiting for first witness signature
-                        # which may not arrive until some time after event is fully signed
-                        # so just log for debugging but do not unescrow by raising
-                        # ValidationError
-                        logger.info("Kevery unescrow wigs: No event wigs yet at."
-                                 "dig = %s\n", bytes(edig))
-
-                        #raise ValidationError("Missing escrowed evt wigs at "
-                                              #"dig = {}.".format(bytes(edig)))
-
-                    # process event
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
-                    wigers = [Siger(qb64b=bytes(wig)) for wig in wigs]
-                    self.processEvent(serder=eserder, sigers=sigers, wigers=wigers)
-
-                    # If process does NOT validate wigs then process will attempt
-                    # to re-escrow and then raise MissingWitnessSignatureError
-                    # (subclass of ValidationError)
-                    # so we can distinquish between ValidationErrors that are
-                    # re-escrow vs non re-escrow. We want process to be idempotent
-                    # with respect to processing events that result in escrow items.
-                    # On re-escrow attempt by process, Pwe escrow is called by
-                    # Kever.self.escrowPWEvent Which calls
-                    # self.db.addPwe(snKey(pre, sn), serder.digb)
-                    # which in turn will NOT enter dig as dup if one already exists.
-                    # So re-escrow attempt will not change the escrowed pwe db.
-                    # Non re-escrow ValidationError means some other issue so unescrow.
-                    # No error at all means processed successfully so also unescrow.
-                    # Assumes that controller signature validation and delegation
-                    # validation will be successful as event would not be in
-                    # partially witnessed escrow unless they had already validated
-
-                except MissingWitnessSignatureError as ex:
-                    # still waiting on missing witness sigs
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
-
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than waiting on sigs or seal so remove from escrow
-                    self.db.delPwe(snKey(pre, sn), edig)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
-
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delPwe(snKey(pre, sn), edig)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded in valid event: "
-                             "event=\n%s\n", json.dumps(eserder.ked, indent=1))
-
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey #  setup next while iteration, with key after ekey
+        self._drainEscrow(EscrowSpec(items=self.db.getPweItemsBatchIter,
+                                     delItems=self.db.delPweItems,
+                                     timeout=self.TimeoutPWE,
+                                     keepExc=(MissingWitnessSignatureError, ),
+                                     process=self._processPweItem,
+                                     wigs=True,
+                                     pde=False))
+
+
+    def _processPweItem(self, eserder, bundle, dgkey):
+        """
+        Process escrowed partially witnessed event eserder with escrowed data
+        bundle. Raises re-escrow exception when still waiting.
+
+        Parameters:
+            eserder is Serder instance of escrowed event
+            bundle is EscrowBundle of escrowed event data
+            dgkey is bytes database key of escrowed event
+        """
+        #  get wigs
+        wigs = bundle.wigs  # list of wigs
+
+        if not wigs:  # empty list
+            # wigs maybe empty while waiting for first witness signature
+            # which may not arrive until some time after event is fully signed
+            # so just log for debugging but do not unescrow by raising
+            # ValidationError
+            logger.info("Kevery unescrow wigs: No event wigs yet at."
+                     "dig = %s\n", eserder.digb)
+
+            #raise ValidationError("Missing escrowed evt wigs at "
+                                  #"dig = {}.".format(edig))
+
+        # process event
+        sigers = self.memoSigers(bundle.sigs)
+        wigers = self.memoSigers(wigs)
+        self.processEvent(serder=eserder, sigers=sigers, wigers=wigers)
+
+        # If process does NOT validate wigs then process will attempt
+        # to re-escrow and then raise MissingWitnessSignatureError
+        # (subclass of ValidationError)
+        # so we can distinquish between ValidationErrors that are
+        # re-escrow vs non re-escrow. We want process to be idempotent
+        # with respect to processing events that result in escrow items.
+        # On re-escrow attempt by process, Pwe escrow is called by
+        # Kever.self.escrowPWEvent Which calls
+        # self.db.addPwe(snKey(pre, sn), serder.digb)
+        # which in turn will NOT enter dig as dup if one already exists.
+        # So re-escrow attempt will not change the escrowed pwe db.
+        # Non re-escrow ValidationError means some other issue so unescrow.
+        # No error at all means processed successfully so also unescrow.
+        # Assumes that controller signature validation and delegation
+        # validation will be successful as event would not be in
+        # partially witnessed escrow unless they had already validated
 
 
     def processEscrowDuplicitous(self):
@@ -3729,97 +3860,140 @@ class Kevery:
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
         """
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, edig in self.db.getLdeItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(edig)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                 " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutLDE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                 " at dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(bytes(edig)))
-
-                    # get the escrowed event using edig
-                    eraw = self.db.getEvt(dgKey(pre, bytes(edig)))
-                    if eraw is None:
-                        # no event so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event at."
-                                 "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt at dig = {}."
-                                              "".format(bytes(edig)))
-
-                    eserder = Serder(raw=bytes(eraw))  # escrowed event
-
-                    #  get sigs and attach
-                    sigs = self.db.getSigs(dgKey(pre, bytes(edig)))
-                    if not sigs:  #  otherwise its a list of sigs
-                        # no sigs so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event sigs at."
-                                 "dig = %s\n", bytes(edig))
-
-                        raise ValidationError("Missing escrowed evt sigs at "
-                                              "dig = {}.".format(bytes(edig)))
-
-                    sigers = [Siger(qb64b=bytes(sig)) for sig in sigs]
-                    self.processEvent(serder=eserder, sigers=sigers)
-
-                    # If process does NOT validate event with sigs, becasue it is
-                    # still out of order then process will attempt to re-escrow
-                    # and then raise OutOfOrderError (subclass of ValidationError)
-                    # so we can distinquish between ValidationErrors that are
-                    # re-escrow vs non re-escrow. We want process to be idempotent
-                    # with respect to processing events that result in escrow items.
-                    # On re-escrow attempt by process, Ooe escrow is called by
-                    # Kevery.self.escrowOOEvent Which calls
-                    # self.db.addOoe(snKey(pre, sn), serder.digb)
-                    # which in turn will not enter dig as dup if one already exists.
-                    # So re-escrow attempt will not change the escrowed ooe db.
-                    # Non re-escrow ValidationError means some other issue so unescrow.
-                    # No error at all means processed successfully so also unescrow.
-
-                except LikelyDuplicitousError as ex:
-                    # still can't determine if duplicitous
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
-
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than likely duplicitous so remove from escrow
-                    self.db.delLde(snKey(pre, sn), edig)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
-
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delLde(snKey(pre, sn), edig)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded in valid event: "
-                             "event=\n%s\n", json.dumps(eserder.ked, indent=1))
-
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey #  setup next while iteration, with key after ekey
+        self._drainEscrow(EscrowSpec(items=self.db.getLdeItemsBatchIter,
+                                     delItems=self.db.delLdeItems,
+                                     timeout=self.TimeoutLDE,
+                                     keepExc=(LikelyDuplicitousError, ),
+                                     process=self._processLdeItem,
+                                     wigs=False,
+                                     pde=False))
+
+
+    def _processLdeItem(self, eserder, bundle, dgkey):
+        """
+        Process escrowed likely duplicitous event eserder with escrowed data
+        bundle. Raises re-escrow exception when still undetermined.
+
+        Parameters:
+            eserder is Serder instance of escrowed event
+            bundle is EscrowBundle of escrowed event data
+            dgkey is bytes database key of escrowed event
+        """
+        sigers = self.memoSigers(bundle.sigs)
+        self.processEvent(serder=eserder, sigers=sigers)
+
+        # If process does NOT validate event with sigs, becasue it is
+        # still out of order then process will attempt to re-escrow
+        # and then raise OutOfOrderError (subclass of ValidationError)
+        # so we can distinquish between ValidationErrors that are
+        # re-escrow vs non re-escrow. We want process to be idempotent
+        # with respect to processing events that result in escrow items.
+        # On re-escrow attempt by process, Ooe escrow is called by
+        # Kevery.self.escrowOOEvent Which calls
+        # self.db.addOoe(snKey(pre, sn), serder.digb)
+        # which in turn will not enter dig as dup if one already exists.
+        # So re-escrow attempt will not change the escrowed ooe db.
+        # Non re-escrow ValidationError means some other issue so unescrow.
+        # No error at all means processed successfully so also unescrow.
+
+
+    def _drainEscrow(self, spec):
+        """
+        Drain one escrow table described by spec. Shared driver for the
+        partial signature, partial witness, and likely duplicitous escrows.
+
+        Walks escrow items in FIFO order at each prefix,sn. Unescrows items
+        with missing or stale escrowed data, items whose processing succeeds,
+        and items whose processing raises anything other than spec.keepExc.
+        Items are read and removals written in batches of .UnescrowBatchSize.
+
+        Parameters:
+            spec is EscrowSpec of escrow table specific callbacks
+        """
+        stale = self._staler(spec.timeout)  # skips reads of stale escrows
+        delItems, keepExc, process = spec.delItems, spec.keepExc, spec.process
+        # cursor walk reads bounded batches of escrow items and resumes after
+        # each batch so deleting escrow items between batches is safe
+        for items in spec.items(limit=self.UnescrowBatchSize):
+            unescrows = []  # escrow items to remove in one write transaction
+            try:
+                for item in items:  # item is (ekey, edig) tuple
+                    ekey, edig = item  # item itself is queued for removal so no new tuple
+
+                    try:
+                        pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                        dgkey = dgKey(pre, edig)
+                        # read all escrowed data for item in one transaction
+                        bundle = self.db.getEscrowBundle(dgkey, stale=stale,
+                                                         wigs=spec.wigs, pde=spec.pde)
+                        # check date if expired then remove escrow.
+                        dtb = bundle.dts
+                        if dtb is None:  # othewise is a datetime as bytes
+                            # no date time so raise ValidationError which unescrows below
+                            logger.info("Kevery unescrow error: Missing event datetime"
+                                     " at dig = %s\n", edig)
+
+                            raise ValidationError("Missing escrowed event datetime "
+                                                  "at dig = {}.".format(edig))
+
+                        # stale per date math done by bundle read so discard
+                        if bundle.stale:
+                            # escrow stale so raise ValidationError which unescrows below
+                            logger.info("Kevery unescrow error: Stale event escrow "
+                                     " at dig = %s\n", edig)
+
+                            raise ValidationError("Stale event escrow "
+                                                  "at dig = {}.".format(edig))
+
+                        # get the escrowed event using edig
+                        eraw = bundle.evt
+                        if eraw is None:
+                            # no event so raise ValidationError which unescrows below
+                            logger.info("Kevery unescrow error: Missing event at."
+                                     "dig = %s\n", edig)
+
+                            raise ValidationError("Missing escrowed evt at dig = {}."
+                                                  "".format(edig))
+
+                        eserder = self.memoSerder(dgkey, eraw)  # escrowed event parsed once
+                        #  get sigs and attach
+                        if not bundle.sigs:  #  otherwise its a list of sigs
+                            # no sigs so raise ValidationError which unescrows below
+                            logger.info("Kevery unescrow error: Missing event sigs at."
+                                     "dig = %s\n", edig)
+
+                            raise ValidationError("Missing escrowed evt sigs at "
+                                                  "dig = {}.".format(edig))
+
+                        process(eserder, bundle, dgkey)  # raises keepExc to re-escrow
+
+                    except keepExc as ex:
+                        # still waiting so keep in escrow
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                        else:
+                            logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+
+                    except Exception as ex:  # log diagnostics errors etc
+                        # error other than still waiting so remove from escrow
+                        unescrows.append(item)  # remove escrow in batch below
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                        else:
+                            logger.error("Kevery unescrowed: %s\n", ex.args[0])
+
+                    else:  # unescrow succeeded, remove from escrow
+                        # We don't remove all escrows at pre,sn because some might be
+                        # duplicitous so we process remaining escrows in spite of found
+                        # valid event escrow.
+                        unescrows.append(item)  # remove escrow in batch below
+                        if logger.isEnabledFor(logging.INFO):  # skip log record when not emitted
+                            logger.info("Kevery unescrow succeeded in valid event: "
+                                     "event=\n%s\n", helping.Lazy(eserder.pretty))
+
+            finally:  # remove batch even if an exception escapes
+                if unescrows:
+                    delItems(unescrows)
 
 
     def processEscrowUnverWitness(self):
@@ -3871,147 +4045,168 @@ class Kevery:
                         If successful then remove from escrow table
         """
 
+        stale = self._staler(self.TimeoutUWE)  # one stale boundary for this pass
         ims = bytearray()
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, ecouple in self.db.getUweItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow db key
-                    ediger, wiger = deWitnessCouple(ecouple)  #  escrow diger wiger
-
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(ediger.qb64b)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                 " at dig = %s\n", ediger.qb64b)
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(ediger.qb64b))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutUWE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                 " at dig = %s\n", ediger.qb64b)
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(ediger.qb64b))
-
-                    # lookup database dig of the receipted event in pwes escrow
-                    # using pre and sn lastEvt
-                    snkey = snKey(pre, sn)
-                    found = False
-                    for raw in self.db.getPwesIter(key=snkey):  # search entries
-                        dig = bytes(raw)  # database dig of receipted event
-                        raw = self.db.getEvt(dgKey(pre, dig))  # get the escrowed event using dig
-                        serder = Serder(raw=bytes(raw))  # receipted event
-                        #  compare digs
-                        if not ediger.compare(ser=serder.raw, dig=dig):
-                            continue  # not match keep looking
-
-                        # assign verfers from witness list
-                        if serder.ked['t'] in (Ilks.icp, Ilks.dip):  # inceptiom
-                            wits = serder.ked['b']  # get wits from event itself
-                            if len(oset(wits)) != len(wits):
-                                raise ValidationError("Invalid wits = {}, has duplicates for evt = {}."
-                                                 "".format(wits, serder.ked))
-
-                        elif serder.ked['t'] in (Ilks.rot, Ilks.drt):  # rotation
-                            # calculate wits from rotation and kever key state.
-                            wits = self.kevers[serder.pre].wits  # get wits from key state
-                            cuts = serder.ked['br']
-                            adds = serder.ked['ba']
-                            witset = oset(wits)
-                            cutset = oset(cuts)
-                            addset = oset(adds)
-                            if len(cutset) != len(cuts):
-                                raise ValidationError("Invalid cuts = {}, has duplicates for evt = "
-                                                 "{}.".format(cuts, serder.ked))
-
-                            if (witset & cutset) != cutset:  #  some cuts not in wits
-                                raise ValidationError("Invalid cuts = {}, not all members in wits"
-                                                 " for evt = {}.".format(cuts, serder.ked))
-
-                            if len(addset) != len(adds):
-                                raise ValidationError("Invalid adds = {}, has duplicates for evt = "
-                                                 "{}.".format(adds, serder.ked))
-
-                            if cutset & addset:  # non empty intersection
-                                raise ValidationError("Intersecting cuts = {} and  adds = {} for "
-                                                 "evt = {}.".format(cuts, adds, serder.ked))
-
-                            if witset & addset:  # non empty intersection
-                                raise ValidationError("Intersecting wits = {} and  adds = {} for "
-                                                 "evt = {}.".format(self.wits, adds, serder.ked))
-
-                            wits = list((witset - cutset) | addset)
-
-                        else:  # interaction so get wits from kever key state
-                            # would not be in this escrow if out of order event
-                            wits = self.kevers[serder.pre].wits  # get wits fromkey state
-
-                        if wiger.index >= len(wits):  # bad index
-                            # raise ValidationError which removes from escrow below
-                            logger.info("Kevery unescrow error: Bad witness receipt"
-                               " index=%i for pre=%s sn=%x\n", wiger.index, pre, sn)
-
-                            raise ValidationError("Bad escrowed witness receipt "
-                                              "index={} at pre={} sn={:x}."
-                                              "".format(wiger.index, pre, sn))
-
-                        wiger.verfer = Verfer(qb64=wits[wiger.index])
-                        if not wiger.verfer.verify(wiger.raw, serder.raw): # not verify
-                            # raise ValidationError which unescrows below
-                            logger.info("Kevery unescrow error: Bad witness receipt"
-                                     " wig. pre=%s sn=%x\n", pre, sn)
-
-                            raise ValidationError("Bad escrowed witness receipt wig"
-                                                  " at pre={} sn={:x}."
-                                                  "".format( pre, sn))
-
-                        # write receipt wig to database
-                        self.db.addWig(key=dgKey(pre, serder.dig), val=wiger.qb64b)
-                        found = True
-                        break  # done with search will unescrow below
-
-                    if not found:  # no partial witness escrow of event found
-                        # so keep in escrow by raising UnverifiedWitnessReceiptError
-                        logger.info("Kevery unescrow error: Missing witness "
-                                 "receipted evt at pre=%s sn=%x\n", (pre, sn))
-
-                        raise UnverifiedWitnessReceiptError("Missing witness "
-                            "receipted evt at pre={}  sn={:x}".format(pre, sn))
-
-                except UnverifiedWitnessReceiptError as ex:
-                    # still waiting on missing prior event to validate
-                    # only happens if we process above
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
-
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than out of order so remove from OO escrow
-                    self.db.delUwe(snKey(pre, sn), ecouple)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
-
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delUwe(snKey(pre, sn), ecouple)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded for event=\n%s\n",
-                                json.dumps(serder.ked, indent=1))
-
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey #  setup next while iteration, with key after ekey
+        dtss = {}  # escrow datetimes by dgkey fetched once per pass for dup receipts
+        # bounded batches so deletes between batches are safe
+        for items in self.db.getUweItemsBatchIter(limit=self.UnescrowBatchSize):
+            unescrows = []  # escrow items to remove in one write transaction
+            try:
+                for item in items:
+                    ekey, ecouple = item  # item itself is queued for removal so no new tuple
+
+                    try:
+                        pre, sn = splitKeySN(ekey)  # get pre and sn from escrow db key
+                        snkey = snKey(pre, sn)  # reused for reads and unescrow
+                        ediger, wiger = deWitnessCouple(ecouple)  #  escrow diger wiger
+
+                        # check date if expired then remove escrow.
+                        edgkey = dgKey(pre, ediger.qb64b)
+                        if edgkey not in dtss:  # first escrow for this event this pass
+                            dtb = self.db.getDts(edgkey)
+                            dtss[edgkey] = bytes(dtb) if dtb is not None else None
+                        dtb = dtss[edgkey]
+                        if dtb is None:  # othewise is a datetime as bytes
+                            # no date time so unescrow without raising
+                            logger.info("Kevery unescrow error: Missing event datetime"
+                                     " at dig = %s\n", ediger.qb64b)
+                            unescrows.append(item)  # remove escrow in batch below
+                            continue
+
+                        # do date math here and discard if stale nowIso8601() bytes
+                        if stale(dtb):
+                            # escrow stale so unescrow without raising
+                            logger.info("Kevery unescrow error: Stale event escrow "
+                                     " at dig = %s\n", ediger.qb64b)
+                            unescrows.append(item)  # remove escrow in batch below
+                            continue
+
+                        # lookup database dig of the receipted event in pwes escrow
+                        # using pre and sn lastEvt
+                        found = False
+                        digs = [bytes(raw) for raw in self.db.getPwes(key=snkey)]
+                        if ediger.qb64b in digs:  # only escrowed event at dig can match
+                            digs = [ediger.qb64b]  # so skip fetching and parsing others
+                        for dig in digs:  # search entries, dig is database dig of receipted event
+                            dgkey = dgKey(pre, dig)  # reused for event lookup and wig write
+                            raw = self.db.getEvt(dgkey)  # get the escrowed event using dig
+                            if raw is None:  # escrowed event gone so do not use memoized
+                                logger.info("Kevery unescrow error: Invalid witness "
+                                         "receipted event reference at pre=%s sn=%x\n", pre, sn)
+
+                                raise ValidationError("Invalid witness receipted evt "
+                                                      "reference at pre={} sn={:x}"
+                                                      "".format(pre, sn))
+
+                            serder = self.memoSerder(dgkey, raw)  # receipted event
+                            #  compare digs
+                            if not ediger.compare(ser=serder.raw, dig=dig):
+                                continue  # not match keep looking
+
+                            # assign verfers from witness list
+                            if serder.ked['t'] in (Ilks.icp, Ilks.dip):  # inceptiom
+                                wits = serder.ked['b']  # get wits from event itself
+                                if len(set(wits)) != len(wits):
+                                    raise ValidationError("Invalid wits = {}, has duplicates for evt = {}."
+                                                     "".format(wits, serder.ked))
+
+                            elif serder.ked['t'] in (Ilks.rot, Ilks.drt):  # rotation
+                                # calculate wits from rotation and kever key state.
+                                wits = self.kevers[serder.pre].wits  # get wits from key state
+                                cuts = serder.ked['br']
+                                adds = serder.ked['ba']
+                                cutset = set(cuts)
+                                addset = set(adds)
+                                if len(cutset) != len(cuts):
+                                    raise ValidationError("Invalid cuts = {}, has duplicates for evt = "
+                                                     "{}.".format(cuts, serder.ked))
+
+                                if not cutset.issubset(wits):  #  some cuts not in wits
+                                    raise ValidationError("Invalid cuts = {}, not all members in wits"
+                                                     " for evt = {}.".format(cuts, serder.ked))
+
+                                if len(addset) != len(adds):
+                                    raise ValidationError("Invalid adds = {}, has duplicates for evt = "
+                                                     "{}.".format(adds, serder.ked))
+
+                                if not cutset.isdisjoint(addset):  # non empty intersection
+                                    raise ValidationError("Intersecting cuts = {} and  adds = {} for "
+                                                     "evt = {}.".format(cuts, adds, serder.ked))
+
+                                if not addset.isdisjoint(wits):  # non empty intersection
+                                    raise ValidationError("Intersecting wits = {} and  adds = {} for "
+                                                     "evt = {}.".format(wits, adds, serder.ked))
+
+                                wits = [wit for wit in wits if wit not in cutset] + list(adds)
+
+                            else:  # interaction so get wits from kever key state
+                                # would not be in this escrow if out of order event
+                                wits = self.kevers[serder.pre].wits  # get wits fromkey state
+
+                            if wiger.index >= len(wits):  # bad index
+                                # raise ValidationError which removes from escrow below
+                                logger.info("Kevery unescrow error: Bad witness receipt"
+                                   " index=%i for pre=%s sn=%x\n", wiger.index, pre, sn)
+
+                                raise ValidationError("Bad escrowed witness receipt "
+                                                  "index={} at pre={} sn={:x}."
+                                                  "".format(wiger.index, pre, sn))
+
+                            kever = self.kevers.get(serder.pre)
+                            if kever is not None and wits is kever.wits:  # current wits
+                                wiger.verfer = kever.werfers[wiger.index]  # memoized
+                            else:
+                                wiger.verfer = Verfer(qb64=wits[wiger.index])
+                            # same wig already stored was verified before so skip verify
+                            if not self.db.hasWig(dgkey, wiger.qb64b):
+                                if not wiger.verfer.verify(wiger.raw, serder.raw): # not verify
+                                    # raise ValidationError which unescrows below
+                                    logger.info("Kevery unescrow error: Bad witness receipt"
+                                             " wig. pre=%s sn=%x\n", pre, sn)
+
+                                    raise ValidationError("Bad escrowed witness receipt wig"
+                                                          " at pre={} sn={:x}."
+                                                          "".format( pre, sn))
+
+                                # write receipt wig to database
+                                self.db.addWig(key=dgkey, val=wiger.qb64b)
+                            found = True
+                            break  # done with search will unescrow below
+
+                        if not found:  # no partial witness escrow of event found
+                            # so keep in escrow without raising
+                            logger.info("Kevery unescrow error: Missing witness "
+                                     "receipted evt at pre=%s sn=%x\n", (pre, sn))
+                            continue
+
+                    except UnverifiedWitnessReceiptError as ex:
+                        # still waiting on missing prior event to validate
+                        # only happens if we process above
+                        if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                            logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                        else:
+                            logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+
+                    except Exception as ex:  # log diagnostics errors etc
+                        # error other than out of order so remove from OO escrow
+                        unescrows.append(item)  # remove escrow in batch below
+                        if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                            logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                        else:
+                            logger.error("Kevery unescrowed: %s\n", ex.args[0])
+
+                    else:  # unescrow succeeded, remove from escrow
+                        # We don't remove all escrows at pre,sn because some might be
+                        # duplicitous so we process remaining escrows in spite of found
+                        # valid event escrow.
+                        unescrows.append(item)  # remove escrow in batch below
+                        if logger.isEnabledFor(logging.INFO):  # skip log record when not emitted
+                            logger.info("Kevery unescrow succeeded for event=\n%s\n",
+                                        helping.Lazy(serder.pretty))
+
+            finally:  # remove batch even if an exception escapes
+                if unescrows:
+                    self.db.delUweItems(unescrows)
 
 
     def processEscrowUnverNonTrans(self):
@@ -4061,116 +4256,134 @@ class Kevery:
                         If successful then remove from escrow table
         """
 
+        stale = self._staler(self.TimeoutURE)  # one stale boundary for this pass
         ims = bytearray()
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, etriplet in self.db.getUreItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    ediger, sprefixer, cigar = deReceiptTriple(etriplet)
-
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(ediger.qb64b)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                 " at dig = %s\n", ediger.qb64b)
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(ediger.qb64b))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutURE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                 " at dig = %s\n", ediger.qb64b)
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(ediger.qb64b))
-
-                    # get dig of the receipted event using pre and sn lastEvt
-                    raw = self.db.getKeLast(snKey(pre, sn))
-                    if raw is None:
-                        # no event so keep in escrow
-                        logger.info("Kevery unescrow error: Missing receipted "
-                                 "event at pre=%s sn=%x\n", (pre, sn))
-
-                        raise UnverifiedReceiptError("Missing receipted evt at pre={} "
-                                              " sn={:x}".format(pre, sn))
-
-                    dig = bytes(raw)
-                    # get receipted event using pre and edig
-                    raw = self.db.getEvt(dgKey(pre, dig))
-                    if raw is None:  # receipted event superseded so remove from escrow
-                        logger.info("Kevery unescrow error: Invalid receipted "
-                                 "event refereance at pre=%s sn=%x\n", pre, sn)
-
-                        raise ValidationError("Invalid receipted evt reference"
-                                          " at pre={} sn={:x}".format(pre, sn))
-
-                    serder = Serder(raw=bytes(raw))  # receipted event
-
-                    #  compare digs
-                    if not ediger.compare(ser=serder.raw, diger=ediger):
-                        logger.info("Kevery unescrow error: Bad receipt dig."
-                             "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
-
-                        raise ValidationError("Bad escrowed receipt dig at "
-                                          "pre={} sn={:x} receipter={}."
-                                          "".format( pre, sn, sprefixer.qb64))
-
-                    #  verify sig verfer key is prefixer from triple
-                    cigar.verfer = Verfer(qb64b=sprefixer.qb64b)
-                    if not cigar.verfer.verify(cigar.raw, serder.raw):
-                        # no sigs so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Bad receipt sig."
+        dtss = {}  # escrow datetimes by dgkey fetched once per pass for dup receipts
+        # bounded batches so deletes between batches are safe
+        for items in self.db.getUreItemsBatchIter(limit=self.UnescrowBatchSize):
+            unescrows = []  # escrow items to remove in one write transaction
+            # last event digs by snkey fetched once per batch, escrowed keys in one txn
+            lasts = self.db.getKeLasts(dict.fromkeys(ekey for ekey, _ in items))
+            try:
+                for item in items:
+                    ekey, etriplet = item  # item itself is queued for removal so no new tuple
+
+                    try:
+                        pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                        snkey = snKey(pre, sn)  # reused for reads and unescrow
+                        ediger, sprefixer, cigar = deReceiptTriple(etriplet)
+
+                        # check date if expired then remove escrow.
+                        edgkey = dgKey(pre, ediger.qb64b)
+                        if edgkey not in dtss:  # first escrow for this event this pass
+                            dtb = self.db.getDts(edgkey)
+                            dtss[edgkey] = bytes(dtb) if dtb is not None else None
+                        dtb = dtss[edgkey]
+                        if dtb is None:  # othewise is a datetime as bytes
+                            # no date time so unescrow without raising
+                            logger.info("Kevery unescrow error: Missing event datetime"
+                                     " at dig = %s\n", ediger.qb64b)
+                            unescrows.append(item)  # remove escrow in batch below
+                            continue
+
+                        # do date math here and discard if stale nowIso8601() bytes
+                        if stale(dtb):
+                            # escrow stale so unescrow without raising
+                            logger.info("Kevery unescrow error: Stale event escrow "
+                                     " at dig = %s\n", ediger.qb64b)
+                            unescrows.append(item)  # remove escrow in batch below
+                            continue
+
+                        # get dig of the receipted event using pre and sn lastEvt
+                        if snkey not in lasts:  # not prefetched with escrowed keys
+                            raw = self.db.getKeLast(snkey)
+                            lasts[snkey] = bytes(raw) if raw is not None else None
+                        raw = lasts[snkey]
+                        if raw is None:
+                            # no event so keep in escrow without raising
+                            logger.info("Kevery unescrow error: Missing receipted "
+                                     "event at pre=%s sn=%x\n", (pre, sn))
+                            continue
+
+                        dig = bytes(raw)
+                        dgkey = dgKey(pre, dig)  # reused for event lookup and receipt write
+                        # get receipted event using pre and edig
+                        raw = self.db.getEvt(dgkey)
+                        if raw is None:  # receipted event superseded so remove from escrow
+                            logger.info("Kevery unescrow error: Invalid receipted "
+                                     "event refereance at pre=%s sn=%x\n", pre, sn)
+
+                            raise ValidationError("Invalid receipted evt reference"
+                                              " at pre={} sn={:x}".format(pre, sn))
+
+                        serder = self.memoSerder(dgkey, raw)  # receipted event
+
+                        #  compare digs
+                        if not ediger.compare(ser=serder.raw, diger=ediger):
+                            logger.info("Kevery unescrow error: Bad receipt dig."
                                  "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
 
-                        raise ValidationError("Bad escrowed receipt sig at "
+                            raise ValidationError("Bad escrowed receipt dig at "
                                               "pre={} sn={:x} receipter={}."
                                               "".format( pre, sn, sprefixer.qb64))
 
-                    kever = self.kevers[serder.pre]  # get key state to check if witness
-                    rpre = cigar.verfer.qb64  # prefix of receiptor
-                    if rpre in kever.wits:  # its a witness receipt
-                        index = kever.wits.index(rpre)
-                        # create witness indexed signature and write to db
-                        wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
-                        self.db.addWig(key=dgKey(pre, serder.dig), val=wiger.qb64b)
-                    else:  # write receipt couple to database
-                        couple = cigar.verfer.qb64b + cigar.qb64b
-                        self.db.addRct(key=dgKey(pre, serder.dig), val=couple)
-
-
-                except UnverifiedReceiptError as ex:
-                    # still waiting on missing prior event to validate
-                    # only happens if we process above
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
-
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than out of order so remove from OO escrow
-                    self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
-
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delUre(snKey(pre, sn), etriplet)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded for event=\n%s\n",
-                                json.dumps(serder.ked, indent=1))
-
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey #  setup next while iteration, with key after ekey
+                        # verfer key is prefixer from triple
+                        cigar.verfer = Verfer(qb64b=sprefixer.qb64b)
+                        kever = self.kevers[serder.pre]  # get key state to check if witness
+                        rpre = cigar.verfer.qb64  # prefix of receiptor
+                        index = kever.witIndex(rpre)
+                        if index is not None:  # its a witness receipt
+                            # create witness indexed signature
+                            wiger = Siger(raw=cigar.raw, index=index, verfer=cigar.verfer)
+                            stored = self.db.hasWig(dgkey, wiger.qb64b)
+                        else:  # receipt couple
+                            couple = cigar.verfer.qb64b + cigar.qb64b
+                            stored = self.db.hasRct(dgkey, couple)
+
+                        if not stored:  # same receipt already stored was verified before
+                            if not cigar.verfer.verify(cigar.raw, serder.raw):
+                                # no sigs so raise ValidationError which unescrows below
+                                logger.info("Kevery unescrow error: Bad receipt sig."
+                                         "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
+
+                                raise ValidationError("Bad escrowed receipt sig at "
+                                                      "pre={} sn={:x} receipter={}."
+                                                      "".format( pre, sn, sprefixer.qb64))
+
+                            if index is not None:  # write witness indexed signature to db
+                                self.db.addWig(key=dgkey, val=wiger.qb64b)
+                            else:  # write receipt couple to database
+                                self.db.addRct(key=dgkey, val=couple)
+
+
+                    except UnverifiedReceiptError as ex:
+                        # still waiting on missing prior event to validate
+                        # only happens if we process above
+                        if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                            logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                        else:
+                            logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+
+                    except Exception as ex:  # log diagnostics errors etc
+                        # error other than out of order so remove from OO escrow
+                        unescrows.append(item)  # remove escrow in batch below
+                        if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                            logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                        else:
+                            logger.error("Kevery unescrowed: %s\n", ex.args[0])
+
+                    else:  # unescrow succeeded, remove from escrow
+                        # We don't remove all escrows at pre,sn because some might be
+                        # duplicitous so we process remaining escrows in spite of found
+                        # valid event escrow.
+                        unescrows.append(item)  # remove escrow in batch below
+                        if logger.isEnabledFor(logging.INFO):  # skip log record when not emitted
+                            logger.info("Kevery unescrow succeeded for event=\n%s\n",
+                                        helping.Lazy(serder.pretty))
+
+            finally:  # remove batch even if an exception escapes
+                if unescrows:
+                    self.db.delUreItems(unescrows)
 
 
     def processEscrowUnverTrans(self):
@@ -4218,141 +4431,155 @@ class Kevery:
                         If successful then remove from escrow table
         """
 
+        stale = self._staler(self.TimeoutVRE)  # one stale boundary for this pass
         ims = bytearray()
-        key = ekey = b''  # both start same. when not same means escrows found
-        while True:  # break when done
-            for ekey, equinlet in self.db.getVreItemsNextIter(key=key):
-                try:
-                    pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
-                    ediger, sprefixer, sseqner, sdiger, siger = deTransReceiptQuintuple(equinlet)
-
-                    # check date if expired then remove escrow.
-                    dtb = self.db.getDts(dgKey(pre, bytes(ediger.qb64b)))
-                    if dtb is None:  # othewise is a datetime as bytes
-                        # no date time so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Missing event datetime"
-                                 " at dig = %s\n", ediger.qb64b)
-
-                        raise ValidationError("Missing escrowed event datetime "
-                                              "at dig = {}.".format(ediger.qb64b))
-
-                    # do date math here and discard if stale nowIso8601() bytes
-                    dtnow = helping.nowUTC()
-                    dte = helping.fromIso8601(bytes(dtb))
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutVRE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        logger.info("Kevery unescrow error: Stale event escrow "
-                                 " at dig = %s\n", ediger.qb64b)
-
-                        raise ValidationError("Stale event escrow "
-                                              "at dig = {}.".format(ediger.qb64b))
-
-                    # get dig of the receipted event using pre and sn lastEvt
-                    raw = self.db.getKeLast(snKey(pre, sn))
-                    if raw is None:
-                        # no event so keep in escrow
-                        logger.info("Kevery unescrow error: Missing receipted "
-                                 "event at pre=%s sn=%x\n", (pre, sn))
-
-                        raise UnverifiedTransferableReceiptError("Missing receipted evt at pre={} "
-                                              " sn={:x}".format(pre, sn))
-
-                    dig = bytes(raw)
-                    # get receipted event using pre and edig
-                    raw = self.db.getEvt(dgKey(pre, dig))
-                    if raw is None:  #  receipted event superseded so remove from escrow
-                        logger.info("Kevery unescrow error: Invalid receipted "
-                                 "event referenace at pre=%s sn=%x\n", pre, sn)
-
-                        raise ValidationError("Invalid receipted evt reference "
-                                              "at pre={} sn={:x}".format(pre, sn))
-
-                    serder = Serder(raw=bytes(raw))  # receipted event
-
-                    #  compare digs
-                    if not ediger.compare(ser=serder.raw, diger=ediger):
-                        logger.info("Kevery unescrow error: Bad receipt dig."
-                             "pre=%s sn=%x receipter=%s\n", (pre, sn, sprefixer.qb64))
-
-                        raise ValidationError("Bad escrowed receipt dig at "
-                                          "pre={} sn={:x} receipter={}."
-                                          "".format( pre, sn, sprefixer.qb64))
-
-                    # get receipter's last est event
-                    # retrieve dig of last event at sn of receipter.
-                    sdig = self.db.getKeLast(key=snKey(pre=sprefixer.qb64b,
-                                                          sn=sseqner.sn))
-                    if sdig is None:
-                        # no event so keep in escrow
-                        logger.info("Kevery unescrow error: Missing receipted "
-                                 "event at pre=%s sn=%x\n", pre, sn)
-
-                        raise UnverifiedTransferableReceiptError("Missing receipted evt at pre={} "
-                                              " sn={:x}".format(pre, sn))
-
-                    # retrieve last event itself of receipter
-                    sraw = self.db.getEvt(key=dgKey(pre=sprefixer.qb64b, dig=bytes(sdig)))
-                    # assumes db ensures that sraw must not be none because sdig was in KE
-                    sserder = Serder(raw=bytes(sraw))
-                    if not sserder.compare(diger=sdiger):  # seal dig not match event
-                        # this unescrows
-                        raise ValidationError("Bad chit seal at sn = {} for rct = {}."
-                                              "".format(sseqner.sn, sserder.ked))
-
-                    #verify sigs and if so write quadruple to database
-                    verfers = sserder.verfers
-                    if not verfers:
-                        raise ValidationError("Invalid seal est. event dig = {} for "
-                                              "receipt from pre ={} no keys."
-                                              "".format(sdiger.qb64, sprefixer.qb64))
+        dtss = {}  # escrow datetimes by dgkey fetched once per pass for dup receipts
+        # bounded batches so deletes between batches are safe
+        for items in self.db.getVreItemsBatchIter(limit=self.UnescrowBatchSize):
+            unescrows = []  # escrow items to remove in one write transaction
+            # last event digs by snkey fetched once per batch, escrowed keys in one txn
+            lasts = self.db.getKeLasts(dict.fromkeys(ekey for ekey, _ in items))
+            try:
+                for item in items:
+                    ekey, equinlet = item  # item itself is queued for removal so no new tuple
+
+                    try:
+                        pre, sn = splitKeySN(ekey)  # get pre and sn from escrow item
+                        snkey = snKey(pre, sn)  # reused for reads and unescrow
+                        ediger, sprefixer, sseqner, sdiger, siger = deTransReceiptQuintuple(equinlet)
+
+                        # check date if expired then remove escrow.
+                        edgkey = dgKey(pre, ediger.qb64b)
+                        if edgkey not in dtss:  # first escrow for this event this pass
+                            dtb = self.db.getDts(edgkey)
+                            dtss[edgkey] = bytes(dtb) if dtb is not None else None
+                        dtb = dtss[edgkey]
+                        if dtb is None:  # othewise is a datetime as bytes
+                            # no date time so unescrow without raising
+                            logger.info("Kevery unescrow error: Missing event datetime"
+                                     " at dig = %s\n", ediger.qb64b)
+                            unescrows.append(item)  # remove escrow in batch below
+                            continue
+
+                        # do date math here and discard if stale nowIso8601() bytes
+                        if stale(dtb):
+                            # escrow stale so unescrow without raising
+                            logger.info("Kevery unescrow error: Stale event escrow "
+                                     " at dig = %s\n", ediger.qb64b)
+                            unescrows.append(item)  # remove escrow in batch below
+                            continue
+
+                        # get dig of the receipted event using pre and sn lastEvt
+                        if snkey not in lasts:  # not prefetched with escrowed keys
+                            raw = self.db.getKeLast(snkey)
+                            lasts[snkey] = bytes(raw) if raw is not None else None
+                        raw = lasts[snkey]
+                        if raw is None:
+                            # no event so keep in escrow without raising
+                            logger.info("Kevery unescrow error: Missing receipted "
+                                     "event at pre=%s sn=%x\n", (pre, sn))
+                            continue
+
+                        dig = bytes(raw)
+                        dgkey = dgKey(pre, dig)  # reused for event lookup and receipt write
+                        # get receipted event using pre and edig
+                        raw = self.db.getEvt(dgkey)
+                        if raw is None:  #  receipted event superseded so remove from escrow
+                            logger.info("Kevery unescrow error: Invalid receipted "
+                                     "event referenace at pre=%s sn=%x\n", pre, sn)
+
+                            raise ValidationError("Invalid receipted evt reference "
+                                                  "at pre={} sn={:x}".format(pre, sn))
+
+                        serder = self.memoSerder(dgkey, raw)  # receipted event
 
-                    # Set up quadruple
-                    sealet = sprefixer.qb64b + sseqner.qb64b + sdiger.qb64b
-
-                    if siger.index >= len(verfers):
-                        raise ValidationError("Index = {} to large for keys."
-                                                  "".format(siger.index))
-
-                    siger.verfer = verfers[siger.index]  # assign verfer
-                    if not siger.verfer.verify(siger.raw, serder.raw):  # verify sig
-                        logger.info("Kevery unescrow error: Bad trans receipt sig."
-                                 "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
+                        #  compare digs
+                        if not ediger.compare(ser=serder.raw, diger=ediger):
+                            logger.info("Kevery unescrow error: Bad receipt dig."
+                                 "pre=%s sn=%x receipter=%s\n", (pre, sn, sprefixer.qb64))
 
-                        raise ValidationError("Bad escrowed trans receipt sig at "
+                            raise ValidationError("Bad escrowed receipt dig at "
                                               "pre={} sn={:x} receipter={}."
                                               "".format( pre, sn, sprefixer.qb64))
 
-                    # good sig so write receipt quadruple to database
-                    quadruple = sealet + siger.qb64b
-                    self.db.addVrc(key=dgKey(pre, serder.dig), val=quadruple)
-
-
-                except UnverifiedTransferableReceiptError as ex:
-                    # still waiting on missing prior event to validate
-                    # only happens if we process above
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrow failed: %s\n", ex.args[0])
-
-                except Exception as ex:  # log diagnostics errors etc
-                    # error other than out of order so remove from OO escrow
-                    self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
-                    if logger.isEnabledFor(logging.DEBUG):  # adds exception data
-                        logger.exception("Kevery unescrowed: %s\n", ex.args[0])
-                    else:
-                        logger.error("Kevery unescrowed: %s\n", ex.args[0])
-
-                else:  # unescrow succeeded, remove from escrow
-                    # We don't remove all escrows at pre,sn because some might be
-                    # duplicitous so we process remaining escrows in spite of found
-                    # valid event escrow.
-                    self.db.delVre(snKey(pre, sn), equinlet)  # removes one escrow at key val
-                    logger.info("Kevery unescrow succeeded for event = %s\n", serder.ked)
-
-            if ekey == key:  # still same so no escrows found on last while iteration
-                break
-            key = ekey #  setup next while iteration, with key after ekey
+                        # get receipter's last est event
+                        # retrieve dig of last event at sn of receipter.
+                        ssnkey = snKey(pre=sprefixer.qb64b, sn=sseqner.sn)
+                        if ssnkey not in lasts:  # first receipt by receipter est evt this pass
+                            sdig = self.db.getKeLast(key=ssnkey)
+                            lasts[ssnkey] = bytes(sdig) if sdig is not None else None
+                        sdig = lasts[ssnkey]
+                        if sdig is None:
+                            # no event so keep in escrow without raising
+                            logger.info("Kevery unescrow error: Missing receipted "
+                                     "event at pre=%s sn=%x\n", pre, sn)
+                            continue
+
+                        # retrieve last event itself of receipter
+                        # assumes db ensures that event must not be none because sdig was in KE
+                        sserder = self.fetchSerder(pre=sprefixer.qb64b, dig=sdig)
+                        if not sserder.compare(diger=sdiger):  # seal dig not match event
+                            # this unescrows
+                            raise ValidationError("Bad chit seal at sn = {} for rct = {}."
+                                                  "".format(sseqner.sn, sserder.ked))
+
+                        #verify sigs and if so write quadruple to database
+                        verfers = sserder.verfers
+                        if not verfers:
+                            raise ValidationError("Invalid seal est. event dig = {} for "
+                                                  "receipt from pre ={} no keys."
+                                                  "".format(sdiger.qb64, sprefixer.qb64))
+
+                        # Set up quadruple
+                        sealet = sprefixer.qb64b + sseqner.qb64b + sdiger.qb64b
+
+                        if siger.index >= len(verfers):
+                            raise ValidationError("Index = {} to large for keys."
+                                                      "".format(siger.index))
+
+                        siger.verfer = verfers[siger.index]  # assign verfer
+                        quadruple = sealet + siger.qb64b
+                        # same quadruple already stored was verified before so skip verify
+                        if not self.db.hasVrc(dgkey, quadruple):
+                            if not siger.verfer.verify(siger.raw, serder.raw):  # verify sig
+                                logger.info("Kevery unescrow error: Bad trans receipt sig."
+                                         "pre=%s sn=%x receipter=%s\n", pre, sn, sprefixer.qb64)
+
+                                raise ValidationError("Bad escrowed trans receipt sig at "
+                                                      "pre={} sn={:x} receipter={}."
+                                                      "".format( pre, sn, sprefixer.qb64))
+
+                            # good sig so write receipt quadruple to database
+                            self.db.addVrc(key=dgkey, val=quadruple)
+
+
+                    except UnverifiedTransferableReceiptError as ex:
+                        # still waiting on missing prior event to validate
+                        # only happens if we process above
+                        if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                            logger.exception("Kevery unescrow failed: %s\n", ex.args[0])
+                        else:
+                            logger.error("Kevery unescrow failed: %s\n", ex.args[0])
+
+                    except Exception as ex:  # log diagnostics errors etc
+                        # error other than out of order so remove from OO escrow
+                        unescrows.append(item)  # remove escrow in batch below
+                        if logger.isEnabledFor(logging.DEBUG):  # adds exception data
+                            logger.exception("Kevery unescrowed: %s\n", ex.args[0])
+                        else:
+                            logger.error("Kevery unescrowed: %s\n", ex.args[0])
+
+                    else:  # unescrow succeeded, remove from escrow
+                        # We don't remove all escrows at pre,sn because some might be
+                        # duplicitous so we process remaining escrows in spite of found
+                        # valid event escrow.
+                        unescrows.append(item)  # remove escrow in batch below
+                        if logger.isEnabledFor(logging.INFO):  # skip log record when not emitted
+                            logger.info("Kevery unescrow succeeded for event = %s\n", serder.ked)
+
+            finally:  # remove batch even if an exception escapes
+                if unescrows:
+                    self.db.delVreItems(unescrows)
 
 
 
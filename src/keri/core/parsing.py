@@ -7,7 +7,7 @@ message stream parsing support
 
 import logging
 from collections import namedtuple
-from dataclasses import dataclass, astuple
+from dataclasses import dataclass
 
 from .. import kering
 from .. import help
@@ -56,13 +56,20 @@ class ColdCodex:
     CtOpB2:    int = 0o7  # CountCode or OpCode Base2
 
     def __iter__(self):
-        return iter(astuple(self))
+        return iter(self.__dict__.values())
 
 ColdDex = ColdCodex()  # Make instance
 
 Coldage = namedtuple("Coldage", 'msg txt bny')  # stream cold start status
 Colds = Coldage(msg='msg', txt='txt', bny='bny')
 
+# cold start status indexed by first byte of stream, None when unexpected tritet
+ColdStarts = tuple(Colds.msg if (b >> 5) in (ColdDex.JSON, ColdDex.MGPK1,
+                                             ColdDex.CBOR, ColdDex.MGPK2)
+                   else Colds.txt if (b >> 5) in (ColdDex.CtB64, ColdDex.OpB64)
+                   else Colds.bny if (b >> 5) in (ColdDex.CtOpB2,)
+                   else None for b in range(256))
+
 
 
 class Parser:
@@ -139,15 +146,11 @@ class Parser:
         if not ims:
             raise kering.ShortageError("Need more bytes.")
 
-        tritet = ims[0] >> 5
-        if tritet in (ColdDex.JSON, ColdDex.MGPK1, ColdDex.CBOR, ColdDex.MGPK2):
-            return Colds.msg
-        if tritet in (ColdDex.CtB64, ColdDex.OpB64):
-            return Colds.txt
-        if tritet in (ColdDex.CtOpB2,):
-            return Colds.bny
-
-        raise kering.ColdStartError("Unexpected tritet={} at stream start.".format(tritet))
+        cold = ColdStarts[ims[0]]  # one lookup instead of tritet tests
+        if cold is None:
+            raise kering.ColdStartError("Unexpected tritet={} at stream start."
+                                        "".format(ims[0] >> 5))
+        return cold
 
 
     @staticmethod
@@ -224,11 +227,8 @@ class Parser:
                                        kvy=kvy,
                                        tvy=tvy)
 
-        while True:
-            try:
-                next(parsator)
-            except StopIteration:
-                break
+        for _ in parsator:  # drive to completion, loop ends on StopIteration
+            pass
 
 
     def parseOne(self, ims=None, framed=True, pipeline=False, kvy=None, tvy=None):
@@ -261,11 +261,8 @@ class Parser:
                                         pipeline=pipeline,
                                         kvy=kvy,
                                         tvy=tvy)
-        while True:
-            try:
-                next(parsator)
-            except StopIteration:
-                break
+        for _ in parsator:  # drive to completion, loop ends on StopIteration
+            pass
 
 
     def allParsator(self, ims=None, framed=None, pipeline=None, kvy=None, tvy=None):
@@ -293,49 +290,11 @@ class Parser:
             Attachments must all have counters so know if txt or bny format for
             attachments. So even when framed==True must still have counters.
         """
-        if ims is not None:  # needs bytearray not bytes since deletes as processes
-            if not isinstance(ims, bytearray):
-                ims = bytearray(ims)  # so make bytearray copy
-        else:
-            ims = self.ims  # use instance attribute by default
-
-        framed = framed if framed is not None else self.framed
-        pipeline = pipeline if pipeline is not None else self.pipeline
-        kvy = kvy if kvy is not None else self.kvy
-        tvy = tvy if tvy is not None else self.tvy
-
-        while ims:  # only process until ims empty
-            try:
-                done = yield from self.msgParsator(ims=ims,
-                                                    framed=framed,
-                                                    pipeline=pipeline,
-                                                    kvy=kvy,
-                                                    tvy=tvy)
-
-            except kering.SizedGroupError as ex:  # error inside sized group
-                # processOneIter already flushed group so do not flush stream
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.exception("Parser msg extraction error: %s\n", ex.args[0])
-                else:
-                    logger.error("Parser msg extraction error: %s\n", ex.args[0])
-
-            except (kering.ColdStartError, kering.ExtractionError) as ex:  # some extraction error
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.exception("Parser msg extraction error: %s\n", ex.args[0])
-                else:
-                    logger.error("Parser msg extraction error: %s\n", ex.args[0])
-                del ims[:]  # delete rest of stream to force cold restart
-
-            except (kering.ValidationError, Exception) as ex:  # non Extraction Error
-                # Non extraction errors happen after successfully extracted from stream
-                # so we don't flush rest of stream just resume
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.exception("Parser msg non-extraction error: %s\n", ex.args[0])
-                else:
-                    logger.error("Parser msg non-extraction error: %s\n", ex.args[0])
-            yield
-
-        return True
+        return self._parsator(ims=ims,
+                              framed=framed,
+                              pipeline=pipeline,
+                              kvy=kvy,
+                              tvy=tvy)
 
 
     def onceParsator(self, ims=None, framed=None, pipeline=None, kvy=None, tvy=None):
@@ -361,52 +320,12 @@ class Parser:
             Attachments must all have counters so know if txt or bny format for
             attachments. So even when framed==True must still have counters.
         """
-        if ims is not None:  # needs bytearray not bytes since deletes as processes
-            if not isinstance(ims, bytearray):
-                ims = bytearray(ims)  # so make bytearray copy
-        else:
-            ims = self.ims  # use instance attribute by default
-
-        framed = framed if framed is not None else self.framed
-        pipeline = pipeline if pipeline is not None else self.pipeline
-        kvy = kvy if kvy is not None else self.kvy
-        tvy = tvy if tvy is not None else self.tvy
-
-
-        done = False
-        while not done:
-            try:
-                done = yield from self.msgParsator(ims=ims,
-                                                    framed=framed,
-                                                    pipeline=pipeline,
-                                                    kvy=kvy,
-                                                    tvy=tvy)
-
-            except kering.SizedGroupError as ex:  # error inside sized group
-                # processOneIter already flushed group so do not flush stream
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.exception("Kevery msg extraction error: %s\n", ex.args[0])
-                else:
-                    logger.error("Kevery msg extraction error: %s\n", ex.args[0])
-
-            except (kering.ColdStartError, kering.ExtractionError) as ex:  # some extraction error
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.exception("Kevery msg extraction error: %s\n", ex.args[0])
-                else:
-                    logger.error("Kevery msg extraction error: %s\n", ex.args[0])
-                del ims[:]  # delete rest of stream to force cold restart
-
-            except (kering.ValidationError, Exception) as ex:  # non Extraction Error
-                # Non extraction errors happen after successfully extracted from stream
-                # so we don't flush rest of stream just resume
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.exception("Kevery msg non-extraction error: %s\n", ex.args[0])
-                else:
-                    logger.error("Kevery msg non-extraction error: %s\n", ex.args[0])
-            finally:
-                done = True
-
-        return done
+        return self._parsator(ims=ims,
+                              framed=framed,
+                              pipeline=pipeline,
+                              kvy=kvy,
+                              tvy=tvy,
+                              once=True)
 
 
     def parsator(self, ims=None, framed=None, pipeline=None, kvy=None, tvy=None):
@@ -434,6 +353,34 @@ class Parser:
             Attachments must all have counters so know if txt or bny format for
             attachments. So even when framed==True must still have counters.
         """
+        return self._parsator(ims=ims,
+                              framed=framed,
+                              pipeline=pipeline,
+                              kvy=kvy,
+                              tvy=tvy,
+                              forever=True)
+
+
+    def _parsator(self, ims=None, framed=None, pipeline=None, kvy=None,
+                  tvy=None, once=False, forever=False):
+        """
+        Returns generator shared by .allParsator, .onceParsator, and .parsator
+        that parses messages from incoming message stream, ims, and logs
+        then recovers from any parse error.
+        If ims not provided then parse messages from .ims
+
+        Parameters:
+            ims is bytearray of incoming message stream.
+            framed is Boolean, True means ims contains only one frame
+            pipeline is Boolean, True means use pipeline processor
+            kvy (Kevery): route KERI KEL message types to this instance
+            tvy (Tevery): route TEL message types to this instance
+            once is Boolean, True means parse only one message then return
+                without yielding after it
+            forever is Boolean, True means never return but continually yield
+                to wait while ims is empty
+                When neither once nor forever then parse until ims is empty
+        """
         if ims is not None:  # needs bytearray not bytes since deletes as processes
             if not isinstance(ims, bytearray):
                 ims = bytearray(ims)  # so make bytearray copy
@@ -445,40 +392,208 @@ class Parser:
         kvy = kvy if kvy is not None else self.kvy
         tvy = tvy if tvy is not None else self.tvy
 
-        while True:  # continuous stream processing never stop
+        src = "Kevery" if once else "Parser"  # onceParsator logs as Kevery
+        while forever or once or ims:  # once always tries at least one message
             try:
-                done = yield from self.msgParsator(ims=ims,
-                                                    framed=framed,
-                                                    pipeline=pipeline,
-                                                    kvy=kvy,
-                                                    tvy=tvy)
+                yield from self.msgParsator(ims=ims,
+                                            framed=framed,
+                                            pipeline=pipeline,
+                                            kvy=kvy,
+                                            tvy=tvy)
 
             except kering.SizedGroupError as ex:  # error inside sized group
                 # processOneIter already flushed group so do not flush stream
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.exception("Parser msg extraction error: %s\n", ex.args[0])
-                else:
-                    logger.error("Parser msg extraction error: %s\n", ex.args[0])
+                log = logger.exception if logger.isEnabledFor(logging.DEBUG) else logger.error
+                log("%s msg extraction error: %s\n", src, ex.args[0])
 
             except (kering.ColdStartError, kering.ExtractionError) as ex:  # some extraction error
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.exception("Parser msg extraction error: %s\n", ex.args[0])
-                else:
-                    logger.error("Parser msg extraction error: %s\n", ex.args[0])
+                log = logger.exception if logger.isEnabledFor(logging.DEBUG) else logger.error
+                log("%s msg extraction error: %s\n", src, ex.args[0])
                 del ims[:]  # delete rest of stream to force cold restart
 
             except (kering.ValidationError, Exception) as ex:  # non Extraction Error
                 # Non extraction errors happen after successfully extracted from stream
                 # so we don't flush rest of stream just resume
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.exception("Parser msg non-extraction error: %s\n", ex.args[0])
-                else:
-                    logger.error("Parser msg non-extraction error: %s\n", ex.args[0])
+                log = logger.exception if logger.isEnabledFor(logging.DEBUG) else logger.error
+                log("%s msg non-extraction error: %s\n", src, ex.args[0])
+
+            if once:  # one message only so no trailing yield
+                break
             yield
 
         return True
 
 
+    def _sigersParsator(self, ims, ctr, cold=Colds.txt, abort=False):
+        """
+        Returns generator that extracts the ctr.count indexed signatures of a
+        ControllerIdxSigs or WitnessIdxSigs group from ims and returns them
+        as list of Siger instances.
+        Yields when not enough bytes in ims unless abort.
+        """
+        sigers = [None] * ctr.count  # preallocate since count known
+        for i in range(ctr.count): # extract each attached signature
+            siger = yield from self._extractor(ims=ims,
+                                               klas=Siger,
+                                               cold=cold,
+                                               abort=abort)
+            sigers[i] = siger
+        return sigers
+
+
+    def _cigarsParsator(self, ims, ctr, cold=Colds.txt, abort=False):
+        """
+        Returns generator that extracts the ctr.count couples of a
+        NonTransReceiptCouples group from ims and returns them as list of
+        Cigar instances each with .verfer of the receiptor.
+        Yields when not enough bytes in ims unless abort.
+        """
+        # verfer property of cigar is the identifier prefix
+        # cigar itself has the attached signature
+        cigars = [None] * ctr.count  # preallocate since count known
+        for i in range(ctr.count): # extract each attached couple
+            verfer = yield from self._extractor(ims=ims,
+                                                klas=Verfer,
+                                                cold=cold,
+                                                abort=abort)
+            cigar = yield from self._extractor(ims=ims,
+                                               klas=Cigar,
+                                               cold=cold,
+                                               abort=abort)
+            cigar.verfer = verfer
+            cigars[i] = cigar
+        return cigars
+
+
+    def _trqsParsator(self, ims, ctr, cold=Colds.txt, abort=False):
+        """
+        Returns generator that extracts the ctr.count quadruples of a
+        TransReceiptQuadruples group from ims and returns them as list of
+        (prefixer, seqner, diger, siger) tuples.
+        Yields when not enough bytes in ims unless abort.
+
+        Quadruple is spre+ssnu+sdig+sig
+            spre is pre of signer of vrc
+            ssnu is sn of signer's est evt when signed
+            sdig is dig of signer's est event when signed
+            sig is indexed signature of signer on this event msg
+        """
+        trqs = [None] * ctr.count  # preallocate since count known
+        for i in range(ctr.count): # extract each attached quadruple
+            prefixer = yield from  self._extractor(ims,
+                                                   klas=Prefixer,
+                                                   cold=cold,
+                                                   abort=abort)
+            seqner = yield from  self._extractor(ims,
+                                                 klas=Seqner,
+                                                 cold=cold,
+                                                 abort=abort)
+            diger = yield from  self._extractor(ims,
+                                                klas=Diger,
+                                                cold=cold,
+                                                abort=abort)
+            siger = yield from self._extractor(ims=ims,
+                                               klas=Siger,
+                                               cold=cold,
+                                               abort=abort)
+            trqs[i] = (prefixer, seqner, diger, siger)
+        return trqs
+
+
+    def _tsgsParsator(self, ims, ctr, cold=Colds.txt, abort=False):
+        """
+        Returns generator that extracts the ctr.count groups of a
+        TransIndexedSigGroups group from ims and returns them as list of
+        (prefixer, seqner, diger, isigers) tuples.
+        Yields when not enough bytes in ims unless abort.
+
+        Each group is triple pre+snu+dig plus indexed sig group
+            pre is pre of signer (endorser) of msg
+            snu is sn of signer's est evt when signed
+            dig is dig of signer's est event when signed
+            followed by counter for ControllerIdxSigs with attached
+            indexed sigs from trans signer (endorser).
+        """
+        tsgs = [None] * ctr.count  # preallocate since count known
+        for i in range(ctr.count): # extract each attached groups
+            prefixer = yield from  self._extractor(ims,
+                                                   klas=Prefixer,
+                                                   cold=cold,
+                                                   abort=abort)
+            seqner = yield from  self._extractor(ims,
+                                                 klas=Seqner,
+                                                 cold=cold,
+                                                 abort=abort)
+            diger = yield from  self._extractor(ims,
+                                                klas=Diger,
+                                                cold=cold,
+                                                abort=abort)
+            ictr = yield from self._extractor(ims=ims,
+                                              klas=Counter,
+                                              cold=cold,
+                                              abort=abort)
+            if ictr.code != CtrDex.ControllerIdxSigs:
+                raise kering.UnexpectedCountCodeError("Wrong "
+                    "count code={}.Expected code={}."
+                    "".format(ictr.code, CtrDex.ControllerIdxSigs))
+            isigers = yield from self._sigersParsator(ims=ims,
+                                                      ctr=ictr,
+                                                      cold=cold,
+                                                      abort=abort)
+            tsgs[i] = (prefixer, seqner, diger, isigers)
+        return tsgs
+
+
+    def _frcsParsator(self, ims, ctr, cold=Colds.txt, abort=False):
+        """
+        Returns generator that extracts the ctr.count couples of a
+        FirstSeenReplayCouples group from ims and returns them as list of
+        (firner, dater) tuples.
+        Yields when not enough bytes in ims unless abort.
+
+        Couple is snu+dtm
+            snu is fn (first seen ordinal) of event
+            dtm is dt of event
+        """
+        frcs = [None] * ctr.count  # preallocate since count known
+        for i in range(ctr.count): # extract each attached couple
+            firner = yield from  self._extractor(ims,
+                                                 klas=Seqner,
+                                                 cold=cold,
+                                                 abort=abort)
+            dater = yield from  self._extractor(ims,
+                                                klas=Dater,
+                                                cold=cold,
+                                                abort=abort)
+            frcs[i] = (firner, dater)
+        return frcs
+
+
+    def _sscsParsator(self, ims, ctr, cold=Colds.txt, abort=False):
+        """
+        Returns generator that extracts the ctr.count couples of a
+        SealSourceCouples group from ims and returns them as list of
+        (seqner, diger) tuples.
+        Yields when not enough bytes in ims unless abort.
+
+        Couple is snu+dig
+            snu is sequence number  of event
+            dig is digest of event
+        """
+        sscs = [None] * ctr.count  # preallocate since count known
+        for i in range(ctr.count): # extract each attached couple
+            seqner = yield from  self._extractor(ims,
+                                                klas=Seqner,
+                                                cold=cold,
+                                                abort=abort)
+            diger = yield from  self._extractor(ims,
+                                                klas=Diger,
+                                                cold=cold,
+                                                abort=abort)
+            sscs[i] = (seqner, diger)
+        return sscs
+
+
     def msgParsator(self, ims=None, framed=True, pipeline=False, kvy=None, tvy=None):
         """
         Returns generator that upton each iterations extracts and parses msg
@@ -554,6 +669,14 @@ class Parser:
         # List of tuples from extracted source seal couples (delegator or issuer)
         sscs = []  # each converted couple is (seqner, diger) for delegating/issuing event
         pipelined = False  # all attachments in one big pipeline counted group
+        # attachment lists keyed by count code of group whose items they hold
+        atts = {CtrDex.ControllerIdxSigs: sigers,
+                CtrDex.WitnessIdxSigs: wigers,
+                CtrDex.NonTransReceiptCouples: cigars,
+                CtrDex.TransReceiptQuadruples: trqs,
+                CtrDex.TransIndexedSigGroups: tsgs,
+                CtrDex.FirstSeenReplayCouples: frcs,
+                CtrDex.SealSourceCouples: sscs}
         # extract and deserialize attachments
         try:  # catch errors here to flush only counted part of stream
             # extract attachments must start with counter so know if txt or bny.
@@ -584,153 +707,27 @@ class Parser:
 
                 # iteratively process attachment counters (all non pipelined)
                 while True:  # do while already extracted first counter is ctr
-                    if ctr.code == CtrDex.ControllerIdxSigs:
-                        for i in range(ctr.count): # extract each attached signature
-                            siger = yield from self._extractor(ims=ims,
-                                                               klas=Siger,
-                                                               cold=cold,
-                                                               abort=pipelined)
-                            sigers.append(siger)
-
-                    elif ctr.code == CtrDex.WitnessIdxSigs:
-                        for i in range(ctr.count): # extract each attached signature
-                            wiger = yield from self._extractor(ims=ims,
-                                                               klas=Siger,
-                                                               cold=cold,
-                                                               abort=pipelined)
-                            wigers.append(wiger)
-
-                    elif ctr.code == CtrDex.NonTransReceiptCouples:
-                        # extract attached rct couplets into list of sigvers
-                        # verfer property of cigar is the identifier prefix
-                        # cigar itself has the attached signature
-
-                        for i in range(ctr.count): # extract each attached couple
-                            verfer = yield from self._extractor(ims=ims,
-                                                                klas=Verfer,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            cigar = yield from self._extractor(ims=ims,
-                                                               klas=Cigar,
-                                                               cold=cold,
-                                                               abort=pipelined)
-                            cigar.verfer = verfer
-                            cigars.append(cigar)
-
-                    elif ctr.code == CtrDex.TransReceiptQuadruples:
-                        # extract attaced trans receipt vrc quadruple
-                        # spre+ssnu+sdig+sig
-                        # spre is pre of signer of vrc
-                        # ssnu is sn of signer's est evt when signed
-                        # sdig is dig of signer's est event when signed
-                        # sig is indexed signature of signer on this event msg
-                        for i in range(ctr.count): # extract each attached quadruple
-                            prefixer = yield from  self._extractor(ims,
-                                                                   klas=Prefixer,
-                                                                   cold=cold,
-                                                                   abort=pipelined)
-                            seqner = yield from  self._extractor(ims,
-                                                                 klas=Seqner,
-                                                                 cold=cold,
-                                                                 abort=pipelined)
-                            diger = yield from  self._extractor(ims,
-                                                                klas=Diger,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            siger = yield from self._extractor(ims=ims,
-                                                               klas=Siger,
-                                                               cold=cold,
-                                                               abort=pipelined)
-                            trqs.append((prefixer, seqner, diger, siger))
-
-                    elif ctr.code == CtrDex.TransIndexedSigGroups:
-                        # extract attaced trans indexed sig groups each made of
-                        # triple pre+snu+dig plus indexed sig group
-                        # pre is pre of signer (endorser) of msg
-                        # snu is sn of signer's est evt when signed
-                        # dig is dig of signer's est event when signed
-                        # followed by counter for ControllerIdxSigs with attached
-                        # indexed sigs from trans signer (endorser).
-                        for i in range(ctr.count): # extract each attached groups
-                            prefixer = yield from  self._extractor(ims,
-                                                                   klas=Prefixer,
-                                                                   cold=cold,
-                                                                   abort=pipelined)
-                            seqner = yield from  self._extractor(ims,
-                                                                 klas=Seqner,
-                                                                 cold=cold,
-                                                                 abort=pipelined)
-                            diger = yield from  self._extractor(ims,
-                                                                klas=Diger,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            ictr = ctr = yield from self._extractor(ims=ims,
-                                                                    klas=Counter,
-                                                                    cold=cold,
-                                                                    abort=pipelined)
-                            if ctr.code != CtrDex.ControllerIdxSigs:
-                                raise kering.UnexpectedCountCodeError("Wrong "
-                                    "count code={}.Expected code={}."
-                                    "".format(ictr.code, CtrDex.ControllerIdxSigs))
-                            isigers = []
-                            for i in range(ictr.count): # extract each attached signature
-                                isiger = yield from self._extractor(ims=ims,
-                                                                    klas=Siger,
-                                                                    cold=cold,
-                                                                    abort=pipelined)
-                                isigers.append(isiger)
-                            tsgs.append((prefixer, seqner, diger, isigers))
-
-                    elif ctr.code == CtrDex.FirstSeenReplayCouples:
-                        # extract attached first seen replay couples
-                        # snu+dtm
-                        # snu is fn (first seen ordinal) of event
-                        # dtm is dt of event
-                        for i in range(ctr.count): # extract each attached quadruple
-                            firner = yield from  self._extractor(ims,
-                                                                 klas=Seqner,
-                                                                 cold=cold,
-                                                                 abort=pipelined)
-                            dater = yield from  self._extractor(ims,
-                                                                klas=Dater,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            frcs.append((firner, dater))
-
-                    elif ctr.code == CtrDex.SealSourceCouples:
-                        # extract attached first seen replay couples
-                        # snu+dig
-                        # snu is sequence number  of event
-                        # dig is digest of event
-                        for i in range(ctr.count): # extract each attached quadruple
-                            seqner = yield from  self._extractor(ims,
-                                                                klas=Seqner,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            diger = yield from  self._extractor(ims,
-                                                                klas=Diger,
-                                                                cold=cold,
-                                                                abort=pipelined)
-                            sscs.append((seqner, diger))
-
-                    else:
+                    attacher = self.Attachers.get(ctr.code)  # group parsator
+                    if attacher is None:
                         raise kering.UnexpectedCountCodeError("Unsupported count"
                                                     " code={}.".format(ctr.code))
-
-                    if pipelined:  # process to end of stream (group)
-                        if not ims:  # end of pipelined group frame
-                            break
-                    elif framed:
-                        # because not all in one pipeline group, each attachment
-                        # group may switch stream state txt or bny
-                        if not ims:  # end of frame
-                            break
+                    items = yield from attacher(self,
+                                                ims=ims,
+                                                ctr=ctr,
+                                                cold=cold,
+                                                abort=pipelined)
+                    atts[ctr.code].extend(items)
+
+                    if not ims and (pipelined or framed):  # end of group or frame
+                        break  # so no wait and no sniff of empty stream
+                    # pipelined group is all one state txt or bny so no sniff
+                    # because not all in one pipeline group, each attachment
+                    # group may switch stream state txt or bny
+                    if framed and not pipelined:
                         cold = self._sniff(ims)
                         if cold == Colds.msg:  # new message so attachments done
                             break  # finished attachments since new message
-                    else:  # process until next message
-                        # because not all in one pipeline group, each attachment
-                        # group may switch stream state txt or bny
+                    elif not pipelined:  # process until next message
                         while not ims:
                             yield  # no frame so must wait for next message
                         cold = self._sniff(ims)  # ctr or msg
@@ -745,98 +742,172 @@ class Parser:
                                 "attachment group of size={}.".format(pags))
             raise  # no pipeline group so can't preflush, must flush stream
 
-        ilk = serder.ked["t"]  # dispatch abased on ilk
-        if ilk in [Ilks.icp, Ilks.rot, Ilks.ixn, Ilks.dip, Ilks.drt]:  # event msg
-            firner, dater = frcs[-1] if frcs else (None, None)  # use last one if more than one
-            seqner, diger = sscs[-1] if sscs else (None, None)  # use last one if more than one
-            if not sigers:
-                raise kering.ValidationError("Missing attached signature(s) for evt "
-                                      "= {}.".format(serder.ked))
-            try:
-                kvy.processEvent(serder=serder,
-                                        sigers=sigers,
-                                        wigers=wigers,
-                                        seqner=seqner,
-                                        diger=diger,
-                                        firner=firner,
-                                        dater=dater)
-
-                if cigars:
-                    kvy.processReceiptCouples(serder, cigars, firner=firner)
-                if trqs:
-                    kvy.processReceiptQuadruples(serder, trqs, firner=firner)
+        ilk = serder.ked["t"]  # dispatch based on ilk
+        dispatcher = self.Dispatchers.get(ilk)  # message handler
+        if dispatcher is None:
+            raise kering.ValidationError("Unexpected message ilk = {} for evt ="
+                                  " {}.".format(ilk, serder.ked))
+        dispatcher(self,
+                   serder=serder,
+                   kvy=kvy,
+                   tvy=tvy,
+                   sigers=sigers,
+                   wigers=wigers,
+                   cigars=cigars,
+                   trqs=trqs,
+                   tsgs=tsgs,
+                   frcs=frcs,
+                   sscs=sscs)
 
-            except AttributeError:
-                raise kering.ValidationError("No kevery to process so dropped msg"
-                                      "= {}.".format(serder.pretty))
+        return True  # done state
 
-        elif ilk in [Ilks.rct]:  # event receipt msg (nontransferable)
-            if not (cigars or wigers or tsgs):
-                raise kering.ValidationError("Missing attached signatures on receipt"
-                                      "msg = {}.".format(serder.ked))
-            try:
-                if cigars:
-                    kvy.processReceipt(serder=serder, cigars=cigars)
 
-                if wigers:
-                    kvy.processReceiptWitness(serder=serder, wigers=wigers )
+    def _eventDispatch(self, serder, kvy, tvy, sigers, wigers, cigars, trqs,
+                       tsgs, frcs, sscs):
+        """
+        Dispatches key event message, serder, with its attachments to kvy
+        Raises ValidationError when not signed or when no kvy
+        """
+        firner, dater = frcs[-1] if frcs else (None, None)  # use last one if more than one
+        seqner, diger = sscs[-1] if sscs else (None, None)  # use last one if more than one
+        if not sigers:
+            raise kering.ValidationError("Missing attached signature(s) for evt "
+                                  "= {}.".format(serder.ked))
+        try:
+            kvy.processEvent(serder=serder,
+                                    sigers=sigers,
+                                    wigers=wigers,
+                                    seqner=seqner,
+                                    diger=diger,
+                                    firner=firner,
+                                    dater=dater)
+
+            if cigars:
+                kvy.processReceiptCouples(serder, cigars, firner=firner)
+            if trqs:
+                kvy.processReceiptQuadruples(serder, trqs, firner=firner)
+
+        except AttributeError:
+            raise kering.ValidationError("No kevery to process so dropped msg"
+                                  "= {}.".format(serder.pretty()))
+
+
+    def _receiptDispatch(self, serder, kvy, tvy, sigers, wigers, cigars, trqs,
+                         tsgs, frcs, sscs):
+        """
+        Dispatches receipt message, serder, with its attached couples,
+        witness signatures, or trans signature groups to kvy
+        Raises ValidationError when no attached signatures or when no kvy
+        """
+        if not (cigars or wigers or tsgs):
+            raise kering.ValidationError("Missing attached signatures on receipt"
+                                  "msg = {}.".format(serder.ked))
+        try:
+            if cigars:
+                kvy.processReceipt(serder=serder, cigars=cigars)
+
+            if wigers:
+                kvy.processReceiptWitness(serder=serder, wigers=wigers )
 
-                if tsgs:
-                    kvy.processReceiptTrans(serder=serder, tsgs=tsgs)
+            if tsgs:
+                kvy.processReceiptTrans(serder=serder, tsgs=tsgs)
 
-            except AttributeError:
-                raise kering.ValidationError("No kevery to process so dropped msg"
-                                      "= {}.".format(serder.pretty))
+        except AttributeError:
+            raise kering.ValidationError("No kevery to process so dropped msg"
+                                  "= {}.".format(serder.pretty()))
 
-        elif ilk in (Ilks.ksn,):  # key state notification msg
-            if not (cigars or tsgs):
-                raise kering.ValidationError("Missing attached endorser signature(s) "
-                       "to key state notification msg = {}.".format(serder.ked))
 
-            try:
-                if cigars:  # process separately so do not clash on errors
-                    # may want two different functions One for processKeyStateNoticeNonTrans
-                    # and one for processKeyStateNoticeTrans
-                    kvy.processKeyStateNotice(serder, cigars=cigars)  # nontrans
+    def _noticeDispatch(self, serder, kvy, tvy, sigers, wigers, cigars, trqs,
+                        tsgs, frcs, sscs):
+        """
+        Dispatches key state notification message, serder, with its endorser
+        signatures to kvy
+        Raises ValidationError when no endorser signatures or when no kvy
+        """
+        if not (cigars or tsgs):
+            raise kering.ValidationError("Missing attached endorser signature(s) "
+                   "to key state notification msg = {}.".format(serder.ked))
+
+        try:
+            notice = kvy.processKeyStateNotice  # look up once for both forms
+            if cigars:  # process separately so do not clash on errors
+                # may want two different functions One for processKeyStateNoticeNonTrans
+                # and one for processKeyStateNoticeTrans
+                notice(serder, cigars=cigars)  # nontrans
 
-                if tsgs:  # process separately so do not clash on errors
-                    kvy.processKeyStateNotice(serder, tsgs=tsgs)  #  trans
+            if tsgs:  # process separately so do not clash on errors
+                notice(serder, tsgs=tsgs)  #  trans
 
+        except AttributeError:
+            raise kering.ValidationError("No kevery to process so dropped msg"
+                                  "= {}.".format(serder.pretty()))
+
+
+    def _queryDispatch(self, serder, kvy, tvy, sigers, wigers, cigars, trqs,
+                       tsgs, frcs, sscs):
+        """
+        Dispatches query message, serder, to kvy or tvy by its resource type
+        Raises ValidationError when resource unknown or when no kvy or tvy
+        """
+        res = serder.ked["r"]
+        if res == "logs":
+            try:
+                kvy.processQuery(serder=serder)
             except AttributeError:
                 raise kering.ValidationError("No kevery to process so dropped msg"
-                                      "= {}.".format(serder.pretty))
-        elif ilk in [Ilks.req]:
-            res = serder.ked["r"]
-            if res in ["logs"]:
-                try:
-                    kvy.processQuery(serder=serder)
-                except AttributeError:
-                    raise kering.ValidationError("No kevery to process so dropped msg"
-                                          "= {}.".format(serder.pretty))
-
-            elif res in ["tels"]:
-                try:
-                    tvy.processQuery(serder=serder)
-                except AttributeError as e:
-                    raise kering.ValidationError("No kevery to process so dropped msg"
-                                      "= {} from {}.".format(serder.pretty, e))
-
-            else:
-                raise kering.ValidationError("Invalid resource type {} so dropped msg"
-                                      "= {}.".format(res, serder.pretty))
-
-        elif ilk in (Ilks.vcp, Ilks.vrt, Ilks.iss, Ilks.rev, Ilks.bis, Ilks.brv):
-            # TEL msg
-            seqner, diger = sscs[-1] if sscs else (None, None)  # use last one if more than one
-            try:
-                tvy.processEvent(serder, seqner=seqner, diger=diger, wigers=wigers)
+                                      "= {}.".format(serder.pretty()))
 
-            except AttributeError:
-                raise kering.ValidationError("No tevery to process so dropped msg"
-                                      "= {}.".format(serder.pretty))
+        elif res == "tels":
+            try:
+                tvy.processQuery(serder=serder)
+            except AttributeError as e:
+                raise kering.ValidationError("No kevery to process so dropped msg"
+                                  "= {} from {}.".format(serder.pretty(), e))
 
         else:
-            raise kering.ValidationError("Unexpected message ilk = {} for evt ="
-                                  " {}.".format(ilk, serder.ked))
+            raise kering.ValidationError("Invalid resource type {} so dropped msg"
+                                  "= {}.".format(res, serder.pretty()))
 
-        return True  # done state
+
+    def _telDispatch(self, serder, kvy, tvy, sigers, wigers, cigars, trqs,
+                     tsgs, frcs, sscs):
+        """
+        Dispatches TEL event message, serder, with its source seal and witness
+        signatures to tvy
+        Raises ValidationError when no tvy
+        """
+        seqner, diger = sscs[-1] if sscs else (None, None)  # use last one if more than one
+        try:
+            tvy.processEvent(serder, seqner=seqner, diger=diger, wigers=wigers)
+
+        except AttributeError:
+            raise kering.ValidationError("No tevery to process so dropped msg"
+                                  "= {}.".format(serder.pretty()))
+
+
+    # attachment group parsators keyed by count code of group so dispatch is
+    # one dict lookup instead of an elif chain per group
+    Attachers = {CtrDex.ControllerIdxSigs: _sigersParsator,
+                 CtrDex.WitnessIdxSigs: _sigersParsator,
+                 CtrDex.NonTransReceiptCouples: _cigarsParsator,
+                 CtrDex.TransReceiptQuadruples: _trqsParsator,
+                 CtrDex.TransIndexedSigGroups: _tsgsParsator,
+                 CtrDex.FirstSeenReplayCouples: _frcsParsator,
+                 CtrDex.SealSourceCouples: _sscsParsator}
+
+    # message handlers keyed by ilk of message so dispatch is one dict lookup
+    # instead of an elif chain of ilk membership tests per message
+    Dispatchers = {Ilks.icp: _eventDispatch,
+                   Ilks.rot: _eventDispatch,
+                   Ilks.ixn: _eventDispatch,
+                   Ilks.dip: _eventDispatch,
+                   Ilks.drt: _eventDispatch,
+                   Ilks.rct: _receiptDispatch,
+                   Ilks.ksn: _noticeDispatch,
+                   Ilks.req: _queryDispatch,
+                   Ilks.vcp: _telDispatch,
+                   Ilks.vrt: _telDispatch,
+                   Ilks.iss: _telDispatch,
+                   Ilks.rev: _telDispatch,
+                   Ilks.bis: _telDispatch,
+                   Ilks.brv: _telDispatch}
@@ -23,6 +23,7 @@ import os
 import stat
 import shutil
 import tempfile
+from collections import namedtuple
 from contextlib import contextmanager
 from dataclasses import dataclass, asdict
 
@@ -43,6 +44,13 @@ class HabitatRecord:
     prefix: str
 
 
+# escrowed event data at one dgKey(pre, dig) as read by Baser.getEscrowBundle
+# dts, evt, and pde are bytes or None, sigs and wigs are lists of bytes
+# stale is True when dts is stale per the stale callable given the read
+EscrowBundle = namedtuple("EscrowBundle", "dts evt sigs wigs pde stale",
+                          defaults=(False, ))
+
+
 def openDB(name="test", **kwa):
     """
     Returns contextmanager generated by openLMDB but with Baser instance as default
@@ -560,6 +568,85 @@ class Baser(dbing.LMDBer):
         return self.delVal(self.evts, key)
 
 
+    def getEscrowBundle(self, dgkey, stale=None, wigs=True, pde=True):
+        """
+        Use dgKey()
+        Returns EscrowBundle of escrowed event datetime, event, signatures,
+        witness signatures, and delegating event couple at dgkey all read in
+        one read transaction instead of one per sub db.
+        Fields are copied to bytes so they remain valid after the transaction.
+        Same values as getDts, getEvt, getSigs, getWigs, and getPde
+
+        When stale is provided and the datetime is missing or stale then only
+        the datetime is read so an escrow about to be removed does not pay for
+        reading and copying its event and signatures. The returned .stale is
+        True only when the datetime is present and stale.
+
+        Parameters:
+            dgkey is bytes dgKey(pre, dig) of escrowed event
+            stale is optional callable of datetime bytes that returns True
+                when escrow is stale
+            wigs is Boolean True means read witness signatures
+                False means skip read for escrows that never use them
+            pde is Boolean True means read delegating event couple
+                False means skip read for escrows that never use it
+        """
+        with self.env.begin(write=False, buffers=True) as txn:
+            dts = txn.get(dgkey, db=self.dtss)
+            if dts is not None:
+                dts = bytes(dts)
+            if stale is not None and (dts is None or stale(dts)):
+                return EscrowBundle(dts=dts, evt=None, sigs=[], wigs=[], pde=None,
+                                    stale=dts is not None)
+            evt = txn.get(dgkey, db=self.evts)
+            pde = txn.get(dgkey, db=self.pdes) if pde else None
+            sigs = []
+            cursor = txn.cursor(db=self.sigs)
+            if cursor.set_key(dgkey):  # moves to first_dup
+                sigs = [bytes(sig) for sig in cursor.iternext_dup()]
+            if wigs:
+                wigs = []
+                cursor = txn.cursor(db=self.wigs)
+                if cursor.set_key(dgkey):  # moves to first_dup
+                    wigs = [bytes(wig) for wig in cursor.iternext_dup()]
+            else:
+                wigs = []
+            return EscrowBundle(dts=dts,
+                                evt=bytes(evt) if evt is not None else None,
+                                sigs=sigs,
+                                wigs=wigs,
+                                pde=bytes(pde) if pde is not None else None)
+
+
+    def putEscrowedEvt(self, db, dgkey, snkey, dig, dts, sigs, raw, pde=None):
+        """
+        Write escrowed event with its datetime, signatures, and optional
+        delegating event couple at dgkey and add its dig to escrow index db at
+        snkey all in one write transaction instead of one per sub db.
+        Same semantics as putDts, putSigs, putEvt, putPde, and addIoVal on db
+        Returns True If dig added to escrow index Else False if already there
+
+        Parameters:
+            db is insertion ordered escrow index sub db such as .ooes or .ldes
+            dgkey is bytes dgKey(pre, dig) of escrowed event
+            snkey is bytes snKey(pre, sn) of escrowed event
+            dig is bytes qb64b digest of escrowed event
+            dts is bytes ISO-8601 datetime of escrow
+            sigs is list of bytes qb64b indexed signatures of escrowed event
+            raw is bytes serialized escrowed event
+            pde is optional bytes couple seqner.qb64b + diger.qb64b of
+                delegating event seal source
+        """
+        with self.env.begin(write=True, buffers=True) as txn:
+            txn.put(dgkey, dts, overwrite=False, db=self.dtss)
+            for sig in sigs:
+                txn.put(dgkey, sig, dupdata=True, db=self.sigs)
+            txn.put(dgkey, raw, overwrite=False, db=self.evts)
+            if pde is not None:
+                txn.put(dgkey, pde, overwrite=False, db=self.pdes)
+            return self.putIoValsTxn(txn, db, snkey, [dig])
+
+
     def putFe(self, key, val):
         """
         Use fnKey()
@@ -834,6 +921,14 @@ class Baser(dbing.LMDBer):
         return self.addVal(self.wigs, key, val)
 
 
+    def hasWig(self, key, val):
+        """
+        Use dgKey()
+        Return True if indexed witness signature val is at key, False otherwise
+        """
+        return self.hasVal(self.wigs, key, val)
+
+
     def cntWigs(self, key):
         """
         Use dgKey()
@@ -899,6 +994,14 @@ class Baser(dbing.LMDBer):
         return self.getValsIter(self.rcts, key)
 
 
+    def hasRct(self, key, val):
+        """
+        Use dgKey()
+        Return True if receipt couple val is at key, False otherwise
+        """
+        return self.hasVal(self.rcts, key, val)
+
+
     def cntRcts(self, key):
         """
         Use dgKey()
@@ -1005,6 +1108,19 @@ class Baser(dbing.LMDBer):
         return self.getIoItemsNextIter(self.ures, key, skip)
 
 
+    def getUreItemsBatchIter(self, limit=256):
+        """
+        Use snKey()
+        Return iterator of lists of at most limit unverified receipt triple items
+        at all keys.
+        Items is (key, val) where proem has already been stripped from val
+        val is triple edig+spre+cig
+        Items are in key order with duplicates in insertion order.
+        Raises StopIteration Error when empty.
+        """
+        return self.getIoItemsBatchIter(self.ures, limit=limit)
+
+
     def cntUres(self, key):
         """
         Use snKey()
@@ -1036,6 +1152,19 @@ class Baser(dbing.LMDBer):
         return self.delIoVal(self.ures, key, val)
 
 
+    def delUreItems(self, items):
+        """
+        Use snKey()
+        Deletes dup val at key for each (key, val) in items in one transaction.
+        Returns int count of dups deleted
+
+        Parameters:
+            items is iterable of (key, val) where val is dup val (does not
+                include insertion ordering proem)
+        """
+        return self.delIoValItems(self.ures, items)
+
+
     def putVrcs(self, key, vals):
         """
         Use dgKey()
@@ -1083,6 +1212,14 @@ class Baser(dbing.LMDBer):
         return self.getValsIter(self.vrcs, key)
 
 
+    def hasVrc(self, key, val):
+        """
+        Use dgKey()
+        Return True if receipt quadruple val is at key, False otherwise
+        """
+        return self.hasVal(self.vrcs, key, val)
+
+
     def cntVrcs(self, key):
         """
         Use dgKey()
@@ -1188,6 +1325,19 @@ class Baser(dbing.LMDBer):
         return self.getIoItemsNextIter(self.vres, key, skip)
 
 
+    def getVreItemsBatchIter(self, limit=256):
+        """
+        Use snKey()
+        Return iterator of lists of at most limit unverified transferable receipt quintuple items
+        at all keys.
+        Items is (key, val) where proem has already been stripped from val
+        val is quintuple edig+spre+ssnu+sdig+sig
+        Items are in key order with duplicates in insertion order.
+        Raises StopIteration Error when empty.
+        """
+        return self.getIoItemsBatchIter(self.vres, limit=limit)
+
+
     def cntVres(self, key):
         """
         Use snKey()
@@ -1219,6 +1369,19 @@ class Baser(dbing.LMDBer):
         return self.delIoVal(self.vres, key, val)
 
 
+    def delVreItems(self, items):
+        """
+        Use snKey()
+        Deletes dup val at key for each (key, val) in items in one transaction.
+        Returns int count of dups deleted
+
+        Parameters:
+            items is iterable of (key, val) where val is dup val (does not
+                include insertion ordering proem)
+        """
+        return self.delIoValItems(self.vres, items)
+
+
     def putKes(self, key, vals):
         """
         Use snKey()
@@ -1261,6 +1424,16 @@ class Baser(dbing.LMDBer):
         return self.getIoValLast(self.kels, key)
 
 
+    def getKeLasts(self, keys):
+        """
+        Use snKey()
+        Return dict of last inserted dup key event dig val at each key in keys
+        keyed by key. Val is None if no entry at key.
+        Reads all keys in one transaction.
+        """
+        return self.getIoValLasts(self.kels, keys)
+
+
     def cntKes(self, key):
         """
         Use snKey()
@@ -1399,6 +1572,18 @@ class Baser(dbing.LMDBer):
         return self.getIoItemsNextIter(self.pses, key, skip)
 
 
+    def getPseItemsBatchIter(self, limit=256):
+        """
+        Use snKey()
+        Return iterator of lists of at most limit partial signed escrowed event dig items
+        at all keys.
+        Items is (key, val) where proem has already been stripped from val
+        Items are in key order with duplicates in insertion order.
+        Raises StopIteration Error when empty.
+        """
+        return self.getIoItemsBatchIter(self.pses, limit=limit)
+
+
     def cntPses(self, key):
         """
         Use snKey()
@@ -1430,6 +1615,19 @@ class Baser(dbing.LMDBer):
         return self.delIoVal(self.pses, key, val)
 
 
+    def delPseItems(self, items):
+        """
+        Use snKey()
+        Deletes dup val at key for each (key, val) in items in one transaction.
+        Returns int count of dups deleted
+
+        Parameters:
+            items is iterable of (key, val) where val is dup val (does not
+                include insertion ordering proem)
+        """
+        return self.delIoValItems(self.pses, items)
+
+
     def putPde(self, key, val):
         """
         Use dgKey()
@@ -1547,6 +1745,18 @@ class Baser(dbing.LMDBer):
         return self.getIoItemsNextIter(self.pwes, key, skip)
 
 
+    def getPweItemsBatchIter(self, limit=256):
+        """
+        Use snKey()
+        Return iterator of lists of at most limit partial witnessed escrowed event dig items
+        at all keys.
+        Items is (key, val) where proem has already been stripped from val
+        Items are in key order with duplicates in insertion order.
+        Raises StopIteration Error when empty.
+        """
+        return self.getIoItemsBatchIter(self.pwes, limit=limit)
+
+
     def cntPwes(self, key):
         """
         Use snKey()
@@ -1578,6 +1788,19 @@ class Baser(dbing.LMDBer):
         return self.delIoVal(self.pwes, key, val)
 
 
+    def delPweItems(self, items):
+        """
+        Use snKey()
+        Deletes dup val at key for each (key, val) in items in one transaction.
+        Returns int count of dups deleted
+
+        Parameters:
+            items is iterable of (key, val) where val is dup val (does not
+                include insertion ordering proem)
+        """
+        return self.delIoValItems(self.pwes, items)
+
+
     def putUwes(self, key, vals):
         """
         Use snKey()
@@ -1665,6 +1888,19 @@ class Baser(dbing.LMDBer):
         return self.getIoItemsNextIter(self.uwes, key, skip)
 
 
+    def getUweItemsBatchIter(self, limit=256):
+        """
+        Use snKey()
+        Return iterator of lists of at most limit unverified witness receipt couple items
+        at all keys.
+        Items is (key, val) where proem has already been stripped from val
+        val is couple edig+wig
+        Items are in key order with duplicates in insertion order.
+        Raises StopIteration Error when empty.
+        """
+        return self.getIoItemsBatchIter(self.uwes, limit=limit)
+
+
     def cntUwes(self, key):
         """
         Use snKey()
@@ -1696,6 +1932,19 @@ class Baser(dbing.LMDBer):
         return self.delIoVal(self.uwes, key, val)
 
 
+    def delUweItems(self, items):
+        """
+        Use snKey()
+        Deletes dup val at key for each (key, val) in items in one transaction.
+        Returns int count of dups deleted
+
+        Parameters:
+            items is iterable of (key, val) where val is dup val (does not
+                include insertion ordering proem)
+        """
+        return self.delIoValItems(self.uwes, items)
+
+
     def putOoes(self, key, vals):
         """
         Use snKey()
@@ -1764,6 +2013,18 @@ class Baser(dbing.LMDBer):
         return self.getIoItemsNextIter(self.ooes, key, skip)
 
 
+    def getOoeItemsBatchIter(self, limit=256):
+        """
+        Use snKey()
+        Return iterator of lists of at most limit out of order escrowed event dig items
+        at all keys.
+        Items is (key, val) where proem has already been stripped from val
+        Items are in key order with duplicates in insertion order.
+        Raises StopIteration Error when empty.
+        """
+        return self.getIoItemsBatchIter(self.ooes, limit=limit)
+
+
     def cntOoes(self, key):
         """
         Use snKey()
@@ -1796,6 +2057,19 @@ class Baser(dbing.LMDBer):
         return self.delIoVal(self.ooes, key, val)
 
 
+    def delOoeItems(self, items):
+        """
+        Use snKey()
+        Deletes dup val at key for each (key, val) in items in one transaction.
+        Returns int count of dups deleted
+
+        Parameters:
+            items is iterable of (key, val) where val is dup val (does not
+                include insertion ordering proem)
+        """
+        return self.delIoValItems(self.ooes, items)
+
+
     def putDes(self, key, vals):
         """
         Use snKey()
@@ -1945,6 +2219,18 @@ class Baser(dbing.LMDBer):
         return self.getIoItemsNextIter(self.ldes, key, skip)
 
 
+    def getLdeItemsBatchIter(self, limit=256):
+        """
+        Use snKey()
+        Return iterator of lists of at most limit likely duplicitous escrowed event dig items
+        at all keys.
+        Items is (key, val) where proem has already been stripped from val
+        Items are in key order with duplicates in insertion order.
+        Raises StopIteration Error when empty.
+        """
+        return self.getIoItemsBatchIter(self.ldes, limit=limit)
+
+
     def cntLdes(self, key):
         """
         Use snKey()
@@ -1977,6 +2263,19 @@ class Baser(dbing.LMDBer):
         return self.delIoVal(self.ldes, key, val)
 
 
+    def delLdeItems(self, items):
+        """
+        Use snKey()
+        Deletes dup val at key for each (key, val) in items in one transaction.
+        Returns int count of dups deleted
+
+        Parameters:
+            items is iterable of (key, val) where val is dup val (does not
+                include insertion ordering proem)
+        """
+        return self.delIoValItems(self.ldes, items)
+
+
 
 class BaserDoer(doing.Doer):
     """
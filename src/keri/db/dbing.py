@@ -749,6 +749,21 @@ class LMDBer:
             return count
 
 
+    def hasVal(self, db, key, val):
+        """
+        Return True if val is a dup value at key in db, False otherwise
+        Probes with one cursor seek instead of reading all dups at key.
+
+        Parameters:
+            db is opened named sub db with dupsort=True
+            key is bytes of key within sub db's keyspace
+            val is bytes of value to look for
+        """
+        with self.env.begin(db=db, write=False, buffers=True) as txn:
+            cursor = txn.cursor()
+            return cursor.set_key_dup(key, val)
+
+
     def cntValsAllPre(self, db, pre, on=0):
         """
         Returns (int): count of of all vals with same pre in key but different
@@ -816,21 +831,44 @@ class LMDBer:
             vals is list of bytes of values to be written
         """
 
-        result = False
-        dups = set(self.getIoVals(db, key))  #get preexisting dups if any
         with self.env.begin(db=db, write=True, buffers=True) as txn:
-            idx = 0
-            cursor = txn.cursor()
-            if cursor.set_key(key): # move to key if any
-                if cursor.last_dup(): # move to last dup
-                    idx = 1 + int(bytes(cursor.value()[:32]), 16)  # get last index as int
+            return self.putIoValsTxn(txn, db, key, vals)
 
-            for val in vals:
-                if val not in dups:
-                    val = (b'%032x.' % (idx)) +  val  # prepend ordering proem
-                    txn.put(key, val, dupdata=True)
-                    idx += 1
-                    result = True
+
+    def putIoValsTxn(self, txn, db, key, vals):
+        """
+        Write each entry from list of bytes vals to key in db in insertion order
+        within already open write transaction txn so that caller may combine
+        it with writes to other sub dbs in one transaction.
+        Returns True If at least one of vals is added as dup, False otherwise
+        Assumes DB opened with dupsort=True
+
+        See putIoVals for ordering proem and duplicate handling.
+
+        Parameters:
+            txn is open write transaction on .env
+            db is opened named sub db with dupsort=True
+            key is bytes of key within sub db's keyspace
+            vals is list of bytes of values to be written
+        """
+        result = False
+        dups = set()
+        idx = 0
+        cursor = txn.cursor(db=db)
+        if cursor.set_key(key):  # move to key if any
+            last = None
+            for val in cursor.iternext_dup():  # get preexisting dups if any
+                dups.add(bytes(val[33:]))  # slice off prepended ordering proem
+                last = val
+            idx = 1 + int(bytes(last[:32]), 16)  # get last index as int
+
+        for val in vals:
+            if val not in dups:
+                dups.add(val)  # so repeated val in vals is not added twice
+                val = (b'%032x.' % (idx)) +  val  # prepend ordering proem
+                txn.put(key, val, dupdata=True, db=db)
+                idx += 1
+                result = True
         return result
 
 
@@ -912,6 +950,35 @@ class LMDBer:
             return val
 
 
+    def getIoValLasts(self, db, keys):
+        """
+        Return dict of last added dup value at each key in keys in insertion
+        order keyed by key. Value is None when no entry at key.
+        Removes prepended proem ordinal from each val before returning.
+        Vals are copied to bytes so they remain valid after the read txn.
+
+        Uses one read transaction and cursor for all keys instead of one per
+        key as with repeated calls to getIoValLast. Keys in sorted order keep
+        each cursor seek near the previous one.
+
+        Assumes DB opened with dupsort=True
+
+        Parameters:
+            db is opened named sub db with dupsort=True
+            keys is iterable of bytes keys within sub db's keyspace
+        """
+        vals = {}
+        with self.env.begin(db=db, write=False, buffers=True) as txn:
+            cursor = txn.cursor()
+            for key in keys:
+                val = None
+                if cursor.set_key(key):  # move to first_dup
+                    if cursor.last_dup():  # move to last_dup
+                        val = bytes(cursor.value()[33:])  # slice off proem
+                vals[key] = val
+        return vals
+
+
     def getIoItemsNext(self, db, key=b"", skip=True):
         """
         Return list of all dup items at next key after key in db in insertion order.
@@ -978,6 +1045,51 @@ class LMDBer:
                         yield (key, val[33:]) # slice off prepended ordering prefix
 
 
+    def getIoItemsBatchIter(self, db, limit=256):
+        """
+        Return iterator of lists of at most limit dup items at all keys in db
+        in key order with the dups at each key in insertion order.
+        Item is (key, val) with proem stripped from val stored in db.
+        Raises StopIteration Error when no remaining dup items = empty.
+
+        Each batch is read in its own read transaction and copied to bytes so
+        the caller may delete items from db between batches. The walk resumes
+        after the last item read by seeking to its key and proemed value with
+        set_range so memory is bounded by limit not by the size of db.
+
+        Assumes DB opened with dupsort=True
+
+        Parameters:
+            db is opened named sub db with dupsort=True
+            limit is int max number of items in each batch
+        """
+        key = val = b""  # last item read with proem, empty before first batch
+        while True:
+            items = []
+            with self.env.begin(db=db, write=False, buffers=True) as txn:
+                cursor = txn.cursor()
+                if not key:  # first batch
+                    found = cursor.first()
+                elif cursor.set_range_dup(key, val):  # at or after last item
+                    # skip last item unless deleted since read
+                    found = cursor.value() != val or cursor.next()
+                elif cursor.set_range(key):  # no later dups at key
+                    found = cursor.key() != key or cursor.next_nodup()
+                else:
+                    found = False
+                if found:
+                    for key, val in cursor.iternext():
+                        key, val = bytes(key), bytes(val)
+                        items.append((key, val[33:]))  # slice off proem
+                        if len(items) >= limit:
+                            break
+            if not items:
+                return
+            yield items
+            if len(items) < limit:  # walked off end of db
+                return
+
+
     def cntIoVals(self, db, key):
         """
         Return count of dup values at key in db, or zero otherwise
@@ -1049,6 +1161,33 @@ class LMDBer:
         return False
 
 
+    def delIoValItems(self, db, items):
+        """
+        Deletes each dup io val at its key in db for each (key, val) in items
+        all in one write transaction instead of one per item.
+        Performs strip search to find match. See delIoVal
+        Returns int count of dup io vals deleted
+        Assumes DB opened with dupsort=True
+
+        Parameters:
+            db is opened named sub db with dupsort=True
+            items is iterable of (key, val) duples where
+                key is bytes of key within sub db's keyspace
+                val is bytes of value to be deleted without insertion ordering proem
+        """
+        count = 0
+        with self.env.begin(db=db, write=True, buffers=True) as txn:
+            cursor = txn.cursor()
+            for key, val in items:
+                if cursor.set_key(key):  # move to first_dup
+                    for proval in cursor.iternext_dup():  #  value with proem
+                        if val == proval[33:]:  #  strip of proem
+                            if cursor.delete():
+                                count += 1
+                            break
+        return count
+
+
     def getIoValsAllPreIter(self, db, pre):
         """
         Returns iterator of all dup vals in insertion order for all entries
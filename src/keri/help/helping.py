@@ -192,6 +192,28 @@ class mdict(MultiDict):
         return [(k, self.nabone(k)) for k in keys]
 
 
+class Lazy:
+    """
+    Lazy defers calling func with args and kwa until str of instance is needed.
+    Use as a logger argument so expensive formatting, such as pretty JSON of
+    an event, only happens when the log record is actually emitted.
+
+    Attributes:
+        func (Callable): returns value whose str is the str of the instance
+        args (tuple): positional arguments to func
+        kwa (dict): keyword arguments to func
+    """
+    __slots__ = ("func", "args", "kwa")
+
+    def __init__(self, func, *args, **kwa):
+        self.func = func
+        self.args = args
+        self.kwa = kwa
+
+    def __str__(self):
+        return str(self.func(*self.args, **self.kwa))
+
+
 def nonStringIterable(obj):
     """
     Returns True if obj is non-string iterable, False otherwise
@@ -319,6 +341,8 @@ def fromIso8601(dts):
     Assumes TZ aware
     For nanosecond use instead attotime or datatime64 in pandas or numpy
     """
+    if isinstance(dts, memoryview):  # db buffer such as from lmdb
+        dts = bytes(dts)
     if hasattr(dts, "decode"):
         dts = dts.decode("utf-8")
     return (datetime.datetime.fromisoformat(dts))
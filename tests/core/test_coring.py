@@ -241,6 +241,11 @@ def test_matter():
 
     assert Matter.Codex == MtrDex
 
+    # iteration yields code values in field order for inclusion tests
+    assert tuple(MtrDex) == dataclasses.astuple(MtrDex)
+    assert 'A' in MtrDex
+    assert 'Z' not in MtrDex
+
     # first character of code with hard size of code
     assert Matter.Sizes == {
         'A': 1, 'B': 1, 'C': 1, 'D': 1, 'E': 1, 'F': 1, 'G': 1, 'H': 1, 'I': 1,
@@ -307,6 +312,12 @@ def test_matter():
         ckey = b64ToB2(skey)
         assert Matter.Bizes[ckey] == sval
 
+    # Hards maps int of first byte of code with hard size of code
+    assert len(Matter.Hards) == 256
+    for skey, sval in Matter.Sizes.items():
+        assert Matter.Hards[ord(skey)] == sval
+    assert Matter.Hards[ord('-')] is None
+
     # verkey,  sigkey = pysodium.crypto_sign_keypair()
     verkey = b'iN\x89Gi\xe6\xc3&~\x8bG|%\x90(L\xd6G\xddB\xef`\x07\xd2T\xfc\xe1\xcd.\x9b\xe4#'
     prefix = 'BaU6JR2nmwyZ-i0d8JZAoTNZH3ULvYAfSVPzhzS6b5CM'  #  str
@@ -379,6 +390,7 @@ def test_matter():
     assert matter.raw == verkey
     assert matter.qb64 == prefix
     assert matter.qb64b == prefix.encode("utf-8")
+    assert matter.fullSize == len(matter.qb64b)
 
     # test truncates extra bytes from raw parameter
     longverkey = verkey + bytes([10, 11, 12])  # extra bytes
@@ -438,6 +450,7 @@ def test_matter():
     assert matter.code == MtrDex.Ed25519_Sig
     assert matter.qb64 == qsig64
     assert matter.qb64b == qsig64b
+    assert matter.fullSize == len(qsig64b)
     assert matter.qb2 == qsigB2
     assert matter.transferable == True
     assert matter.digestive == False
@@ -734,6 +747,13 @@ def test_matter():
     assert matter.transferable == False
     assert matter.digestive == False
     assert ims == extra   # stripped not include extra
+
+    # test qb64b memoized
+    matter = Matter(raw=verkey)
+    qb64b = matter.qb64b
+    assert qb64b == prefixb
+    assert matter.qb64b is qb64b
+    assert matter.qb64 == prefix
     """ Done Test """
 
 
@@ -793,6 +813,12 @@ def test_indexer():
         ckey = b64ToB2(skey)
         assert Indexer.Bizes[ckey] == sval
 
+    # Hards maps int of first byte of code with hard size of code
+    assert len(Indexer.Hards) == 256
+    for skey, sval in Indexer.Sizes.items():
+        assert Indexer.Hards[ord(skey)] == sval
+    assert Indexer.Hards[ord('-')] is None
+
 
     with pytest.raises(EmptyMaterialError):
         indexer = Indexer()
@@ -1027,6 +1053,13 @@ def test_indexer():
     assert indexer.qb64b == qsig64b
     assert indexer.qb2 == qsig2b
     assert ims == extra
+
+    # test qb64b memoized
+    indexer = Indexer(raw=sig, index=5)
+    qb64b = indexer.qb64b
+    assert qb64b == qsig64b
+    assert indexer.qb64b is qb64b
+    assert indexer.qb64 == qsig64
     """ Done Test """
 
 
@@ -1484,9 +1517,11 @@ def test_seqner():
     snqb2 = b'\xd0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00P'
 
     number = Seqner(qb64b=snqb64b)
+    assert number._sn is None  # not converted until first access
     assert number.raw == snraw
     assert number.code == MtrDex.Salt_128
     assert number.sn == 5
+    assert number._sn == 5  # memoized
     assert number.snh == '5'
     assert number.qb64 == snqb64
     assert number.qb64b == snqb64b
@@ -2783,6 +2818,12 @@ def test_serder():
     assert evt2.size == evt1.size
     assert evt2.version == vers2
 
+    # memoryview such as from lmdb
+    evt2 = Serder(raw=memoryview(evt1.raw))
+    assert isinstance(evt2.raw, bytes)
+    assert evt2.raw == evt1.raw
+    assert evt2.ked == evt1.ked
+
     # use kind setter property
     assert evt2.kind == Serials.cbor
     evt2.kind = Serials.json
@@ -2820,6 +2861,9 @@ def test_serder():
     assert srdr.compare(dig=diger0.qb64)
     assert srdr.compare(dig=diger1.qb64b)
     assert srdr.compare(dig=diger2.qb64)
+    assert srdr.compare(dig=srdr.dig)  # own dig matches without rehash
+    assert srdr.compare(dig=srdr.digb)
+    assert srdr.compare(dig=memoryview(srdr.digb))
 
     ser1 = b'ABCDEFGHIJKLMNOPQSTUVWXYXZabcdefghijklmnopqrstuvwxyz0123456789'
 
@@ -2827,6 +2871,30 @@ def test_serder():
     assert not srdr.compare(dig=Diger(ser=ser1).qb64)  # codes match
     assert not srdr.compare(diger=Diger(ser=ser1, code=MtrDex.SHA3_256)) # codes not match
     assert not srdr.compare(dig=Diger(ser=ser1, code=MtrDex.SHA2_256).qb64b)     # codes not match
+
+    # test memoized digb preb and sn are reset when ked is set
+    ked = dict(v=Versify(kind=Serials.json, size=0), i="ABCDEFG", s="1", t="rot")
+    srdr = Serder(ked=ked)
+    digb = srdr.digb
+    assert srdr.digb is digb  # memoized
+    assert srdr.dig == digb.decode("utf-8")
+    assert srdr.preb == b"ABCDEFG"
+    assert srdr.sn == 1
+    ked = dict(srdr.ked)
+    ked["i"] = "HIJKLMN"
+    ked["s"] = "2"
+    srdr.ked = ked
+    assert srdr.digb != digb
+    assert srdr.digb == srdr.diger.qb64b
+    assert srdr.preb == b"HIJKLMN"
+    assert srdr.sn == 2
+
+    # test diger is computed on first access
+    srdr = Serder(raw=srdr.raw)
+    assert srdr._diger is None
+    assert srdr.diger.verify(ser=srdr.raw)
+    assert srdr.diger is srdr.diger  # memoized
+    assert srdr.verfers is srdr.verfers  # memoized
     """Done Test """
 
 
@@ -22,7 +22,7 @@ from keri.core.coring import Salter, Serder, Siger, Cigar
 from keri.core.coring import Ilks
 
 from keri.core.eventing import (TraitDex, LastEstLoc, Serials, Versify,
-                                simple,  ample)
+                                simple,  ample, staleIso8601)
 from keri.core.eventing import (deWitnessCouple, deReceiptCouple, deSourceCouple,
                                 deReceiptTriple,
                                 deTransReceiptQuadruple, deTransReceiptQuintuple)
@@ -38,6 +38,7 @@ from keri.db.basing import openDB
 from keri.app.keeping import openKS, Manager
 
 from keri import help
+from keri.help import helping
 
 logger = help.ogler.getLogger()
 
@@ -141,6 +142,26 @@ def test_ample():
 
 
 
+def test_staleiso8601():
+    """
+    Test staleIso8601 utility function
+    """
+    dtsb = b'2021-01-01T00:00:00.500000+00:00'
+    assert staleIso8601(b'2021-01-01T00:00:00.499999+00:00', dtsb)
+    assert not staleIso8601(b'2021-01-01T00:00:00.500000+00:00', dtsb)
+    assert not staleIso8601(memoryview(b'2021-01-01T00:00:01.000000+00:00'), dtsb)
+    # mismatched formats fall back to parsing
+    assert staleIso8601(b'2021-01-01T00:00:00+00:00', dtsb)
+    assert not staleIso8601(b'2021-01-01T01:00:01.000000+01:00', dtsb)
+    assert staleIso8601(b'2021-01-01T00:59:00.000000+01:00', dtsb)
+
+    # per escrow pass predicate with boundary timeout seconds before now
+    stale = Kevery._staler(3600)
+    assert stale(dtsb)
+    assert not stale(helping.nowIso8601().encode("utf-8"))
+    """End Test"""
+
+
 def test_dewitnesscouple():
     """
     test deWitnessCouple function
@@ -2200,6 +2221,42 @@ def test_kevery():
         db_digs = [bytes(val).decode("utf-8") for val in kevery.db.getKelIter(pre)]
         assert db_digs == event_digs
 
+        # test memoized fetch of db events by dig
+        kevery._serders.clear()
+        eserder = kevery.fetchSerder(pre=pre, dig=event_digs[2])
+        assert eserder.dig == event_digs[2]
+        assert kevery.fetchSerder(pre=pre.encode("utf-8"),
+                                  dig=event_digs[2].encode("utf-8")) is eserder
+        assert kevery.fetchSerder(pre=pre, dig=signers[0].verfer.qb64) is None
+        assert kevery.fetchEstEvent(pre, 4).dig == event_digs[2]
+        assert len(kevery._serders) == 3  # evts 2, 3 and 4
+
+        assert kevery.validateSN(dict(s="1f")) == 31
+        with pytest.raises(ValidationError):
+            kevery.validateSN(dict(s="-1"))
+        with pytest.raises(ValidationError):
+            kevery.validateSN(dict(s="g"))
+        with pytest.raises(ValidationError):
+            kevery.validateSN(dict(s="1" * 33))
+
+        kevery.SerderCacheSize = 2
+        kevery.fetchSerder(pre=pre, dig=event_digs[0])
+        assert list(kevery._serders) == [dgKey(pre, event_digs[2]),
+                                         dgKey(pre, event_digs[0])]
+        # memoized parse of raw already in hand such as escrowed event raw
+        key = dgKey(pre, event_digs[1])
+        mserder = kevery.memoSerder(key, kevery.db.getEvt(key))
+        assert mserder.dig == event_digs[1]
+        assert kevery.memoSerder(key, b'') is mserder  # raw not reparsed
+        assert kevery.fetchSerder(pre=pre, dig=event_digs[1]) is mserder
+
+        # memoized decode of escrowed sigs
+        sigs = [signer.sign(b'abc', index=i).qb64b for i, signer in enumerate(signers[:2])]
+        msigers = kevery.memoSigers(sigs)
+        assert [siger.qb64b for siger in msigers] == sigs
+        assert kevery.memoSigers(list(sigs)) is msigers
+        assert kevery.memoSigers(sigs[:1]) is not msigers
+
 
     assert not os.path.exists(kevery.db.path)
     assert not os.path.exists(kever.baser.path)
@@ -2928,6 +2985,43 @@ def test_receipt():
 
     """ Done Test """
 
+def test_unverified_witness_receipt_missing_event():
+    """
+    Test unverified witness receipt escrow removes receipt when its receipted
+    event is gone from .evts even though its Serder is still memoized
+    """
+    salt = Salter(raw=b'0123456789abcdef')
+    signer = salt.signer(path="ctl", temp=True)  # controller transferable
+    wesSigner = salt.signer(path="wes", transferable=False, temp=True)  # witness
+
+    serder = incept(keys=[signer.verfer.qb64], wits=[wesSigner.verfer.qb64])
+    pre = serder.pre
+    dgkey = dgKey(pre, serder.dig)
+    snkey = snKey(pre, serder.sn)
+
+    with openDB(name="ctl") as db:
+        kvy = Kevery(db=db)
+        # event in partial witness escrow and memoized
+        db.putEvt(dgkey, serder.raw)
+        db.addPwe(snkey, serder.digb)
+        assert kvy.memoSerder(dgkey, db.getEvt(dgkey)).dig == serder.dig
+
+        wiger = wesSigner.sign(serder.raw, index=0)
+        rserder = receipt(pre=pre, sn=serder.sn, dig=serder.dig)
+        kvy.escrowUWReceipt(serder=rserder, wigers=[wiger], dig=serder.dig)
+        assert len(db.getUwes(snkey)) == 1
+
+        db.delEvt(dgkey)  # event gone but Serder still memoized
+        assert dgkey in kvy._serders
+        kvy.processEscrowUnverWitness()
+        assert db.getWigs(dgkey) == []  # receipt not written from memo
+        assert db.getUwes(snkey) == []  # escrow removed
+
+    assert not os.path.exists(db.path)
+
+    """End Test"""
+
+
 def test_direct_mode():
     """
     Test direct mode with transferable validator event receipts
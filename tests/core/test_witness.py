@@ -98,6 +98,11 @@ def test_witness():
         for werfer in camHab.iserder.werfers:
             assert werfer.qb64 in wits
         assert camHab.kever.wits == wits
+        assert [camHab.kever.witIndex(wit) for wit in wits] == [0, 1, 2]
+        assert camHab.kever.witIndex(camHab.pre) is None
+        werfers = camHab.kever.werfers
+        assert [werfer.qb64 for werfer in werfers] == wits
+        assert camHab.kever.werfers is werfers  # memoized
         assert camHab.kever.toad == 2
         assert camHab.kever.sn == 0
 
@@ -386,6 +386,8 @@ def test_baser():
         assert db.putWigs(key, vals=[b"z", b"m", b"x", b"a"]) == True
         assert db.getWigs(key) == [b'a', b'm', b'x', b'z']
         assert db.cntWigs(key) == 4
+        assert db.hasWig(key, b'm') == True
+        assert db.hasWig(key, b'b') == False
         assert db.putWigs(key, vals=[b'a']) == True   # duplicate but True
         assert db.getWigs(key) == [b'a', b'm', b'x', b'z']
         assert db.addWig(key, b'a') == False   # duplicate
@@ -423,6 +425,8 @@ def test_baser():
         assert db.putRcts(key, vals=[b"z", b"m", b"x", b"a"]) == True
         assert db.getRcts(key) == [b'a', b'm', b'x', b'z']
         assert db.cntRcts(key) == 4
+        assert db.hasRct(key, b'm') == True
+        assert db.hasRct(key, b'b') == False
         assert db.putRcts(key, vals=[b'a']) == True   # duplicate
         assert db.getRcts(key) == [b'a', b'm', b'x', b'z']
         assert db.addRct(key, b'a') == False   # duplicate
@@ -547,6 +551,14 @@ def test_baser():
         assert items == []  # empty
         assert not items
 
+        # Test getUreItemsBatchIter(limit=4)
+        batches = list(db.getUreItemsBatchIter(limit=4))
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        items = [item for batch in batches for item in batch]
+        assert [key for key, val in items] == ([aKey] * 3 + [bKey] * 3 +
+                                               [cKey] * 2 + [dKey] * 2)
+        assert [val for key, val in items] == aVals + bVals + cVals + dVals
+
         # Test getUreItemsNextIter(key=b"")
         #  get dups at first key in database
         # aVals
@@ -630,6 +642,8 @@ def test_baser():
         assert db.putVrcs(key, vals=[b"z", b"m", b"x", b"a"]) == True
         assert db.getVrcs(key) == [b'a', b'm', b'x', b'z']
         assert db.cntVrcs(key) == 4
+        assert db.hasVrc(key, b'm') == True
+        assert db.hasVrc(key, b'b') == False
         assert db.putVrcs(key, vals=[b'a']) == True   # duplicate
         assert db.getVrcs(key) == [b'a', b'm', b'x', b'z']
         assert db.addVrc(key, b'a') == False   # duplicate
@@ -755,6 +769,14 @@ def test_baser():
         assert items == []  # empty
         assert not items
 
+        # Test getVreItemsBatchIter(limit=4)
+        batches = list(db.getVreItemsBatchIter(limit=4))
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        items = [item for batch in batches for item in batch]
+        assert [key for key, val in items] == ([aKey] * 3 + [bKey] * 3 +
+                                               [cKey] * 2 + [dKey] * 2)
+        assert [val for key, val in items] == aVals + bVals + cVals + dVals
+
         # Test getVreItemsNextIter(key=b"")
         #  get dups at first key in database
         # aVals
@@ -836,6 +858,8 @@ def test_baser():
         assert db.getKes(key) == vals  # preserved insertion order
         assert db.cntKes(key) == len(vals) == 4
         assert db.getKeLast(key) == vals[-1]
+        assert db.getKeLasts([key, snKey(preb, 1)]) == {key: vals[-1],
+                                                         snKey(preb, 1): None}
         assert db.putKes(key, vals=[b'a']) == False   # duplicate
         assert db.getKes(key) == vals  #  no change
         assert db.addKe(key, b'a') == False   # duplicate
@@ -940,6 +964,14 @@ def test_baser():
         assert items == []  # empty
         assert not items
 
+        # Test getPseItemsBatchIter(limit=4)
+        batches = list(db.getPseItemsBatchIter(limit=4))
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        items = [item for batch in batches for item in batch]
+        assert [key for key, val in items] == ([aKey] * 3 + [bKey] * 3 +
+                                               [cKey] * 2 + [dKey] * 2)
+        assert [val for key, val in items] == aVals + bVals + cVals + dVals
+
         # Test getPseItemsNextIter(key=b"")
         #  get dups at first key in database
         # aVals
@@ -1128,6 +1160,14 @@ def test_baser():
         assert items == []  # empty
         assert not items
 
+        # Test getPweItemsBatchIter(limit=4)
+        batches = list(db.getPweItemsBatchIter(limit=4))
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        items = [item for batch in batches for item in batch]
+        assert [key for key, val in items] == ([aKey] * 3 + [bKey] * 3 +
+                                               [cKey] * 2 + [dKey] * 2)
+        assert [val for key, val in items] == aVals + bVals + cVals + dVals
+
         # Test getPweItemsNextIter(key=b"")
         #  get dups at first key in database
         # aVals
@@ -1380,6 +1420,54 @@ def test_baser():
         assert db.delOoes(key) == True
         assert db.getOoes(key) == []
 
+        # test putEscrowedEvt writes escrowed event and ooe index in one txn
+        edgkey = dgKey(preb, digb)
+        esnkey = snKey(preb, 3)
+        esigs = [b"sig0", b"sig1"]
+        assert db.putEscrowedEvt(db=db.ooes, dgkey=edgkey, snkey=esnkey,
+                                 dig=digb, dts=b"2021-01-01T00:00:00.000000+00:00",
+                                 sigs=esigs, raw=b"event", pde=b"couple") == True
+        assert bytes(db.getDts(edgkey)) == b"2021-01-01T00:00:00.000000+00:00"
+        assert [bytes(sig) for sig in db.getSigs(edgkey)] == esigs
+        assert bytes(db.getEvt(edgkey)) == b"event"
+        assert bytes(db.getPde(edgkey)) == b"couple"
+        assert db.getOoes(esnkey) == [digb]
+        # idempotent does not overwrite or add dup to index
+        assert db.putEscrowedEvt(db=db.ooes, dgkey=edgkey, snkey=esnkey,
+                                 dig=digb, dts=b"later", sigs=esigs,
+                                 raw=b"other") == False
+        assert bytes(db.getDts(edgkey)) == b"2021-01-01T00:00:00.000000+00:00"
+        assert bytes(db.getEvt(edgkey)) == b"event"
+        assert db.getOoes(esnkey) == [digb]
+
+        # test getEscrowBundle reads all escrowed data in one txn
+        bundle = db.getEscrowBundle(edgkey)
+        assert bundle == basing.EscrowBundle(dts=b"2021-01-01T00:00:00.000000+00:00",
+                                             evt=b"event", sigs=esigs, wigs=[],
+                                             pde=b"couple")
+        assert db.putWigs(edgkey, [b"wig0"]) == True
+        assert db.getEscrowBundle(edgkey).wigs == [b"wig0"]
+        assert db.getEscrowBundle(edgkey, wigs=False, pde=False) == basing.EscrowBundle(
+            dts=b"2021-01-01T00:00:00.000000+00:00", evt=b"event", sigs=esigs,
+            wigs=[], pde=None)
+        assert db.delWigs(edgkey) == True
+        assert db.getEscrowBundle(dgKey(preb, b"nodig")) == basing.EscrowBundle(
+            dts=None, evt=None, sigs=[], wigs=[], pde=None)
+        # stale escrow reads only its datetime
+        assert db.getEscrowBundle(edgkey, stale=lambda dts: True) == basing.EscrowBundle(
+            dts=b"2021-01-01T00:00:00.000000+00:00", evt=None, sigs=[], wigs=[],
+            pde=None, stale=True)
+        assert db.getEscrowBundle(edgkey, stale=lambda dts: False) == bundle
+        assert not bundle.stale
+        # missing datetime is not stale
+        assert not db.getEscrowBundle(dgKey(preb, b"nodig"), stale=lambda dts: True).stale
+
+        assert db.delOoes(esnkey) == True
+        assert db.delEvt(edgkey) == True
+        assert db.delSigs(edgkey) == True
+        assert db.delDts(edgkey) == True
+        assert db.delPde(edgkey) == True
+
         # Setup Tests for getOoeItemsNext and getOoeItemsNextIter
         aKey = snKey(pre=b'A', sn=1)
         aVals = [b"z", b"m", b"x"]
@@ -1454,6 +1542,14 @@ def test_baser():
         assert items == []  # empty
         assert not items
 
+        # Test getOoeItemsBatchIter(limit=4)
+        batches = list(db.getOoeItemsBatchIter(limit=4))
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        items = [item for batch in batches for item in batch]
+        assert [key for key, val in items] == ([aKey] * 3 + [bKey] * 3 +
+                                               [cKey] * 2 + [dKey] * 2)
+        assert [val for key, val in items] == aVals + bVals + cVals + dVals
+
         # Test getOoeItemsNextIter(key=b"")
         #  get dups at first key in database
         # aVals
@@ -1634,6 +1730,14 @@ def test_baser():
         assert items == []  # empty
         assert not items
 
+        # Test getLdeItemsBatchIter(limit=4)
+        batches = list(db.getLdeItemsBatchIter(limit=4))
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        items = [item for batch in batches for item in batch]
+        assert [key for key, val in items] == ([aKey] * 3 + [bKey] * 3 +
+                                               [cKey] * 2 + [dKey] * 2)
+        assert [val for key, val in items] == aVals + bVals + cVals + dVals
+
         # Test getLdeItemsNextIter(key=b"")
         #  get dups at first key in database
         # aVals
@@ -41,6 +41,8 @@ def test_key_funcs():
 
     assert splitKey(snKey(pre, sn)) == (pre, b'%032x' % sn)
     assert splitKeySN(snKey(pre, sn)) == (pre, sn)
+    assert splitKeySN(memoryview(snKey(pre, sn))) == (pre, sn)
+    assert splitKeySN(bytearray(snKey(pre, sn))) == (pre, sn)
 
     assert dgKey(pre, dig) == (b'BWzwEHHzq7K0gzQPYGGwTmuupUhPx5_yZ-Wk1x4ejhcc'
                                          b'.EGAPkzNZMtX-QiVgbRbyAIZGoXvbGv9IPb0foWTZvI_4')
@@ -383,6 +385,9 @@ def test_lmdber():
         assert dber.putVals(db, key, vals) == True
         assert dber.getVals(db, key) == [b'a', b'm', b'x', b'z']  #  lexocographic order
         assert dber.cntVals(db, key) == len(vals) == 4
+        assert dber.hasVal(db, key, b'm') == True
+        assert dber.hasVal(db, key, b'b') == False
+        assert dber.hasVal(db, b'B', b'm') == False
         assert dber.putVals(db, key, vals=[b'a']) == True   # duplicate
         assert dber.getVals(db, key) == [b'a', b'm', b'x', b'z']  #  no change
         assert dber.addVal(db, key, val=b'a') == False  # duplicate
@@ -414,6 +419,7 @@ def test_lmdber():
         assert dber.getIoVals(db, key) == vals  # preserved insertion order
         assert dber.cntIoVals(db, key) == len(vals) == 4
         assert dber.getIoValLast(db, key) == vals[-1]
+        assert dber.getIoValLasts(db, [key, b'B']) == {key: vals[-1], b'B': None}
         assert dber.putIoVals(db, key, vals=[b'a']) == False   # duplicate
         assert dber.getIoVals(db, key) == vals  #  no change
         assert dber.addIoVal(db, key, val=b'b') == True
@@ -437,6 +443,19 @@ def test_lmdber():
         assert dber.delIoVal(db, key, vals[0])
         assert dber.addIoVal(db, key, b'e')
         assert dber.getIoVals(db, key) == [b'm', b'a', b'w', b'e']
+        assert dber.putIoVals(db, key, vals=[b'k', b'a', b'k']) == True  # dups in vals
+        assert dber.getIoVals(db, key) == [b'm', b'a', b'w', b'e', b'k']
+        assert dber.delIoVal(db, key, b'k')
+        # delete several dups at several keys in one transaction
+        okey = snKey(pre, 7)
+        assert dber.putIoVals(db, okey, vals=[b'q', b'r']) == True
+        assert dber.delIoValItems(db, [(key, b'a'), (okey, b'r'), (key, b'e'),
+                                       (key, b'nope'), (b'nokey', b'q')]) == 3
+        assert dber.getIoVals(db, key) == [b'm', b'w']
+        assert dber.getIoVals(db, okey) == [b'q']
+        assert dber.delIoVals(db, okey) == True
+        assert dber.putIoVals(db, key, vals=[b'a', b'e']) == True
+        assert dber.getIoVals(db, key) == [b'm', b'w', b'a', b'e']
 
         # Test getIoValsAllPreIter(self, db, pre)
         vals0 = [b"gamma", b"beta"]
@@ -578,6 +597,36 @@ def test_lmdber():
         assert items == []  # empty
         assert not items
 
+        # Test getIoItemsBatchIter(self, db, limit=256)
+        batches = list(dber.getIoItemsBatchIter(edb))
+        assert len(batches) == 1
+        items = batches[0]
+        assert [key for key, val in items] == ([aKey] * 3 + [bKey] * 3 +
+                                               [cKey] * 2 + [dKey] * 2)
+        assert [val for key, val in items] == aVals + bVals + cVals + dVals
+        # copied so valid after txn closes
+        assert all(isinstance(key, bytes) and isinstance(val, bytes) for key, val in items)
+        assert list(dber.getIoItemsBatchIter(dber.env.open_db(key=b'empty.', dupsort=True))) == []
+
+        # bounded batches split dups at a key and resume after last item read
+        batches = list(dber.getIoItemsBatchIter(edb, limit=4))
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        assert [item for batch in batches for item in batch] == items
+        batches = list(dber.getIoItemsBatchIter(edb, limit=5))  # ends on full batch
+        assert [len(batch) for batch in batches] == [5, 5]
+
+        # deleting read items between batches does not disturb the walk
+        for limit in (3, 4):  # batch ends at end of key dups or within them
+            walked = []
+            for batch in dber.getIoItemsBatchIter(edb, limit=limit):
+                walked.extend(batch)
+                for key, val in batch:
+                    assert dber.delIoVal(edb, key, val)
+            assert walked == items
+            assert list(dber.getIoItemsBatchIter(edb)) == []
+            for key, vals in ((aKey, aVals), (bKey, bVals), (cKey, cVals), (dKey, dVals)):
+                assert dber.putIoVals(edb, key, vals)
+
         # Test getIoItemsNextIter(self, db, key=b"")
         #  get dups at first key in database
         # aVals
@@ -129,6 +129,27 @@ def test_mdict():
 
     """End Test"""
 
+
+def test_lazy():
+    """
+    Test Lazy deferred str formatting
+    """
+    calls = []
+
+    def pretty(d, indent=None):
+        calls.append(d)
+        return "{} {}".format(d, indent)
+
+    lazy = helping.Lazy(pretty, dict(a=1), indent=1)
+    assert not calls  # not called until str
+    assert str(lazy) == "{'a': 1} 1"
+    assert "%s" % lazy == "{'a': 1} 1"
+    assert calls == [dict(a=1), dict(a=1)]
+
+    assert str(helping.Lazy(bytes, 3)) == str(bytes(3))
+    """End Test"""
+
+
 def test_extractvalues():
     """
     Test function extractValues
@@ -220,6 +241,9 @@ def test_iso8601():
     dts1 = helping.toIso8601(dt)
     assert dts1 == dts
 
+    # test memoryview such as from lmdb
+    assert helping.fromIso8601(memoryview(dts.encode("utf-8"))) == dt
+
 
 
     """ End Test """